@@ -0,0 +1,499 @@
+"""Benchmark the grading hot paths.
+
+Each benchmark grades synthetic submissions (see `submissions.py`) or
+exercises one of the library's hot paths directly.  Wall time, per-stage time
+and peak traced memory are reported and compared against the stored baselines
+in `baseline.json`.  Stage times are inclusive, so nested stages (e.g. a
+`call_obj` inside a reference test) overlap.
+
+Usage:
+
+    python benchmarks/run.py                  # run all and compare
+    python benchmarks/run.py --only get_values custom_stack
+    python benchmarks/run.py --save           # overwrite the stored baselines
+"""
+
+import argparse
+import inspect
+import itertools
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import unittest
+from contextlib import contextmanager
+from pathlib import Path
+
+from submissions import SUBMISSIONS
+
+BASELINE_FILE = Path(__file__).with_name("baseline.json")
+
+BENCHMARKS = {}
+
+
+def benchmark(name, requires=()):
+    """Register a benchmark.
+
+    The decorated function does the (untimed) setup and returns a tuple of the
+    callable to time and a list of `(owner, attribute, stage)` probes.
+    """
+
+    def decorator(func):
+        BENCHMARKS[name] = {"setup": func, "requires": requires}
+        return func
+
+    return decorator
+
+
+def missing_requirements(requires):
+    """Return the unmet requirements of a benchmark."""
+    missing = []
+    if "display" in requires and not os.environ.get("DISPLAY"):
+        missing.append("display")
+    return missing
+
+
+@contextmanager
+def stage_probes(probes, timings):
+    """Temporarily wrap callables so the time spent in them is charged to a
+    stage in `timings`.
+    """
+
+    def timed(func, stage):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings[stage] = timings.get(stage, 0.0) + (time.perf_counter() - start)
+
+        return wrapper
+
+    restore = []
+    for owner, attr, stage in probes:
+        original = inspect.getattr_static(owner, attr)
+        local = attr in vars(owner)
+        if isinstance(original, classmethod):
+            replacement = classmethod(timed(original.__func__, stage))
+        elif isinstance(original, staticmethod):
+            replacement = staticmethod(timed(original.__func__, stage))
+        else:
+            replacement = timed(original, stage)
+        setattr(owner, attr, replacement)
+        restore.append((owner, attr, original, local))
+    try:
+        yield
+    finally:
+        for owner, attr, original, local in reversed(restore):
+            if local:
+                setattr(owner, attr, original)
+            else:
+                delattr(owner, attr)
+
+
+def run_test_class(test_class):
+    """Run all tests in a built test class and make sure they passed."""
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_class)
+    result = unittest.TestResult()
+    suite.run(result)
+    if not result.wasSuccessful():
+        problems = result.failures + result.errors
+        raise RuntimeError(f"Benchmark test failed:\n{problems[0][1]}")
+
+
+def measure(run, probes, repeat):
+    """Time `run` and return a result dictionary."""
+    run()  # Warm up caches and imports.
+
+    times, stages = [], {}
+    with stage_probes(probes, stages):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "best_ms": min(times) * 1e3,
+        "median_ms": statistics.median(times) * 1e3,
+        "peak_kib": peak / 1024,
+        "stages_ms": {k: v / repeat * 1e3 for k, v in sorted(stages.items())},
+    }
+
+
+def compare(results, baselines, threshold):
+    """Return a list of regression descriptions."""
+    regressions = []
+    for name, result in results.items():
+        base = baselines.get(name)
+        if not base or "best_ms" not in result:
+            continue
+        for key in ("best_ms", "peak_kib"):
+            # Ignore tiny absolute values where noise dominates.
+            floor = 1.0 if key == "best_ms" else 64.0
+            if result[key] > threshold * max(base[key], floor):
+                regressions.append(
+                    f"{name}: {key} {result[key]:.1f} > {threshold} x {base[key]:.1f}"
+                )
+    return regressions
+
+
+def report(results, baselines):
+    """Print a results table."""
+    header = f"{'benchmark':<28}{'best ms':>10}{'median ms':>11}{'peak KiB':>11}{'base ms':>10}{'ratio':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        if "skipped" in result:
+            print(f"{name:<28}  skipped (missing {', '.join(result['skipped'])})")
+            continue
+        base = baselines.get(name, {}).get("best_ms")
+        ratio = f"{result['best_ms'] / base:.2f}" if base else "-"
+        base_str = f"{base:.2f}" if base else "-"
+        print(
+            f"{name:<28}{result['best_ms']:>10.2f}{result['median_ms']:>11.2f}"
+            f"{result['peak_kib']:>11.1f}{base_str:>10}{ratio:>8}"
+        )
+        for stage, ms in result["stages_ms"].items():
+            print(f"    {stage:<24}{ms:>10.2f}")
+
+
+# Imports from the package are deferred until after the scratch directory is
+# set up so the benchmarks never touch the working tree.
+def register_benchmarks():
+    from PIL import Image, ImageDraw
+
+    from generic_grader.function import (
+        function_return_values_match_reference,
+        random_func_return_range,
+        random_function_calls,
+    )
+    from generic_grader.image import pixel_overlap, plot_prop_matches_reference
+    from generic_grader.output import (
+        output_lines_match_reference,
+        output_values_match_reference,
+    )
+    from generic_grader.utils import array_diff, plot, turtle_canvas
+    from generic_grader.utils.importer import Importer
+    from generic_grader.utils.options import Options
+    from generic_grader.utils.patches import (
+        custom_stack,
+        make_pyplot_noop_patches,
+        make_turtle_done_patches,
+    )
+    from generic_grader.utils.safe_equal import safe_assert_equal
+    from generic_grader.utils.user import RefUser, SubUser, __User__
+
+    user_stages = [
+        (Importer, "import_obj", "import"),
+        (RefUser, "call_obj", "reference run"),
+        (SubUser, "call_obj", "student run"),
+        (__User__, "format_log", "format log"),
+    ]
+
+    def options(module, **kwargs):
+        return Options(ref_module=module, sub_module=module, **kwargs)
+
+    class FakeTest(unittest.TestCase):
+        pass
+
+    @benchmark("import (text assignment)")
+    def bench_import():
+        # Import the modules a text-only assignment uses in a fresh interpreter.
+        modules = [
+            "generic_grader.function.function_return_values_match_reference",
+            "generic_grader.output.output_lines_match_reference",
+            "generic_grader.output.output_values_match_reference",
+            "generic_grader.style.docstring",
+        ]
+        code = f"import {', '.join(modules)}"
+
+        def run():
+            subprocess.run([sys.executable, "-c", code], check=True)
+
+        return run, []
+
+    @benchmark("custom_stack")
+    def bench_custom_stack():
+        modules = ["heavy_output", "plot_squares"]
+        o = Options(
+            patches=make_turtle_done_patches(modules)
+            + make_pyplot_noop_patches(modules)
+        )
+
+        def run():
+            for _ in range(200):
+                with custom_stack(o):
+                    pass
+
+        return run, []
+
+    @benchmark("custom_stack (fixed_time)")
+    def bench_custom_stack_fixed_time():
+        o = options("many_calls", fixed_time="2021-01-01T00:00:00")
+
+        def run():
+            for _ in range(200):
+                with custom_stack(o):
+                    pass
+
+        return run, []
+
+    @benchmark("Importer.import_obj")
+    def bench_import_obj():
+        test, o = FakeTest(), Options(obj_name="add")
+
+        def run():
+            for _ in range(200):
+                Importer.import_obj(test, "many_calls", o)
+
+        return run, []
+
+    @benchmark("LogIO.write")
+    def bench_log_write():
+        def run():
+            log = __User__.LogIO(log_limit=10**8)
+            for i in range(20_000):
+                log.write(f"line {i}\n")
+
+        return run, []
+
+    @benchmark("get_values")
+    def bench_get_values():
+        user = SubUser(FakeTest(), options("many_values"))
+        user.call_obj()
+        line = user.read_log_line()
+
+        def run():
+            for _ in range(200):
+                user.get_values(line)
+
+        return run, []
+
+    @benchmark("safe_assert_equal")
+    def bench_safe_assert_equal():
+        test = FakeTest()
+        small = list(range(100))
+        large = list(range(100_000))
+
+        def run():
+            for _ in range(50):
+                safe_assert_equal(test, small, list(small))
+            safe_assert_equal(test, large, list(large))
+
+        return run, []
+
+    @benchmark("build (large args)")
+    def bench_build_large_args():
+        # Expand 50 tests whose arguments are long lists.
+        data = list(range(20_000))
+        the_options = [Options(obj_name="total", args=(data, i)) for i in range(50)]
+
+        def run():
+            function_return_values_match_reference.build(the_options)
+
+        return run, []
+
+    @benchmark("save_canvas", requires=("display",))
+    def bench_save_canvas():
+        import turtle
+
+        turtle.setup(564, 564)
+        turtle.tracer(0)
+        for i in range(200):
+            turtle.forward(i)
+            turtle.left(91)
+        turtle.update()
+
+        def run():
+            turtle_canvas.save_canvas(turtle.getcanvas(), "canvas.png")
+
+        return run, []
+
+    @benchmark("pixel_overlap")
+    def bench_pixel_overlap():
+        size = (564, 564)
+        a = Image.new("1", size, 255)
+        b = Image.new("1", size, 0)
+        ImageDraw.Draw(b).rectangle((0, 0, size[0] // 2 - 1, size[1]), fill=255)
+        a.save("overlap_a.png")
+        b.save("overlap_b.png")
+        test_class = pixel_overlap.build(
+            Options(
+                ref_image="overlap_a.png",
+                sub_image="overlap_b.png",
+                mode="exactly",
+                threshold=size[0] // 2 * size[1],
+            )
+        )
+        return (lambda: run_test_class(test_class)), []
+
+    @benchmark("random_func_return_range")
+    def bench_random_range():
+        test_class = random_func_return_range.build(
+            options("random_range", obj_name="roll", expected_set=set(range(1, 7)))
+        )
+        return (lambda: run_test_class(test_class)), user_stages
+
+    @benchmark("random_function_calls")
+    def bench_random_calls():
+        funcs = [f"random_calls.{name}" for name in ("first", "second", "third")]
+        test_class = random_function_calls.build(
+            options(
+                "random_calls",
+                random_func_calls=funcs,
+                expected_perms=set(itertools.permutations(funcs)),
+            )
+        )
+        return (lambda: run_test_class(test_class)), user_stages
+
+    @benchmark("random_function_calls (4 workers)")
+    def bench_random_calls_parallel():
+        funcs = [f"random_calls.{name}" for name in ("first", "second", "third")]
+        test_class = random_function_calls.build(
+            options(
+                "random_calls",
+                random_func_calls=funcs,
+                expected_perms=set(itertools.permutations(funcs)),
+                n_workers=4,
+            )
+        )
+        return (lambda: run_test_class(test_class)), user_stages
+
+    @benchmark("heavy_output")
+    def bench_heavy_output():
+        module = output_lines_match_reference
+        test_class = module.build(options("heavy_output"))
+        stages = user_stages + [(module, "safe_assert_equal", "compare")]
+        return (lambda: run_test_class(test_class)), stages
+
+    @benchmark("heavy_output (ratio)")
+    def bench_heavy_output_ratio():
+        module = output_lines_match_reference
+        o = Options(
+            ref_module="heavy_output", sub_module="heavy_output_typos", ratio=0.9
+        )
+        return (lambda: run_test_class(module.build(o))), user_stages
+
+    @benchmark("many_values")
+    def bench_many_values():
+        module = output_values_match_reference
+        test_class = module.build(options("many_values"))
+        stages = user_stages + [(module, "safe_assert_equal", "compare")]
+        return (lambda: run_test_class(test_class)), stages
+
+    @benchmark("many_calls")
+    def bench_many_calls():
+        module = function_return_values_match_reference
+        test_class = module.build(
+            [options("many_calls", obj_name="add", args=(i, i)) for i in range(100)]
+        )
+        stages = user_stages + [(module, "safe_assert_equal", "compare")]
+        return (lambda: run_test_class(test_class)), stages
+
+    @benchmark("large_arrays")
+    def bench_large_arrays():
+        module = function_return_values_match_reference
+        test_class = module.build(options("large_arrays"))
+        stages = user_stages + [(array_diff, "array_compare", "compare")]
+        return (lambda: run_test_class(test_class)), stages
+
+    @benchmark("plot")
+    def bench_plot():
+        module = plot_prop_matches_reference
+        test_class = module.build(options("plot_squares", prop="y data"))
+        stages = user_stages + [(plot, "get_property", "get property")]
+        return (lambda: run_test_class(test_class)), stages
+
+    @benchmark("turtle_drawing", requires=("display",))
+    def bench_turtle():
+        o = options("turtle_spiral")
+
+        class TurtleTest(unittest.TestCase):
+            def test_turtle(self):
+                for name in ("sol.png", "sol_inv.png"):
+                    if os.path.exists(name):
+                        os.remove(name)
+                turtle_canvas.save_sub_canvas(self, o)
+
+        return (lambda: run_test_class(TurtleTest)), user_stages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", help="only run these benchmarks")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="ratio over the baseline that counts as a regression",
+    )
+    parser.add_argument("--save", action="store_true", help="save new baselines")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    baselines = {}
+    if BASELINE_FILE.exists():
+        baselines = json.loads(BASELINE_FILE.read_text())
+
+    results = {}
+    old_dir, old_path = os.getcwd(), sys.path.copy()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        sys.path.insert(0, "")
+        try:
+            for module, source in SUBMISSIONS.items():
+                Path(f"{module}.py").write_text(source)
+            register_benchmarks()
+
+            for name, bench in BENCHMARKS.items():
+                if args.only and name not in args.only:
+                    continue
+                missing = missing_requirements(bench["requires"])
+                if missing:
+                    results[name] = {"skipped": missing}
+                    continue
+                run, probes = bench["setup"]()
+                results[name] = measure(run, probes, args.repeat)
+        finally:
+            os.chdir(old_dir)
+            sys.path[:] = old_path
+
+    report(results, baselines)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.save:
+        baselines.update(
+            {
+                name: {k: round(v, 3) for k, v in result.items() if k != "stages_ms"}
+                for name, result in results.items()
+                if "skipped" not in result
+            }
+        )
+        BASELINE_FILE.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"\nSaved baselines to {BASELINE_FILE}.")
+        return 0
+
+    regressions = compare(results, baselines, args.threshold)
+    if regressions:
+        print("\nRegressions:")
+        print("\n".join(f"  {r}" for r in regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
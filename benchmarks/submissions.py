@@ -0,0 +1,108 @@
+"""Synthetic submissions used by the benchmark suite.
+
+Each entry maps a module name to its source code.  The benchmarks write these
+modules into a scratch directory and grade them as both the reference and the
+submission, so every benchmarked test is expected to pass.
+"""
+
+HEAVY_OUTPUT = """
+def main():
+    for i in range(5000):
+        print(f"Line {i}: the value is {i * 0.5:.2f} and {i ** 2}")
+"""
+
+HEAVY_OUTPUT_TYPOS = """
+def main():
+    for i in range(5000):
+        value = "vaule" if i % 10 == 0 else "value"
+        print(f"Line {i}: the {value} is {i * 0.5:.2f} and {i ** 2}")
+"""
+
+MANY_VALUES = """
+def main():
+    print(", ".join(f"{i * 1.25:,.3f}" for i in range(200)))
+"""
+
+MANY_CALLS = """
+def add(a, b):
+    return a + b
+"""
+
+LARGE_ARRAYS = """
+import numpy as np
+
+
+def main():
+    return np.linspace(0.0, 1.0, 1_000_000)
+"""
+
+PLOT = """
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+
+def main():
+    xs = list(range(2000))
+    plt.plot(xs, [x * x for x in xs])
+    plt.title("Squares")
+"""
+
+TURTLE = """
+import turtle
+
+
+def start():
+    turtle.setup(564, 564)
+
+
+def main():
+    for i in range(200):
+        turtle.forward(i)
+        turtle.left(91)
+"""
+
+RANDOM_RANGE = """
+import random
+
+
+def roll():
+    return random.randint(1, 6)
+"""
+
+RANDOM_CALLS = """
+import random
+
+
+def first():
+    pass
+
+
+def second():
+    pass
+
+
+def third():
+    pass
+
+
+def main():
+    funcs = [first, second, third]
+    random.shuffle(funcs)
+    for func in funcs:
+        func()
+"""
+
+SUBMISSIONS = {
+    "heavy_output": HEAVY_OUTPUT,
+    "heavy_output_typos": HEAVY_OUTPUT_TYPOS,
+    "many_values": MANY_VALUES,
+    "many_calls": MANY_CALLS,
+    "large_arrays": LARGE_ARRAYS,
+    "plot_squares": PLOT,
+    "turtle_spiral": TURTLE,
+    "random_range": RANDOM_RANGE,
+    "random_calls": RANDOM_CALLS,
+}
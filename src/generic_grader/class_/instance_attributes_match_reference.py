@@ -31,6 +31,7 @@ def build(the_options):
         """A class for instance attribute presence tests."""
 
         wrapper = textwrap.TextWrapper(initial_indent="  ", subsequent_indent="  ")
+        run_params = the_params  # Planned by `run_plan.plan_runs`.
 
         @parameterized.expand(the_params, doc_func=doc_func)
         @weighted
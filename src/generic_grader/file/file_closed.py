@@ -7,7 +7,12 @@ import warnings
 from parameterized import parameterized
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper, make_call_str, oxford_list
+from generic_grader.utils.docs import (
+    LazyMessage,
+    get_wrapper,
+    make_call_str,
+    oxford_list,
+)
 from generic_grader.utils.options import options_to_params
 from generic_grader.utils.reference_test import reference_test
 
@@ -48,6 +53,7 @@ def build(the_options):
         """A class for file closing tests."""
 
         wrapper = get_wrapper()
+        run_params = the_params  # Planned by `run_plan.plan_runs`.
 
         @parameterized.expand(the_params, doc_func=doc_func)
         @weighted
@@ -68,15 +74,17 @@ def build(the_options):
             file_list_str = "file " if len(unclosed_files) == 1 else "files "
             file_list_str += oxford_list(unclosed_files)
             call_str = make_call_str(o.obj_name, o.args, o.kwargs)
-            message = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    f"Your `{o.obj_name}` function failed to close the"
-                    f" {file_list_str} when called as `{call_str}`"
-                    + (f" with entries={o.entries}." if o.entries else ".")
-                    + (o.hint if o.hint else "")
+            message = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        f"Your `{o.obj_name}` function failed to close the"
+                        f" {file_list_str} when called as `{call_str}`"
+                        + (f" with entries={o.entries}." if o.entries else ".")
+                        + (o.hint if o.hint else "")
+                    )
+                    + self.student_user.format_log()
                 )
-                + self.student_user.format_log()
             )
 
             self.assertEqual(len(unclosed_files), 0, message)
@@ -5,7 +5,13 @@ import unittest
 from parameterized import parameterized
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper, make_call_str, oxford_list
+from generic_grader.utils.docs import (
+    LazyMessage,
+    get_wrapper,
+    make_call_str,
+    oxford_list,
+)
+from generic_grader.utils.file_compare import count_lines
 from generic_grader.utils.options import options_to_params
 from generic_grader.utils.reference_test import reference_test
 from generic_grader.utils.safe_equal import safe_assert_equal
@@ -39,6 +45,7 @@ def build(options):
         """A class for functionality tests."""
 
         wrapper = get_wrapper()
+        run_params = the_params  # Planned by `run_plan.plan_runs`.
 
         @parameterized.expand(the_params, doc_func=doc_func)
         @weighted
@@ -49,15 +56,8 @@ def build(options):
             o = options
 
             # Get the actual and expected values.
-            ref_files, sub_files = [], []
-            for filename in o.filenames:
-                with open(f"ref_{filename}") as fo:
-                    ref_files.append(fo.read())
-                with open(f"sub_{filename}") as fo:
-                    sub_files.append(fo.read())
-
-            expected = [len(string.splitlines()) for string in ref_files]
-            actual = [len(string.splitlines()) for string in sub_files]
+            expected = [count_lines(f"ref_{filename}") for filename in o.filenames]
+            actual = [count_lines(f"sub_{filename}") for filename in o.filenames]
 
             # Build an error message.
             filenames = [f"`{filename}`" for filename in o.filenames]
@@ -65,16 +65,18 @@ def build(options):
             files_do = file_s + (" does" if len(filenames) == 1 else " do")
             file_list_str = f"{file_s} {oxford_list(filenames)}"
             call_str = make_call_str(o.obj_name, o.args, o.kwargs)
-            message = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    f"Your output {files_do} not have the expected number of lines."
-                    f"  Double check the number of lines written to the {file_list_str}"
-                    f" by your `{o.obj_name}` function when called as `{call_str}`"
-                    + (" with entries={o.entries}." if o.entries else ".")
-                    + (f"  {o.hint}" if o.hint else "")
+            message = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        f"Your output {files_do} not have the expected number of lines."
+                        f"  Double check the number of lines written to the {file_list_str}"
+                        f" by your `{o.obj_name}` function when called as `{call_str}`"
+                        + (" with entries={o.entries}." if o.entries else ".")
+                        + (f"  {o.hint}" if o.hint else "")
+                    )
+                    + self.student_user.format_log()
                 )
-                + self.student_user.format_log()
             )
 
             safe_assert_equal(self, actual, expected, msg=message)
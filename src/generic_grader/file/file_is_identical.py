@@ -5,7 +5,18 @@ import unittest
 from parameterized import parameterized
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper, make_call_str, oxford_list
+from generic_grader.utils.docs import (
+    LazyMessage,
+    get_wrapper,
+    make_call_str,
+    oxford_list,
+)
+from generic_grader.utils.file_compare import (
+    files_are_small,
+    files_identical,
+    format_mismatches,
+    line_mismatches,
+)
 from generic_grader.utils.options import Options, options_to_params
 from generic_grader.utils.reference_test import reference_test
 
@@ -38,6 +49,7 @@ def build(options):
         """A class for functionality tests."""
 
         wrapper = get_wrapper()
+        run_params = the_params  # Planned by `run_plan.plan_runs`.
 
         @parameterized.expand(the_params, doc_func=doc_func)
         @weighted
@@ -53,26 +65,31 @@ def build(options):
                     "  This test requires filenames to be specified."
                 )
 
-            # Get the actual and expected values.
-            ref_files, sub_files = [], []
+            call_str = make_call_str(o.obj_name, o.args, o.kwargs)
             for filename in o.filenames:
-                with open(f"ref_{filename}", "rb") as fo:
-                    ref_files.append(fo.read())
-                with open(f"sub_{filename}", "rb") as fo:
-                    sub_files.append(fo.read())
+                ref_path, sub_path = f"ref_{filename}", f"sub_{filename}"
+                if files_identical(sub_path, ref_path):
+                    continue
 
-            call_str = make_call_str(o.obj_name, o.args, o.kwargs)
-            for ref_file, sub_file, filename in zip(ref_files, sub_files, o.filenames):
                 # Test the result.
-                message = str(
-                    f"\nThe data in `{filename}` does not match the expected data."
-                    f"  Double check the data written to the file {filename}"
-                    f" by your `{o.obj_name}` function when called as `{call_str}`"
-                    + (o.entries and f" with entries={o.entries}." or ".")
-                    + (o.hint and f" {o.hint}" or "")
+                message = LazyMessage(
+                    lambda filename=filename: (
+                        f"\nThe data in `{filename}` does not match the expected data."
+                        f"  Double check the data written to the file {filename}"
+                        f" by your `{o.obj_name}` function when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}." or ".")
+                        + (o.hint and f" {o.hint}" or "")
+                    )
                 )
-                actual = sub_file
-                expected = ref_file
+                if not files_are_small(sub_path, ref_path):
+                    # Only report the first differing lines of large files.
+                    mismatches = line_mismatches(sub_path, ref_path, binary=True)
+                    self.fail(format_mismatches(filename, mismatches) + message)
+
+                with open(ref_path, "rb") as fo:
+                    expected = fo.read()
+                with open(sub_path, "rb") as fo:
+                    actual = fo.read()
 
                 self.assertEqual(actual, expected, msg=message)
             self.set_score(self, options.weight)
@@ -6,9 +6,15 @@ import unittest
 from parameterized import parameterized
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper, make_call_str, oxford_list
+from generic_grader.utils.docs import (
+    LazyMessage,
+    get_wrapper,
+    make_call_str,
+    oxford_list,
+)
 from generic_grader.utils.options import options_to_params
 from generic_grader.utils.reference_test import reference_test
+from generic_grader.utils.rng import no_draws_hint, trial_seeds
 from generic_grader.utils.user import SubUser
 
 
@@ -42,6 +48,7 @@ def build(options):
         """A class for functionality tests."""
 
         wrapper = get_wrapper()
+        run_params = the_params  # Planned by `run_plan.plan_runs`.
 
         @parameterized.expand(the_params, doc_func=doc_func)
         @weighted
@@ -64,8 +71,9 @@ def build(options):
                 with open(f"sub_{filename}") as fo:
                     first_files.append(fo.read())
 
-            # Create new user and re-run the submitted code.
-            self.student_user_2 = SubUser(self, o)
+            # Create new user and re-run the submitted code.  A seeded re-run
+            # gets the next seed, so it is reproducible but still differs.
+            self.student_user_2 = SubUser(self, o.derive(seed=trial_seeds(o.seed)[1]))
             self.student_user_2.call_obj()
             message = ""
             for filename in o.filenames:
@@ -101,17 +109,20 @@ def build(options):
             files_do = file_s + (" does" if len(filenames) == 1 else " do")
             file_list_str = f"{file_s} {oxford_list(filenames)}"
             call_str = make_call_str(o.obj_name, o.args, o.kwargs)
-            message = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    f"Your output {files_do} not appear to be random."
-                    f"  Double check that the values written to the {file_list_str}"
-                    f" by your `{o.obj_name}` function when called as `{call_str}`"
-                    + (o.entries and f" with entries={o.entries}" or "")
-                    + " are random."
-                    + (o.hint and f"  {o.hint}" or "")
+            message = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        f"Your output {files_do} not appear to be random."
+                        f"  Double check that the values written to the {file_list_str}"
+                        f" by your `{o.obj_name}` function when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}" or "")
+                        + " are random."
+                        + no_draws_hint(self.student_user)
+                        + (o.hint and f"  {o.hint}" or "")
+                    )
+                    + self.student_user.format_log()
                 )
-                + self.student_user.format_log()
             )
 
             self.assertNotEqual(first_files, second_files, msg=message)
@@ -5,7 +5,18 @@ import unittest
 from parameterized import parameterized
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper, make_call_str, oxford_list
+from generic_grader.utils.docs import (
+    LazyMessage,
+    get_wrapper,
+    make_call_str,
+    oxford_list,
+)
+from generic_grader.utils.file_compare import (
+    files_are_small,
+    files_identical,
+    format_mismatches,
+    line_mismatches,
+)
 from generic_grader.utils.options import options_to_params
 from generic_grader.utils.reference_test import reference_test
 from generic_grader.utils.safe_equal import safe_assert_equal
@@ -40,6 +51,7 @@ def build(the_options):
         """A class for functionality tests."""
 
         wrapper = get_wrapper()
+        run_params = the_params  # Planned by `run_plan.plan_runs`.
 
         @parameterized.expand(the_params, doc_func=doc_func)
         @weighted
@@ -55,33 +67,48 @@ def build(the_options):
                     "  This test requires filenames to be specified."
                 )
 
-            # Get the actual and expected lines for each file.
-            ref_lines, sub_lines = {}, {}
-            for filename in o.filenames:
-                with open(f"ref_{filename}") as fo:
-                    ref_lines[filename] = fo.read().splitlines()
-                with open(f"sub_{filename}") as fo:
-                    sub_lines[filename] = fo.read().splitlines()
-
             # Build an error message.
             filenames = [f"`{filename}`" for filename in o.filenames]
             file_s = "file" if len(filenames) == 1 else "files"
             file_list_str = f"{file_s} {oxford_list(filenames)}"
             call_str = make_call_str(o.obj_name, o.args, o.kwargs)
-            message = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    f"The lines written to your output {file_s} do not"
-                    " match the expected lines."
-                    f"  Double check the lines written to the {file_list_str}"
-                    f" by your `{o.obj_name}` function when called as `{call_str}`"
-                    + (o.entries and f" with entries={o.entries}." or ".")
-                    + (o.hint and f"  {o.hint}" or "")
+            message = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        f"The lines written to your output {file_s} do not"
+                        " match the expected lines."
+                        f"  Double check the lines written to the {file_list_str}"
+                        f" by your `{o.obj_name}` function when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}." or ".")
+                        + (o.hint and f"  {o.hint}" or "")
+                    )
+                    + self.student_user.format_log()
                 )
-                + self.student_user.format_log()
             )
 
-            safe_assert_equal(self, sub_lines, ref_lines, msg=message)
+            paths = {f: (f"sub_{f}", f"ref_{f}") for f in o.filenames}
+            if all(files_identical(*pair) for pair in paths.values()):
+                pass  # Byte for byte identical files have the same lines.
+            elif files_are_small(*(path for pair in paths.values() for path in pair)):
+                # Get the actual and expected lines for each file.
+                ref_lines, sub_lines = {}, {}
+                for filename, (sub_path, ref_path) in paths.items():
+                    with open(ref_path) as fo:
+                        ref_lines[filename] = fo.read().splitlines()
+                    with open(sub_path) as fo:
+                        sub_lines[filename] = fo.read().splitlines()
+
+                safe_assert_equal(self, sub_lines, ref_lines, msg=message)
+            else:
+                # Stream large files, and report their first differing lines.
+                details = ""
+                for filename, (sub_path, ref_path) in paths.items():
+                    mismatches = line_mismatches(sub_path, ref_path)
+                    if mismatches:
+                        details += format_mismatches(filename, mismatches)
+                if details:
+                    self.fail(details + message)
 
             self.set_score(self, options.weight)
 
@@ -5,7 +5,12 @@ import unittest
 from parameterized import parameterized
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper, make_call_str, oxford_list
+from generic_grader.utils.docs import (
+    LazyMessage,
+    get_wrapper,
+    make_call_str,
+    oxford_list,
+)
 from generic_grader.utils.options import options_to_params
 from generic_grader.utils.reference_test import reference_test
 from generic_grader.utils.safe_equal import safe_assert_equal
@@ -42,6 +47,7 @@ def build(options):
         """A class for functionality tests."""
 
         wrapper = get_wrapper()
+        run_params = the_params  # Planned by `run_plan.plan_runs`.
 
         @parameterized.expand(the_params, doc_func=doc_func)
         @weighted
@@ -64,17 +70,19 @@ def build(options):
             file_s = "file" if len(filenames) == 1 else "files"
             file_list_str = f"{file_s} {oxford_list(filenames)}"
             call_str = make_call_str(o.obj_name, o.args, o.kwargs)
-            message = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    f"The values written to your output {file_s} do not"
-                    " span the expected set of values."
-                    f"  Double check the values written to the {file_list_str}"
-                    f" by your `{o.obj_name}` function when called as `{call_str}`"
-                    + (o.entries and f" with entries={o.entries}." or ".")
-                    + (o.hint and f"  {o.hint}" or "")
+            message = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        f"The values written to your output {file_s} do not"
+                        " span the expected set of values."
+                        f"  Double check the values written to the {file_list_str}"
+                        f" by your `{o.obj_name}` function when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}." or ".")
+                        + (o.hint and f"  {o.hint}" or "")
+                    )
+                    + self.student_user.format_log()
                 )
-                + self.student_user.format_log()
             )
 
             safe_assert_equal(self, sub_sets, ref_sets, msg=message)
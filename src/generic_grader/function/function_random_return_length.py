@@ -5,7 +5,7 @@ import unittest
 from parameterized import parameterized
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper, make_call_str
+from generic_grader.utils.docs import LazyMessage, get_wrapper, make_call_str
 from generic_grader.utils.math_utils import n_trials
 from generic_grader.utils.options import options_to_params
 from generic_grader.utils.safe_equal import safe_assert_equal
@@ -78,17 +78,19 @@ def build(the_options):
                     ) + f"\n\n{self.student_user.format_log()}"
                     self.fail(message)
 
-            message = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    "The lengths of values returned from your"
-                    + f" `{o.sub_module}.{o.obj_name}` function"
-                    + f" when called as `{call_str}`"
-                    + (o.entries and f" with entries={o.entries}" or "")
-                    + " did not match the expected lengths."
-                    + (o.hint and f"  {o.hint}" or "")
+            message = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        "The lengths of values returned from your"
+                        + f" `{o.sub_module}.{o.obj_name}` function"
+                        + f" when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}" or "")
+                        + " did not match the expected lengths."
+                        + (o.hint and f"  {o.hint}" or "")
+                    )
+                    + f"\n\n{self.student_user.format_log()}"
                 )
-                + f"\n\n{self.student_user.format_log()}"
             )
             safe_assert_equal(self, actual_set, o.expected_set, msg=message)
 
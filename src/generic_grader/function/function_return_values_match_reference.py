@@ -1,13 +1,12 @@
 """Test calculation results."""
 
+import sys
 import unittest
 
-import numpy as np
 from parameterized import parameterized
 
-from generic_grader.utils.array_diff import array_compare
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper, make_call_str
+from generic_grader.utils.docs import LazyMessage, get_wrapper, make_call_str
 from generic_grader.utils.options import options_to_params
 from generic_grader.utils.reference_test import reference_test
 from generic_grader.utils.safe_equal import safe_assert_equal
@@ -38,6 +37,7 @@ def build(the_options):
         """A class for functionality tests."""
 
         wrapper = get_wrapper()
+        run_params = the_params  # Planned by `run_plan.plan_runs`.
 
         @parameterized.expand(the_params, doc_func=doc_func)
         @weighted
@@ -52,39 +52,46 @@ def build(the_options):
             expected = self.ref_user.returned_values
 
             call_str = make_call_str(o.obj_name, o.args, o.kwargs)
-            formatted_log = self.student_user.format_log()
             expected_type = type(expected)
 
-            type_msg = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    f"Your `{o.obj_name}` function"
-                    f" returned a(n) {type(actual).__name__},"
-                    f" but a(n) {expected_type.__name__} was expected."
-                    "  Double check the type of the value(s) returned"
-                    f" from your `{o.obj_name}` function when called as `{call_str}`"
-                    + (o.entries and f" with entries={o.entries}." or ".")
-                    + (o.hint and f"  {o.hint}")
+            type_msg = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        f"Your `{o.obj_name}` function"
+                        f" returned a(n) {type(actual).__name__},"
+                        f" but a(n) {expected_type.__name__} was expected."
+                        "  Double check the type of the value(s) returned"
+                        f" from your `{o.obj_name}` function when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}." or ".")
+                        + (o.hint and f"  {o.hint}")
+                    )
+                    + self.student_user.format_log()
                 )
-                + f"{formatted_log}"
             )
 
-            value_msg = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    f"Your `{o.obj_name}` function's return value(s)"
-                    " did not match the expected return value(s)."
-                    "  Double check the value(s) returned"
-                    f" from your `{o.obj_name}` function when called as `{call_str}`"
-                    + (o.entries and f" with entries={o.entries}." or ".")
-                    + (o.hint and f"  {o.hint}")
+            value_msg = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        f"Your `{o.obj_name}` function's return value(s)"
+                        " did not match the expected return value(s)."
+                        "  Double check the value(s) returned"
+                        f" from your `{o.obj_name}` function when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}." or ".")
+                        + (o.hint and f"  {o.hint}")
+                    )
+                    + self.student_user.format_log()
                 )
-                + f"{formatted_log}"
             )
 
             self.assertIsInstance(actual, expected_type, msg=type_msg)
 
-            if isinstance(expected, np.ndarray):
+            # Numpy values can only be returned if numpy is already imported.
+            np = sys.modules.get("numpy")
+            if np is not None and isinstance(expected, np.ndarray):
+                from generic_grader.utils.array_diff import array_compare
+
                 equal, details = array_compare(
                     actual,
                     expected,
@@ -93,7 +100,7 @@ def build(the_options):
                 )
                 if not equal:
                     raise AssertionError(details + value_msg)
-            elif isinstance(expected, np.floating):
+            elif np is not None and isinstance(expected, np.floating):
                 if not np.isclose(
                     actual,
                     expected,
@@ -0,0 +1,129 @@
+"""Test the distribution of values returned by a random function."""
+
+import unittest
+
+from parameterized import parameterized
+
+from generic_grader.utils.decorators import weighted
+from generic_grader.utils.distribution import SequentialChiSquare
+from generic_grader.utils.docs import get_wrapper, make_call_str
+from generic_grader.utils.options import options_to_params
+from generic_grader.utils.user import SubUser
+
+MAX_REPORTED_VALUES = 10
+"""Number of values listed in a failure message."""
+
+
+def doc_func(func, num, param):
+    """Return parameterized docstring when checking the distribution of
+    value(s) returned from a function call.
+    """
+    o = param.args[0]
+
+    call_str = make_call_str(o.obj_name, o.args, o.kwargs)
+    docstring = (
+        "Check the distribution of value(s) returned from your"
+        + f" `{o.sub_module}.{o.obj_name}` function"
+        + f" when called as `{call_str}`"
+        + (o.entries and f" with entries={o.entries}" or "")
+        + " matches the expected distribution."
+    )
+
+    return docstring
+
+
+def format_frequencies(values, counts, probabilities):
+    """Return a table of the observed and expected frequency of each value."""
+    n = sum(counts)
+    rows = [
+        f"  {value!r:>12}  {count / n:9.4f}  {p:9.4f}"
+        for value, count, p in zip(values, counts, probabilities)
+    ]
+    more = "\n  ..." if len(rows) > MAX_REPORTED_VALUES else ""
+    return (
+        f"\n\nFrequencies of the values in {n} calls:\n"
+        + f"  {'value':>12}  {'yours':>9}  {'expected':>9}\n"
+        + "\n".join(rows[:MAX_REPORTED_VALUES])
+        + more
+    )
+
+
+def build(the_options):
+    """Create a class for random function distribution tests."""
+    the_params = options_to_params(the_options)
+
+    class TestRandomFuncReturnDistribution(unittest.TestCase):
+        """A class for checking the distribution of return values from a
+        random function.
+        """
+
+        wrapper = get_wrapper()
+
+        @parameterized.expand(the_params, doc_func=doc_func)
+        @weighted
+        def test_random_func_return_distribution(self, options):
+            """Check that a function's values follow the expected distribution."""
+            import numpy as np
+
+            o = options
+
+            # Run an optional initialization function.
+            if o.init:
+                o.init(self, o)
+
+            # Create the student user.
+            self.student_user = SubUser(self, o)
+            call_str = make_call_str(o.obj_name, o.args, o.kwargs)
+
+            check = SequentialChiSquare(
+                o.expected_distribution, o.random_chance_tolerance, o.effect_size
+            )
+            index = {value: i for i, value in enumerate(check.values)}
+            counts = np.zeros(len(check.values), int)
+
+            # Collect batches of values, doubling the sample until the test
+            # decides.
+            n = 0
+            for look in check.looks:
+                batch = [self.student_user.call_obj() for _ in range(look - n)]
+                n = look
+                bins = np.fromiter((index.get(v, -1) for v in batch), int, len(batch))
+                unexpected = np.flatnonzero(bins < 0)
+                if unexpected.size:
+                    value = batch[unexpected[0]]
+                    self.fail(
+                        "\n\nHint:\n"
+                        + self.wrapper.fill(
+                            f"Your `{o.sub_module}.{o.obj_name}` function"
+                            + f" returned {value!r} when called as `{call_str}`"
+                            + (o.entries and f" with entries={o.entries}" or "")
+                            + ", which is not one of the expected values."
+                            + (o.hint and f"  {o.hint}" or "")
+                        )
+                    )
+                counts += np.bincount(bins, minlength=len(check.values))
+                decision = check.decide(counts)
+                if decision is not None:
+                    break
+
+            if not decision:
+                _, pvalue = check.statistic(counts)
+                self.fail(
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        "The distribution of values returned from your"
+                        + f" `{o.sub_module}.{o.obj_name}` function"
+                        + f" when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}" or "")
+                        + " did not match the expected distribution"
+                        + f" (chi-square p-value {pvalue:.2g})."
+                        + (o.hint and f"  {o.hint}" or "")
+                    )
+                    + format_frequencies(
+                        check.values, counts.tolist(), check.probabilities
+                    )
+                )
+
+            self.set_score(self, o.weight)  # Full credit
+
+    return TestRandomFuncReturnDistribution
@@ -2,13 +2,14 @@
 
 import textwrap
 import unittest
-from math import log10
 
 from parameterized import parameterized
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import make_call_str
+from generic_grader.utils.docs import LazyMessage, make_call_str
+from generic_grader.utils.math_utils import n_trials
 from generic_grader.utils.options import options_to_params
+from generic_grader.utils.rng import trace_outcomes
 from generic_grader.utils.safe_equal import safe_assert_equal
 from generic_grader.utils.user import SubUser
 
@@ -31,37 +32,6 @@ def doc_func(func, num, param):
     return docstring
 
 
-def n_trials(N, tolerance=9):
-    """
-    For a random variable intended to be distributed uniformly over `N` values,
-    return the number of trials necessary to check for extra values with the
-    chance of missing an extra value reduced to 1 in 1x10^tolerance.
-
-    The worst case scenario is an off by one error where the function produces
-    one number it shouldn't.  E.g. returning 100 when asked for a 2 digit
-    number.  The probability p of getting this result is only 1 in 91.  I.e. the
-    probability of not getting the bad result (1-p) is 90/91.
-
-    We want to call the function enough times to ensure the chance we will miss
-    the bad result is very low (e.g. less than 1 in a billion).
-
-        (1-p)^n < 1e-9
-
-    or
-
-        (90/91)^n < 1e-9
-
-    Solving for n,
-
-        n = ceil( 9 / log10( (N+1) / N) )
-
-    For the 2 digit case mentioned above, this results in only 1,876 calls to
-    reduce the probability of missing the extra value to less than 1 in a
-    billion.  For the 3 digit case, we require 18,662 calls.
-    """
-    return int(1 + tolerance / log10((N + 1) / N))
-
-
 def build(the_options):
     the_params = options_to_params(the_options)
 
@@ -84,26 +54,37 @@ def build(the_options):
             # Create the student user.
             self.student_user = SubUser(self, o)
 
-            # Collect the actual set by repeated calls to the function.
-            actual_set = set()
-            trials, max_trials = 0, n_trials(len(o.expected_set))
-            # Stop early if we find extra values
-            while trials < max_trials and (actual_set <= o.expected_set):
+            # Enumerate the values reachable through the function's draws.
+            max_trials = n_trials(len(o.expected_set), o.random_chance_tolerance)
+            actual_set, complete, trials = trace_outcomes(self.student_user, max_trials)
+
+            # Otherwise, collect the rest of the actual set by repeated calls
+            # to the function.  Stop early if we find extra values.  Seeing
+            # every expected value doesn't end the sampling: for a function
+            # with one extra value, that happens before the extra value
+            # appears 1 time in N + 1, so only the full `max_trials` keep the
+            # chance of missing it below 1 in 10**random_chance_tolerance.
+            while (
+                not complete and trials < max_trials and (actual_set <= o.expected_set)
+            ):
                 trials += 1
                 actual_set.add(self.student_user.call_obj())
 
             call_str = make_call_str(o.obj_name, o.args, o.kwargs)
-            message = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    "The range of values returned from your"
-                    + f" `{o.sub_module}.{o.obj_name}` function"
-                    + f" when called as `{call_str}`"
-                    + (o.entries and f" with entries={o.entries}" or "")
-                    + " did not match the expected range."
-                    + (o.hint and f"  {o.hint}" or "")
+            message = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        "The range of values returned from your"
+                        + f" `{o.sub_module}.{o.obj_name}` function"
+                        + f" when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}" or "")
+                        + " did not match the expected range."
+                        + f"  It was called {trials} times."
+                        + (o.hint and f"  {o.hint}" or "")
+                    )
+                    + f"\n\n{self.student_user.format_log()}"
                 )
-                + f"\n\n{self.student_user.format_log()}"
             )
             safe_assert_equal(self, actual_set, o.expected_set, msg=message)
 
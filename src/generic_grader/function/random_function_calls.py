@@ -2,13 +2,14 @@
 
 import unittest
 
-from attrs import evolve
 from parameterized import parameterized
 
 from generic_grader.utils.decorators import weighted
 from generic_grader.utils.docs import make_call_str
 from generic_grader.utils.math_utils import n_trials
 from generic_grader.utils.options import options_to_params
+from generic_grader.utils.parallel import collect_outcomes
+from generic_grader.utils.rng import SeededRandom
 from generic_grader.utils.user import SubUser
 
 
@@ -64,16 +65,33 @@ def build(the_options):
                 for func in o.random_func_calls
             ]
 
-            o = evolve(o, patches=((o.patches or []) + new_patches))
+            o = o.derive(patches=((o.patches or []) + new_patches))
 
             self.student_user = SubUser(self, o)
 
-            # Collect the set by repeated calls to the function
-            actual_perms = set()
-            for _ in range(n_trials(len(o.expected_perms), o.random_chance_tolerance)):
-                self.student_user.call_obj()
-                actual_perms.add(tuple(call_list))
+            def trial():
                 call_list.clear()
+                self.student_user.call_obj()
+                return tuple(call_list)
+
+            def reseed(worker):
+                """Give each worker its own seeded stream."""
+                if o.seed is not None:
+                    self.student_user.rng = SeededRandom(o.seed + worker)
+
+            # Collect the set by repeated calls to the function, shared among
+            # the workers.  Stop early if we find an unexpected permutation.
+            try:
+                actual_perms = collect_outcomes(
+                    trial,
+                    n_trials(len(o.expected_perms), o.random_chance_tolerance),
+                    o.n_workers,
+                    keep_going=lambda perms: perms <= o.expected_perms,
+                    setup=reseed,
+                )
+            except Exception as e:  # Raised again from a worker.
+                self.failureException = type(e)
+                raise
 
             msg = (
                 "It does not appear that your functions are being called randomly.\n"
@@ -1,6 +1,5 @@
 """Test the loop depth of a function."""
 
-import ast
 import unittest
 
 from parameterized import parameterized
@@ -8,7 +7,7 @@ from parameterized import parameterized
 from generic_grader.utils.decorators import weighted
 from generic_grader.utils.docs import make_call_str
 from generic_grader.utils.options import options_to_params
-from generic_grader.utils.static import LoopDepthTracker
+from generic_grader.utils.static import analyze
 
 
 def doc_func(func, num, param):
@@ -40,13 +39,10 @@ def build(the_options):
 
             """Check that loop depth meets requirements."""
 
-            with open(o.sub_module + ".py") as fo:
-                self.tree = ast.parse(fo.read())
+            analysis = analyze(o.sub_module + ".py")
+            self.tree = analysis.tree  # Raise any SyntaxError.
 
-            self.depth_tracker = LoopDepthTracker()
-            self.depth_tracker.visit(self.tree)
-
-            actual = self.depth_tracker.max_depth
+            actual = analysis.summary.max_loop_depth
             expected = o.expected_minimum_depth
 
             if expected > 1:
@@ -3,14 +3,12 @@
 import difflib
 import unittest
 
-import pytesseract
 from parameterized import parameterized
-from PIL import Image
-from rapidfuzz.distance.Levenshtein import normalized_similarity
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper
+from generic_grader.utils.docs import LazyMessage, get_wrapper
 from generic_grader.utils.options import options_to_params
+from generic_grader.utils.similarity import assert_similar
 
 
 def doc_func(func, num, param):
@@ -40,6 +38,9 @@ def build(options):
             reference solution.
             """
 
+            import pytesseract
+            from PIL import Image
+
             o = options
             expected_words = o.expected_words
             # Run an optional initialization function.  This might be used to
@@ -53,20 +54,24 @@ def build(options):
 
             actual_words = [f"{w}\n" for w in actual_words.lower().strip().split()]
             expected_words = [f"{w}\n" for w in expected_words.lower().strip().split()]
-            message = (
-                "\n"
-                + "".join(difflib.ndiff(actual_words, expected_words))
-                + "\n\nHint:\n"
-                + self.wrapper.fill(
-                    "The words found in your solution are not sufficiently similar"
-                    " to the expected words." + (o.hint and f"  {o.hint}" or "")
+            message = LazyMessage(
+                lambda: (
+                    "\n"
+                    + "".join(difflib.ndiff(actual_words, expected_words))
+                    + "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        "The words found in your solution are not sufficiently similar"
+                        " to the expected words." + (o.hint and f"  {o.hint}" or "")
+                    )
                 )
             )
-            ratio = normalized_similarity(
+            assert_similar(
+                self,
                 "".join(actual_words),
                 "".join(expected_words),
+                o.ratio,
+                msg=message,
             )
-            self.assertGreaterEqual(ratio, o.ratio, msg=message)
             self.set_score(self, options.weight)
 
     return OCRWordsMatchReference
@@ -3,8 +3,6 @@
 import unittest
 
 from parameterized import parameterized
-from PIL import Image
-from PIL.ImageChops import logical_and
 
 from generic_grader.utils.decorators import weighted
 from generic_grader.utils.docs import make_call_str
@@ -42,6 +40,8 @@ def build(options):
             """Check if white pixels in black and white images A and B
             overlap the expected amount.
             """
+            from PIL import Image
+            from PIL.ImageChops import logical_and
 
             o = options
 
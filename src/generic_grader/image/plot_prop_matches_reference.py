@@ -2,18 +2,14 @@
 
 import unittest
 
-import matplotlib as mpl
-import numpy as np
-from attrs import evolve
 from parameterized import parameterized
-from rapidfuzz.distance.Levenshtein import normalized_similarity
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper, make_call_str
+from generic_grader.utils.docs import LazyMessage, get_wrapper, make_call_str
 from generic_grader.utils.math_utils import calc_log_limit
 from generic_grader.utils.options import options_to_params
-from generic_grader.utils.plot import get_property
 from generic_grader.utils.safe_equal import safe_assert_equal
+from generic_grader.utils.similarity import assert_similar
 from generic_grader.utils.user import RefUser, SubUser
 
 
@@ -46,6 +42,10 @@ def build(the_options):
         @weighted
         def test_plot_prop_matches_reference(self, options):
             """Check that the properties of a plot match a reference."""
+            import matplotlib as mpl
+            import numpy as np
+
+            from generic_grader.utils.plot import get_property
 
             o = options
 
@@ -63,7 +63,7 @@ def build(the_options):
 
             # Run the submitted code and extract the actual property.
             log_limit = calc_log_limit(self.ref_user.log)
-            student_o = evolve(o, log_limit=log_limit)
+            student_o = o.derive(log_limit=log_limit)
             self.student_user = SubUser(self, student_o)
             self.student_user.call_obj()
             actual = get_property(self, o.prop, o.prop_kwargs)
@@ -71,22 +71,24 @@ def build(the_options):
 
             # Build an error message.
             call_str = make_call_str(o.obj_name, o.args, o.kwargs)
-            message = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    "Your plot did not match the expected plot."
-                    f"  Double check the {o.prop} in the plot produced by"
-                    f" your `{o.obj_name}` function when called as `{call_str}`"
-                    + (o.entries and f" with entries={o.entries}." or ".")
-                    + (
-                        o.ratio < 1
-                        and "  The words found in your solution are not"
-                        " sufficiently similar to the expected words."
-                        or ""
+            message = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        "Your plot did not match the expected plot."
+                        f"  Double check the {o.prop} in the plot produced by"
+                        f" your `{o.obj_name}` function when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}." or ".")
+                        + (
+                            o.ratio < 1
+                            and "  The words found in your solution are not"
+                            " sufficiently similar to the expected words."
+                            or ""
+                        )
+                        + (o.hint and f"  {o.hint}" or "")
                     )
-                    + (o.hint and f"  {o.hint}" or "")
+                    + f"{self.student_user.format_log()}"
                 )
-                + f"{self.student_user.format_log()}"
             )
 
             if o.prop == "xy data":
@@ -99,8 +101,7 @@ def build(the_options):
                 )
                 self.assertAlmostEqual(error, 0, msg=message, delta=0.01)
             elif isinstance(expected, str) and o.ratio < 1:
-                ratio = normalized_similarity(actual, expected)
-                self.assertGreaterEqual(ratio, o.ratio, msg=message)
+                assert_similar(self, actual, expected, o.ratio, msg=message)
             else:
                 safe_assert_equal(self, actual, expected, msg=message)
 
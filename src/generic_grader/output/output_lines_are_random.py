@@ -3,13 +3,13 @@
 import textwrap
 import unittest
 
-from attrs import evolve
 from parameterized import parameterized
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import make_call_str, make_line_range
+from generic_grader.utils.docs import LazyMessage, make_call_str, make_line_range
 from generic_grader.utils.math_utils import calc_log_limit
 from generic_grader.utils.options import options_to_params
+from generic_grader.utils.rng import no_draws_hint, trial_seeds
 from generic_grader.utils.user import RefUser, SubUser
 
 
@@ -55,11 +55,13 @@ def build(the_options):
             self.ref_user.call_obj()
 
             log_limit = calc_log_limit(self.ref_user.log)  # Get log_limit here
-            sub_o = evolve(o, log_limit=log_limit)
+            sub_o = o.derive(log_limit=log_limit)
 
-            # Create student users and run submitted code.
-            self.student_user_1 = SubUser(self, sub_o)
-            self.student_user_2 = SubUser(self, sub_o)
+            # Create student users and run submitted code.  Seeded runs get
+            # different seeds, so they are reproducible but still differ.
+            seed_1, seed_2 = trial_seeds(o.seed)
+            self.student_user_1 = SubUser(self, sub_o.derive(seed=seed_1))
+            self.student_user_2 = SubUser(self, sub_o.derive(seed=seed_2))
 
             self.student_user_1.call_obj()
             self.student_user_2.call_obj()
@@ -72,17 +74,20 @@ def build(the_options):
             line_range = make_line_range(o.start, o.n_lines)
             call_str = make_call_str(o.obj_name, o.args, o.kwargs)
 
-            message = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    "Your output does not appear to be random."
-                    f"  Double check that the output on {line_range}"
-                    f" of your `{o.obj_name}` function when called as `{call_str}`"
-                    + (o.entries and f" with entries={o.entries}" or "")
-                    + " is random."
-                    + (o.hint and f"  {o.hint}" or "")
+            message = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        "Your output does not appear to be random."
+                        f"  Double check that the output on {line_range}"
+                        f" of your `{o.obj_name}` function when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}" or "")
+                        + " is random."
+                        + no_draws_hint(self.student_user_1)
+                        + (o.hint and f"  {o.hint}" or "")
+                    )
+                    + self.student_user_1.format_log(o.start)
                 )
-                + f"{self.student_user_1.format_log()}"
             )
 
             self.assertNotEqual(first, second, msg=message)
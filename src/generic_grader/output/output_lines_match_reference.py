@@ -3,13 +3,18 @@
 import unittest
 
 from parameterized import parameterized
-from rapidfuzz.distance.Levenshtein import normalized_similarity
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper, make_call_str, make_line_range
+from generic_grader.utils.docs import (
+    LazyMessage,
+    get_wrapper,
+    make_call_str,
+    make_line_range,
+)
 from generic_grader.utils.options import options_to_params
 from generic_grader.utils.reference_test import reference_test
 from generic_grader.utils.safe_equal import make_diff, safe_assert_equal
+from generic_grader.utils.similarity import assert_similar, line_report
 
 
 def doc_func(func, num, param):
@@ -29,6 +34,17 @@ def doc_func(func, num, param):
     return docstring
 
 
+def first_difference(actual, expected, start=1):
+    """Return the log line number of the first line that differs between the
+    `actual` and `expected` output, which starts at line `start`.
+    """
+    lines = zip(actual.splitlines(), expected.splitlines())
+    n = next((i for i, (a, e) in enumerate(lines) if a != e), None)
+    if n is None:  # One is a prefix of the other.
+        n = min(actual.count("\n"), expected.count("\n"))
+    return (start or 1) + n
+
+
 def build(the_options):
     """Create a class for output line tests."""
 
@@ -38,6 +54,7 @@ def build(the_options):
         """A class for formatting tests."""
 
         wrapper = get_wrapper()
+        run_params = the_params  # Planned by `run_plan.plan_runs`.
 
         @parameterized.expand(the_params, doc_func=doc_func)
         @weighted
@@ -55,40 +72,47 @@ def build(the_options):
             call_str = make_call_str(o.obj_name, o.args, o.kwargs)
 
             if o.ratio < 1:
-                # Use rapidfuzz for partial matching (avoids O(n²) difflib
-                # in the ratio calculation).
-                similarity = normalized_similarity(actual, expected)
-
-                diff = make_diff(actual, expected)
-
-                message = (
-                    ("\n" + diff if diff else "")
-                    + "\n\nHint:\n"
-                    + self.wrapper.fill(
-                        "Your output is not sufficiently similar to the"
-                        " expected output."
-                        f"  Double check the formatting of output {line_range}"
-                        f" of your `{o.obj_name}` function when called as"
-                        f" `{call_str}`"
-                        + (o.entries and f" with entries={o.entries}." or ".")
-                        + (o.hint and f"  {o.hint}" or "")
+
+                def similarity_message():
+                    """Build the message (diff included) only on failure."""
+                    diff = make_diff(actual, expected)
+                    return (
+                        ("\n" + diff if diff else "")
+                        + line_report(actual, expected, o.ratio)
+                        + "\n\nHint:\n"
+                        + self.wrapper.fill(
+                            "Your output is not sufficiently similar to the"
+                            " expected output."
+                            f"  Double check the formatting of output {line_range}"
+                            f" of your `{o.obj_name}` function when called as"
+                            f" `{call_str}`"
+                            + (o.entries and f" with entries={o.entries}." or ".")
+                            + (o.hint and f"  {o.hint}" or "")
+                        )
+                        + self.student_user.format_log(
+                            first_difference(actual, expected, o.start)
+                        )
                     )
-                    + f"{self.student_user.format_log()}"
-                )
-                self.assertGreaterEqual(similarity, o.ratio, msg=message)
+
+                message = LazyMessage(similarity_message)
+                assert_similar(self, actual, expected, o.ratio, msg=message)
             else:
                 # Exact match (default).
-                message = (
-                    "\n\nHint:\n"
-                    + self.wrapper.fill(
-                        "Your output did not match the expected output."
-                        f"  Double check the formatting of output {line_range}"
-                        f" of your `{o.obj_name}` function when called as"
-                        f" `{call_str}`"
-                        + (o.entries and f" with entries={o.entries}." or ".")
-                        + (o.hint and f"  {o.hint}" or "")
+                message = LazyMessage(
+                    lambda: (
+                        "\n\nHint:\n"
+                        + self.wrapper.fill(
+                            "Your output did not match the expected output."
+                            f"  Double check the formatting of output {line_range}"
+                            f" of your `{o.obj_name}` function when called as"
+                            f" `{call_str}`"
+                            + (o.entries and f" with entries={o.entries}." or ".")
+                            + (o.hint and f"  {o.hint}" or "")
+                        )
+                        + self.student_user.format_log(
+                            first_difference(actual, expected, o.start)
+                        )
                     )
-                    + f"{self.student_user.format_log()}"
                 )
                 safe_assert_equal(self, actual, expected, msg=message)
 
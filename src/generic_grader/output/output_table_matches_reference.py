@@ -0,0 +1,135 @@
+"""Test all values in a range of output lines at once."""
+
+import unittest
+from itertools import chain
+
+from parameterized import parameterized
+
+from generic_grader.utils.decorators import weighted
+from generic_grader.utils.docs import (
+    get_wrapper,
+    make_call_str,
+    make_line_range,
+)
+from generic_grader.utils.options import options_to_params
+from generic_grader.utils.reference_test import reference_test
+
+MAX_REPORTED_CELLS = 10
+"""Number of mismatching values listed in a failure message."""
+
+
+def doc_func(func, num, param):
+    """Return parameterized docstring when checking a table of output values."""
+
+    o = param.args[0]
+
+    call_str = make_call_str(o.obj_name, o.args, o.kwargs)
+    line_range = make_line_range(o.start, o.n_lines)
+
+    docstring = (
+        f"Check that the values on output {line_range}"
+        + f" from your `{o.obj_name}` function when called as `{call_str}`"
+        + (o.entries and f" with entries={o.entries}" or "")
+        + " match the reference values."
+    )
+
+    return docstring
+
+
+def compare_tables(actual, expected, start=1, rtol=1e-7, atol=0.0):
+    """Compare two lists of rows of values with `numpy.isclose`.
+
+    Return a description of the lines whose number of values differ, or of
+    the values that are not close, or "" if the tables match.  Rows are
+    numbered from `start`.
+    """
+    if len(actual) != len(expected):
+        return (
+            f"\nFound {len(actual)} output lines, but expected {len(expected)}"
+            " output lines."
+        )
+
+    lengths = [len(row) for row in expected]
+    rows = [
+        f"  line {start + n}: found {len(a)} values, but expected {len(e)}"
+        for n, (a, e) in enumerate(zip(actual, expected))
+        if len(a) != len(e)
+    ]
+    if rows:
+        return "\nLines with the wrong number of values:\n" + "\n".join(
+            rows[:MAX_REPORTED_CELLS]
+        )
+
+    import numpy as np
+
+    count = sum(lengths)
+    actual = np.fromiter(chain.from_iterable(actual), float, count)
+    expected = np.fromiter(chain.from_iterable(expected), float, count)
+    bad = np.flatnonzero(~np.isclose(actual, expected, rtol=rtol, atol=atol))
+    if not bad.size:
+        return ""
+
+    # Map flat indices back to (row, column).
+    row_starts = np.cumsum([0] + lengths[:-1])
+    row_of = np.searchsorted(row_starts, bad, side="right") - 1
+    cells = [
+        f"  line {start + int(r)}, value {int(i - row_starts[r]) + 1}:"
+        f" found {actual[i].item()!r}, but expected {expected[i].item()!r}"
+        for i, r in zip(bad[:MAX_REPORTED_CELLS], row_of)
+    ]
+    return f"\n{bad.size} of {count} values differ:\n" + "\n".join(cells)
+
+
+def build(the_options):
+    """Create a class for output table tests."""
+
+    the_params = options_to_params(the_options)
+
+    class TestOutputTableMatchesReference(unittest.TestCase):
+        """A class for output table tests."""
+
+        wrapper = get_wrapper()
+        run_params = the_params  # Planned by `run_plan.plan_runs`.
+
+        @parameterized.expand(the_params, doc_func=doc_func)
+        @weighted
+        @reference_test
+        def test_output_table_matches_reference(self, options):
+            """Compare all values in a range of output lines to reference
+            values.
+            """
+
+            o = options
+
+            line_range = make_line_range(o.start, o.n_lines)
+            call_str = make_call_str(o.obj_name, o.args, o.kwargs)
+
+            # Get the actual and expected values of every line.
+            actual = self.student_user.get_value_table()
+            expected = self.ref_user.get_value_table()
+
+            details = compare_tables(
+                actual,
+                expected,
+                start=o.start,
+                rtol=o.relative_tolerance,
+                atol=o.absolute_tolerance,
+            )
+
+            if details:
+                message = (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        "Your output values did not match the expected values."
+                        + f"  Double check the values on output {line_range}"
+                        + f" of your `{o.obj_name}` function when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}." or ".")
+                        + (o.hint and f"  {o.hint}")
+                    )
+                    + self.student_user.format_log(o.start)
+                )
+                self.fail(details + message)
+
+            self.set_score(self, o.weight)  # Full credit
+
+    return TestOutputTableMatchesReference
@@ -5,7 +5,12 @@ import unittest
 from parameterized import parameterized
 
 from generic_grader.utils.decorators import weighted
-from generic_grader.utils.docs import get_wrapper, make_call_str, ordinalize
+from generic_grader.utils.docs import (
+    LazyMessage,
+    get_wrapper,
+    make_call_str,
+    ordinalize,
+)
 from generic_grader.utils.options import options_to_params
 from generic_grader.utils.reference_test import reference_test
 from generic_grader.utils.safe_equal import safe_assert_equal
@@ -39,6 +44,7 @@ def build(the_options):
         """A class for formatting tests."""
 
         wrapper = get_wrapper()
+        run_params = the_params  # Planned by `run_plan.plan_runs`.
 
         @parameterized.expand(the_params, doc_func=doc_func)
         @weighted
@@ -63,16 +69,18 @@ def build(the_options):
 
             value_string = f"{ordinalize(o.value_n)} value" if o.value_n else "values"
 
-            message = (
-                "\n\nHint:\n"
-                + self.wrapper.fill(
-                    "Your output values did not match the expected values."
-                    + f"  Double check the {value_string} in the {line_nth} output line"
-                    + f" of your `{o.obj_name}` function when called as `{call_str}`"
-                    + (o.entries and f" with entries={o.entries}." or ".")
-                    + (o.hint and f"  {o.hint}")
+            message = LazyMessage(
+                lambda: (
+                    "\n\nHint:\n"
+                    + self.wrapper.fill(
+                        "Your output values did not match the expected values."
+                        + f"  Double check the {value_string} in the {line_nth} output line"
+                        + f" of your `{o.obj_name}` function when called as `{call_str}`"
+                        + (o.entries and f" with entries={o.entries}." or ".")
+                        + (o.hint and f"  {o.hint}")
+                    )
+                    + self.student_user.format_log(o.line_n)
                 )
-                + f"{self.student_user.format_log()}"
             )
 
             safe_assert_equal(self, actual, expected, msg=message)
@@ -1,6 +1,5 @@
 """Test program docstring."""
 
-import ast
 import datetime
 import os
 import unittest
@@ -11,41 +10,7 @@ from generic_grader.utils.decorators import weighted
 from generic_grader.utils.docs import get_wrapper
 from generic_grader.utils.options import options_to_params
 from generic_grader.utils.safe_equal import safe_assert_equal
-
-
-def parse_docstring(docstring):
-    """Parse the doc string to find required components."""
-
-    author, assignment, date = None, None, None
-    description, contributors, integrity = [], [], []
-
-    part = None
-    for line in docstring.split("\n"):
-        line = line.strip()
-
-        if line.startswith("Author:"):
-            author = line.replace("Author:", "").strip()
-            part = None
-        elif line.startswith("Assignment:"):
-            assignment = line.replace("Assignment:", "").strip()
-            part = None
-        elif line.startswith("Date:"):
-            date = line.replace("Date:", "").strip()
-            part = None
-        elif line.startswith("Description"):
-            part = "Description"
-        elif line.startswith("Contributors"):
-            part = "Contributors"
-        elif line.startswith("Academic Integrity Statement"):
-            part = "Integrity"
-        elif part == "Description":
-            description.append(line)
-        elif part == "Contributors":
-            contributors.append(line)
-        elif part == "Integrity":
-            integrity.append(line)
-
-    return author, assignment, date, description, contributors, integrity
+from generic_grader.utils.static import analyze, parse_docstring  # noqa: F401
 
 
 def titlecase(phrase):
@@ -64,19 +29,19 @@ def build(the_options):
         wrapper = get_wrapper()
 
         def set_up(self):
-            with open(submission) as fo:
-                fail_msg = None
-                try:
-                    self.doc = ast.get_docstring(ast.parse(fo.read()))
-                except SyntaxError as e:
-                    fail_msg = (
-                        f"Error while parsing `{submission}`. "
-                        + f'The error was "{e.__class__.__name__}: {e}".'
-                    )
-                # Fail outside of the except block
-                # so that AssertionError(s) will be handled properly.
-                if fail_msg:
-                    self.fail(fail_msg)
+            fail_msg = None
+            try:
+                analysis = analyze(submission)
+                self.doc = analysis.docstring
+            except SyntaxError as e:
+                fail_msg = (
+                    f"Error while parsing `{submission}`. "
+                    + f'The error was "{e.__class__.__name__}: {e}".'
+                )
+            # Fail outside of the except block
+            # so that AssertionError(s) will be handled properly.
+            if fail_msg:
+                self.fail(fail_msg)
             (
                 self.author,
                 self.assignment,
@@ -84,7 +49,7 @@ def build(the_options):
                 self.description,
                 self.contributors,
                 self.integrity,
-            ) = parse_docstring(self.doc or "")
+            ) = analysis.docstring_fields
 
         @weighted
         def test_docstring_module(self):
@@ -185,9 +150,7 @@ def build(the_options):
             self.set_up()
 
             actual = len("".join(self.description))
-            with open(reference) as fo:
-                reference_doc = ast.get_docstring(ast.parse(fo.read()))
-            _, _, _, reference_desc, _, _ = parse_docstring(reference_doc)
+            _, _, _, reference_desc, _, _ = analyze(reference).docstring_fields
             minimum = len("".join(reference_desc)) // 2
             maximum = len("".join(reference_desc)) * 5
 
@@ -8,7 +8,7 @@ from parameterized import parameterized
 from generic_grader.utils.decorators import weighted
 from generic_grader.utils.docs import get_wrapper
 from generic_grader.utils.options import options_to_params
-from generic_grader.utils.static import get_tokens
+from generic_grader.utils.static import get_summary
 
 
 def doc_func(func, num, param):
@@ -34,10 +34,10 @@ def build(the_options):
             """Check if the program is bigger than expected."""
 
             submission_file = options.sub_module.replace(".", os.path.sep) + ".py"
-            actual = len(get_tokens(self, submission_file))
+            actual = get_summary(self, submission_file).n_tokens
 
             reference_file = options.ref_module.replace(".", os.path.sep) + ".py"
-            expected = len(get_tokens(self, reference_file))
+            expected = get_summary(self, reference_file).n_tokens
 
             maximum = int(2 * expected)
             message = "\n\nHint:\n" + self.wrapper.fill(
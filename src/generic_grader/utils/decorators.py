@@ -1,5 +1,6 @@
 from functools import wraps
 
+from generic_grader.utils.instrumentation import measure_test
 from generic_grader.utils.options import Options
 
 
@@ -11,7 +12,8 @@ def weighted(func):
     The decorator expects to find an Options object in the arguments. If it is
     not found, the weight is taken from the default instance of Options.
     Any weighted test method also has a set_score method injected into it to
-    enable partial credit.
+    enable partial credit, and its timing and resource usage are recorded in
+    a `__metrics__` attribute (see `generic_grader.utils.instrumentation`).
     ```
     @weighted
     def f(*args, **kwargs):
@@ -52,6 +54,10 @@ def weighted(func):
         # Set the score to 0 by default.
         self.set_score(self, 0)
 
-        func(self, *args, **kwargs)
+        with measure_test(self) as metrics:
+            try:
+                func(self, *args, **kwargs)
+            finally:
+                test_method.__metrics__ = metrics
 
     return wrapper
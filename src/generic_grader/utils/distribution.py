@@ -0,0 +1,99 @@
+"""Decide whether samples follow an expected discrete distribution.
+
+`SequentialChiSquare` runs a chi-square goodness-of-fit test on a sample that
+doubles in size at each look.  It fails at the first look whose p-value
+shows that the samples don't follow the expected distribution, and passes at
+the last look, whose sample is large enough for the test to catch a
+distribution that differs from the expected one by the effect size (Cohen's
+w).  So wrong distributions are usually rejected after a few small samples,
+and the number of samples is bounded.
+
+Both chances of a wrong decision, failing a correct distribution and passing
+a distribution that is off by the effect size, are kept below
+`10**-tolerance`.  The chance of failing is split evenly among the looks.
+
+Passing early isn't attempted: the chi-square approximation of the
+statistic's lower tail is poor for small samples, so small samples can't
+rule out a distribution that is off by the effect size.
+"""
+
+MIN_SAMPLES = 32
+"""Size of the first sample."""
+
+MIN_EXPECTED_COUNT = 5
+"""Smallest expected count in any bin of the first sample, which keeps the
+chi-square approximation valid.
+"""
+
+MAX_LOOKS = 12
+"""Number of looks at most, among which the chances of error are split."""
+
+
+class SequentialChiSquare:
+    """A chi-square goodness-of-fit test that grows its sample until it
+    decides.
+
+    `expected` maps each value to its probability (or weight).  Values with
+    no weight are not expected.
+
+    ```
+    check = SequentialChiSquare({1: 1, 2: 1, 3: 2}, tolerance=9)
+    for n in check.looks:
+        counts = ...  # The number of times each of check.values occurred.
+        decision = check.decide(counts)
+        if decision is not None:
+            break
+    ```
+    """
+
+    def __init__(self, expected, tolerance=9, effect_size=0.2):
+        import numpy as np
+        from scipy.stats import chi2, ncx2
+
+        self.values = [value for value, weight in expected.items() if weight > 0]
+        if len(self.values) < 2:
+            raise ValueError(
+                "`expected_distribution` must give positive probabilities to at"
+                " least two values."
+            )
+        if effect_size <= 0:
+            raise ValueError("`effect_size` must be positive.")
+        weights = np.array([expected[value] for value in self.values], float)
+        self.probabilities = weights / weights.sum()
+        self.df = len(self.values) - 1
+        self.effect_size = effect_size
+        self.alpha = 10.0**-tolerance / MAX_LOOKS
+
+        # Double the sample until the test is likely to catch a distribution
+        # that is off by the effect size.
+        n = max(
+            MIN_SAMPLES, int(np.ceil(MIN_EXPECTED_COUNT / self.probabilities.min()))
+        )
+        critical = chi2.isf(self.alpha, self.df)
+        self.looks = [n]
+        while (
+            len(self.looks) < MAX_LOOKS
+            and ncx2.sf(critical, self.df, n * effect_size**2) < 1 - self.alpha
+        ):
+            n *= 2
+            self.looks.append(n)
+
+    def statistic(self, counts):
+        """Return the chi-square statistic and p-value of `counts`."""
+        from scipy.stats import chisquare
+
+        n = sum(counts)
+        result = chisquare(counts, n * self.probabilities)
+        return float(result.statistic), float(result.pvalue)
+
+    def decide(self, counts):
+        """Return False if `counts` (the number of times each value occurred)
+        don't follow the expected distribution, True if they do, or None if a
+        larger sample is needed.
+        """
+        _, pvalue = self.statistic(counts)
+        if pvalue < self.alpha:
+            return False
+        if sum(counts) >= self.looks[-1]:
+            return True
+        return None
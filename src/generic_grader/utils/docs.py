@@ -1,21 +1,75 @@
 """Functions to generate customized docstrings for parameterized tests."""
 
+import reprlib
 import textwrap
-
-
-def make_call_str(func_name="main", args=[], kwargs={}):
-    """Construct and return a function call string from its name, and
-    arguments.
-    """
+from itertools import islice
+
+
+class _CallRepr(reprlib.Repr):
+    """A `reprlib.Repr` that keeps dictionaries in insertion order."""
+
+    def repr_dict(self, x, level):
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{" + self.fillvalue + "}"
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}"
+            for key, value in islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append(self.fillvalue)
+        return "{" + ", ".join(pieces) + "}"
+
+
+_call_repr = _CallRepr()
+_call_repr.maxstring = 200
+_call_repr.maxother = 200
+_call_repr.maxlong = 200
+_call_repr.maxdict = 20
+_call_repr.maxlist = 20
+_call_repr.maxtuple = 20
+_call_repr.maxset = 20
+_call_repr.maxfrozenset = 20
+_call_repr.maxdeque = 20
+_call_repr.maxarray = 20
+
+_CALL_STR_CACHE_SIZE = 256
+_call_strs = {}
+"""Call strings by (name, id(args), id(kwargs)).  Entries keep `args` and
+`kwargs` alive, so their ids can't be reused while cached.
+"""
+
+
+def _render_call_str(func_name, args, kwargs):
     # Create a list of position argument strings.
-    args_lst = list(map(repr, args))
+    args_lst = list(map(_call_repr.repr, args))
 
     # Add keyword argument strings.
-    args_lst.extend(f"{k}={repr(v)}" for k, v in kwargs.items())
+    args_lst.extend(f"{k}={_call_repr.repr(v)}" for k, v in kwargs.items())
 
     # Construct the function call with a comma separated list of arguments.
-    call_str = f'{func_name}({", ".join(args_lst)})'
+    return f'{func_name}({", ".join(args_lst)})'
+
+
+def make_call_str(func_name="main", args=[], kwargs={}):
+    """Construct and return a function call string from its name, and
+    arguments.
 
+    Long arguments are abbreviated with "...", and the strings are cached by
+    the identity of `args` and `kwargs` (which are not expected to change), so
+    building docstrings and messages for the same options doesn't repeat the
+    work.
+    """
+    key = (func_name, id(args), id(kwargs))
+    cached = _call_strs.get(key)
+    if cached is not None and cached[0] is args and cached[1] is kwargs:
+        return cached[2]
+
+    call_str = _render_call_str(func_name, args, kwargs)
+    if len(_call_strs) >= _CALL_STR_CACHE_SIZE:
+        del _call_strs[next(iter(_call_strs))]  # Drop the oldest.
+    _call_strs[key] = (args, kwargs, call_str)
     return call_str
 
 
@@ -58,3 +112,27 @@ def oxford_list(sequence):
 def get_wrapper() -> textwrap.TextWrapper:
     """Return an instance of the text wrapper used across tests."""
     return textwrap.TextWrapper(initial_indent="  ", subsequent_indent="  ")
+
+
+class LazyMessage:
+    """A failure message that is built only if it is needed.
+
+    unittest formats an assertion's `msg` only when the assertion fails, so
+    passing `msg=LazyMessage(lambda: ...)` skips building messages (e.g.
+    formatting IO logs) for passing tests.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            self._text = self.build()
+        return self._text
+
+    def __add__(self, other):
+        return str(self) + other
+
+    def __radd__(self, other):
+        return other + str(self)
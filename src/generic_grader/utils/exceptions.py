@@ -137,6 +137,24 @@ class LogLimitExceededError(_GraderError):
         )
 
 
+class OutputDivergenceError(_GraderError):
+    """Custom Exception to raise when output stops matching the expected
+    output.
+    """
+
+    def _build_msg(self, line_n=None, expected=None, hint=None):
+        expected = (
+            f"  Line {line_n} should have been {expected!r}."
+            if expected is not None
+            else "  No more output was expected."
+        )
+        return format_error_msg(
+            f"Your program's output stopped matching the expected output at line"
+            f" {line_n}, so it was stopped early.{expected}",
+            hint,
+        )
+
+
 class UserTimeoutError(_GraderError):
     """Custom Exception to raise when submitted code doesn't return within one
     second.
@@ -0,0 +1,104 @@
+"""Compare files produced by reference and submitted code in bounded memory.
+
+The file tests used to read both files into memory before comparing them,
+which doubles the memory used by assignments that write large files.  These
+helpers stream the files instead: `files_identical` compares sizes and then
+fixed size chunks, `line_mismatches` walks both files line by line and stops
+after the first few differences, and `count_lines` counts lines without
+keeping them.
+"""
+
+import os
+import reprlib
+from itertools import zip_longest
+
+CHUNK_SIZE = 1 << 20
+"""Bytes read from each file per comparison step."""
+
+SMALL_FILE_BYTES = 1 << 20
+"""Combined size below which the file tests compare whole files in memory,
+which gives students the familiar assertEqual diff.
+"""
+
+MAX_MISMATCHES = 10
+"""Number of differing lines reported for large files."""
+
+_line_repr = reprlib.Repr()
+_line_repr.maxstring = 100
+_line_repr.maxother = 100
+
+
+def files_identical(path_a, path_b, chunk_size=CHUNK_SIZE):
+    """Return True if the two files contain the same bytes."""
+    if os.path.getsize(path_a) != os.path.getsize(path_b):
+        return False
+    with open(path_a, "rb") as fa, open(path_b, "rb") as fb:
+        while True:
+            chunk = fa.read(chunk_size)
+            if chunk != fb.read(chunk_size):
+                return False
+            if not chunk:
+                return True
+
+
+def files_are_small(*paths):
+    """Return True if the files are small enough to compare in memory."""
+    return sum(os.path.getsize(path) for path in paths) <= SMALL_FILE_BYTES
+
+
+def _lines(fo, binary):
+    """Yield the lines of `fo` without their line endings.
+
+    Text lines are split like `str.splitlines`, which also breaks lines at
+    characters like "\\x0c" (form feed) and "\\u2028", so large files are
+    split the same way as small files compared in memory.
+    """
+    if binary:
+        for line in fo:
+            yield line.removesuffix(b"\n")
+    else:
+        for line in fo:
+            yield from line.splitlines()
+
+
+def line_mismatches(actual_path, expected_path, limit=MAX_MISMATCHES, binary=False):
+    """Return up to `limit` (line number, actual line, expected line) tuples
+    for the lines that differ, numbered from 1.  The line is None for the
+    file that ran out of lines.
+
+    Text files are read with universal newlines, so "\\r\\n" and "\\n" line
+    endings match, and split like `str.splitlines`.
+    """
+    mode = "rb" if binary else "r"
+    mismatches = []
+    with open(actual_path, mode) as fa, open(expected_path, mode) as fe:
+        pairs = zip_longest(_lines(fa, binary), _lines(fe, binary))
+        for n, (actual, expected) in enumerate(pairs, start=1):
+            if actual != expected:
+                mismatches.append((n, actual, expected))
+                if len(mismatches) >= limit:
+                    break
+    return mismatches
+
+
+def count_lines(path):
+    """Return the number of lines in a text file, as counted by
+    `str.splitlines` on its contents.
+
+    Besides newlines, `splitlines` also breaks lines at characters like
+    "\\x0c" (form feed) and "\\u2028", so each newline terminated line is
+    split the same way.
+    """
+    with open(path) as fo:
+        return sum(len(line.splitlines()) for line in fo)
+
+
+def format_mismatches(filename, mismatches):
+    """Return a description of the differing lines of `filename`."""
+    rows = []
+    for n, actual, expected in mismatches:
+        actual = "(missing)" if actual is None else _line_repr.repr(actual)
+        expected = "(no line)" if expected is None else _line_repr.repr(expected)
+        rows.append(f"  line {n}:\n    yours:    {actual}\n    expected: {expected}")
+    more = " (first differences only)" if len(mismatches) >= MAX_MISMATCHES else ""
+    return f"\nLines of `{filename}` that differ{more}:\n" + "\n".join(rows)
@@ -4,12 +4,11 @@ import traceback
 import unittest
 from pathlib import Path
 
-from attrs import evolve
-
 from generic_grader.utils.docs import get_wrapper
 from generic_grader.utils.exceptions import handle_error, safe_exception_type
+from generic_grader.utils.instrumentation import stage
 from generic_grader.utils.options import Options
-from generic_grader.utils.patches import custom_stack
+from generic_grader.utils.patches import PatchSet, custom_stack
 
 
 class Importer:
@@ -57,13 +56,12 @@ class Importer:
         imp_obj = None
         fail_msg = False
         try:
-            stack_o = evolve(
-                o,
-                patches=(o.patches or [])
-                + [{"args": ["builtins.input", cls.raise_input_error]}],
-            )
             # Override input() to raise an exception if it gets called.
-            with custom_stack(stack_o):
+            patch_set = PatchSet(
+                (o.patches or [])
+                + [{"args": ["builtins.input", cls.raise_input_error]}]
+            )
+            with stage("import"), custom_stack(o, patch_set=patch_set):
                 # Try to import student's object
                 imp_obj = getattr(__import__(module, fromlist=[obj_name]), obj_name)
 
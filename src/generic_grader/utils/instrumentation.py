@@ -0,0 +1,118 @@
+"""Collect per-test timing and resource metrics.
+
+The `weighted` decorator measures every test it wraps, and the grading stages
+(import, reference run, student run, comparison and message formatting)
+charge their time to the running test with the `stage` context manager.  The
+results are attached to the test method as `__metrics__` (next to `__weight__`
+and `__score__`) and collected in `metrics_log` so they can be written to a
+JSON sidecar or merged into Gradescope's `extra_data`.
+"""
+
+import json
+import resource
+import time
+from contextlib import contextmanager
+
+_current = None
+"""The metrics of the test that is currently running, if any."""
+
+metrics_log = []
+"""Metrics of every measured test, in the order they ran."""
+
+
+def _cpu_seconds():
+    """Return the user plus system CPU time used by this process."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _reset_peak_rss():
+    """Reset the peak resident set size (VmHWM) if the kernel allows it.
+
+    Return True on success, in which case VmHWM measures only the current
+    test.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as fo:
+            fo.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def _peak_rss_kib(per_test):
+    """Return the peak resident set size in KiB."""
+    if per_test:
+        try:
+            with open("/proc/self/status") as fo:
+                for line in fo:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1])
+        except OSError:  # pragma: no cover
+            pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # pragma: no cover
+
+
+@contextmanager
+def stage(name):
+    """Charge the time spent in the enclosed block to stage `name` of the
+    running test.  Stages are inclusive, so nested stages overlap.
+    """
+    if _current is None:
+        yield
+        return
+
+    stages = _current["stages"]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stages[name] = stages.get(name, 0.0) + time.perf_counter() - start
+
+
+@contextmanager
+def measure_test(test):
+    """Measure the wall time, CPU time, peak RSS and stage times of a test.
+
+    Yield the metrics dictionary, which is complete once the block exits.
+    """
+    global _current
+
+    metrics = {
+        "test": test.id(),
+        "name": test.shortDescription() or str(test),
+        "stages": {},
+    }
+    outer, _current = _current, metrics
+    per_test_rss = _reset_peak_rss()
+    start_wall, start_cpu = time.perf_counter(), _cpu_seconds()
+    try:
+        yield metrics
+    finally:
+        metrics["wall_time"] = time.perf_counter() - start_wall
+        metrics["cpu_time"] = _cpu_seconds() - start_cpu
+        metrics["peak_rss_kib"] = _peak_rss_kib(per_test_rss)
+        metrics["peak_rss_scope"] = "test" if per_test_rss else "process"
+        _current = outer
+        metrics_log.append(metrics)
+
+
+def write_metrics(filename="metrics.json"):
+    """Write the metrics of all measured tests to a JSON sidecar file."""
+    with open(filename, "w") as fo:
+        json.dump({"tests": metrics_log}, fo, indent=2)
+
+
+def add_metrics_to_results(json_data):
+    """Merge the measured metrics into Gradescope results as `extra_data`.
+
+    This is meant to be passed as the `post_processor` of gradescope-utils'
+    `JSONTestRunner`.  Results are matched to metrics by test name in run
+    order.
+    """
+    pending = list(metrics_log)
+    for result in json_data.get("tests", []):
+        for i, metrics in enumerate(pending):
+            if metrics["name"] == result.get("name"):
+                result.setdefault("extra_data", {})["metrics"] = pending.pop(i)
+                break
@@ -1,8 +1,10 @@
 import datetime
 import inspect
 from collections.abc import Callable
+from functools import cache, lru_cache
+from operator import attrgetter
 
-from attrs import Factory, define
+from attrs import Factory, define, fields
 from parameterized import param
 
 
@@ -40,9 +42,14 @@ class Options:
     value_n: int | None = None
     ratio: float = 1.0  # exact match
     log_limit: int = 0
+    stop_on_divergence: bool = False  # Stop a student run whose output can't match.
     fixed_time: bool | datetime.datetime | str = False
+    seed: int | None = None  # Seed each user's random numbers reproducibly.
     debug: bool = False
-    time_limit: int = 1
+    time_limit: int | float = 1  # Wall time limit per call in seconds.
+    cpu_time_limit: int | float = 0  # CPU time limit per call (0 for none).
+    time_budget: int | float = 0  # Total wall time across one user's calls.
+    profile_timeouts: bool = False  # Show the hottest lines on a timeout.
     memory_limit_GB: float = 1.4
 
     # Callable
@@ -65,6 +72,7 @@ class Options:
 
     # Stats
     expected_distribution: dict = {0: 0}
+    effect_size: float = 0.2  # Smallest distribution error (Cohen's w) to catch.
     relative_tolerance: float = 1e-7
     absolute_tolerance: float = 0.0
 
@@ -82,23 +90,17 @@ class Options:
     random_func_calls: list[str] = Factory(list)
     random_chance_tolerance: int = 9
     # This is the probabilty that we miss a possible outcome, by default it is set to 1 in a billion
+    n_workers: int = 1  # Processes sharing the random trials.
 
     def __attrs_post_init__(self):
         """Check that the attributes are of the correct type."""
-        annotations = type(self).__annotations__
-        for attr in annotations:
-            if attr == "init":
-                expected_type = (Callable, type(None))
-                attr_type = f"<class 'function'> or {type(None)}. "
-            elif attr == "patches":
-                expected_type = list
-                attr_type = f"{list}. "
-            elif attr == "random_func_calls":
-                expected_type = list
-                attr_type = f"{list}. "
-            else:
-                expected_type = annotations[attr]
-                attr_type = f"{annotations[attr]}. "
+        self._validate()
+
+    def _validate(self, names=None):
+        """Check the attributes in `names` (all of them by default)."""
+        checks = _type_checks(type(self))
+        for attr in checks if names is None else names & checks.keys():
+            expected_type, attr_type = checks[attr]
             if not isinstance(getattr(self, attr), expected_type):
                 raise ValueError(
                     f"`{attr}` must be of type "
@@ -106,32 +108,117 @@ class Options:
                     + f"Got {type(getattr(self, attr))} instead."
                 )
         for name in ["filenames", "required_files", "ignored_files"]:
+            if names is not None and name not in names:
+                continue  # Unchanged
             attr = getattr(self, name)
             if attr == ():
                 continue
             s = set(attr)
             if len(s) != len(attr):
                 raise ValueError(f"Duplicate entries in {name}.")
-        if self.init is not None:
-            sig = inspect.signature(self.init)
-            positional_kinds = (
-                inspect.Parameter.POSITIONAL_ONLY,
-                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                inspect.Parameter.VAR_POSITIONAL,
-            )
-            max_positional = 0
-            for p in sig.parameters.values():
-                if p.kind == inspect.Parameter.VAR_POSITIONAL:
-                    max_positional = float("inf")
-                    break
-                if p.kind in positional_kinds:
-                    max_positional += 1
+        if self.init is not None and (names is None or "init" in names):
+            max_positional = _max_positional(self.init)
             if max_positional < 2:
                 raise ValueError(
                     f"`init` must accept 2 positional arguments"
                     f" (test, options), but accepts {max_positional}."
                 )
-        if self.mode not in ["exactly", "less than", "more than", "approximately"]:
-            raise ValueError(
-                "`mode` must be one of 'exactly', 'less than', 'more than', or 'approximately'."
-            )
+        if names is None or "mode" in names:
+            if self.mode not in ["exactly", "less than", "more than", "approximately"]:
+                raise ValueError(
+                    "`mode` must be one of 'exactly', 'less than', 'more than', or 'approximately'."
+                )
+
+    def derive(self, **changes):
+        """Return a copy with `changes` applied, like `attrs.evolve`.
+
+        Only the changed attributes are validated, which makes this much
+        cheaper than `evolve` in loops that derive options many times.
+        """
+        names, index, get_values, setters = _copy_plan(type(self))
+        unknown = changes.keys() - names
+        if unknown:
+            raise TypeError(f"Options has no attribute(s) {sorted(unknown)}.")
+        values = list(get_values(self))
+        for name, value in changes.items():
+            values[index[name]] = value
+        new = object.__new__(type(self))
+        for set_value, value in zip(setters, values):
+            set_value(new, value)
+        new._validate(changes)
+        return new
+
+
+_checks_by_class = {}
+
+
+def _type_checks(cls):
+    """Return the expected type and its description for each attribute of
+    `cls`, computed once per class.
+    """
+    checks = _checks_by_class.get(cls)
+    if checks is None:
+        checks = _checks_by_class[cls] = {}
+        annotations = cls.__annotations__
+        for attr in annotations:
+            if attr == "init":
+                expected_type = (Callable, type(None))
+                attr_type = f"<class 'function'> or {type(None)}. "
+            elif attr == "patches":
+                expected_type = list
+                attr_type = f"{list}. "
+            elif attr == "random_func_calls":
+                expected_type = list
+                attr_type = f"{list}. "
+            else:
+                expected_type = annotations[attr]
+                attr_type = f"{annotations[attr]}. "
+            checks[attr] = (expected_type, attr_type)
+    return checks
+
+
+@cache
+def _copy_plan(cls):
+    """Return what `derive` needs to copy instances of attrs class `cls`: the
+    field names, their indices, a getter for all of their values and the
+    slot setters (which bypass the frozen `__setattr__`).
+    """
+    names = tuple(field.name for field in fields(cls))
+    return (
+        frozenset(names),
+        {name: i for i, name in enumerate(names)},
+        attrgetter(*names),
+        tuple(getattr(cls, name).__set__ for name in names),
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_max_positional(init):
+    return _count_max_positional(init)
+
+
+def _count_max_positional(init):
+    """Return the maximum number of positional arguments `init` accepts."""
+    sig = inspect.signature(init)
+    positional_kinds = (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        inspect.Parameter.VAR_POSITIONAL,
+    )
+    max_positional = 0
+    for p in sig.parameters.values():
+        if p.kind == inspect.Parameter.VAR_POSITIONAL:
+            return float("inf")
+        if p.kind in positional_kinds:
+            max_positional += 1
+    return max_positional
+
+
+def _max_positional(init):
+    """Return the maximum number of positional arguments `init` accepts,
+    caching the result for hashable callables.
+    """
+    try:
+        return _cached_max_positional(init)
+    except TypeError:  # Unhashable
+        return _count_max_positional(init)
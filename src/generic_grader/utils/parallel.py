@@ -0,0 +1,131 @@
+"""Share repeated random trials across forked worker processes.
+
+Tests like `random_function_calls` call the submitted code hundreds of times
+to collect the set of outcomes it can produce.  `collect_outcomes` splits
+those trials across worker processes forked from the test, so the workers
+inherit the imported modules, the users and their patches without pickling
+anything.  Each worker reseeds the random number generators, collects the
+outcomes of its share of the trials, and stops as soon as any worker finds
+an outcome that ends the test (e.g. an unexpected permutation).
+
+Where fork is not available, or with one worker, the trials run in this
+process.
+"""
+
+import multiprocessing
+import random
+import sys
+
+_FAILED = "A trial process exited with code {} before reporting its outcomes."
+
+
+def _fork_context():
+    """Return the fork multiprocessing context, or None if it's unavailable."""
+    try:
+        return multiprocessing.get_context("fork")
+    except ValueError:  # pragma: no cover
+        return None
+
+
+def _run_trials(trial, n, keep_going, stop=None):
+    """Collect the outcomes of up to `n` calls to `trial()`, until
+    `keep_going(outcomes)` is false or the `stop` event is set.
+    """
+    outcomes = set()
+    for _ in range(n):
+        if stop is not None and stop.is_set():
+            break
+        outcomes.add(trial())
+        if not keep_going(outcomes):
+            if stop is not None:
+                stop.set()
+            break
+    return outcomes
+
+
+def _portable_error(e):
+    """Return the type and message of `e`, in a form that can be sent between
+    processes.
+    """
+    error_type = type(e)
+    module = sys.modules.get(error_type.__module__)
+    if getattr(module, error_type.__qualname__, None) is error_type:
+        return error_type, str(e)
+    return RuntimeError, f"{error_type.__name__}: {e}"  # It can't be pickled.
+
+
+def _worker(trial, n, keep_going, stop, conn, worker, setup):
+    """Run a worker's share of the trials and send back its outcomes."""
+    random.seed()
+    np = sys.modules.get("numpy")
+    if np is not None:
+        np.random.seed()
+    error = None
+    try:
+        if setup is not None:
+            setup(worker)
+        outcomes = _run_trials(trial, n, keep_going, stop)
+    except Exception as e:
+        stop.set()
+        outcomes, error = set(), _portable_error(e)
+    conn.send((outcomes, error))
+    conn.close()
+
+
+def collect_outcomes(trial, n, n_workers=1, keep_going=None, setup=None):
+    """Return the set of outcomes of `n` calls to `trial()`, shared among
+    `n_workers` forked processes.
+
+    The trials stop early once `keep_going(outcomes)` is false for the
+    outcomes of any worker.  Each worker reseeds `random` (and numpy, if
+    imported) and calls `setup(worker)` with its index, counting from 1,
+    before its first trial.  If a trial raises an exception, an exception of
+    the same type and message is raised here.
+    """
+    if keep_going is None:
+
+        def keep_going(outcomes):
+            return True
+
+    context = _fork_context()
+    n_workers = min(n_workers, n)
+    if n_workers <= 1 or context is None:
+        return _run_trials(trial, n, keep_going)
+
+    stop = context.Event()
+    workers = []
+    for worker in range(n_workers):
+        share = n // n_workers + (worker < n % n_workers)
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_worker,
+            args=(trial, share, keep_going, stop, sender, worker + 1, setup),
+            daemon=True,
+        )
+        process.start()
+        sender.close()  # Only the worker sends.
+        workers.append((process, receiver))
+
+    outcomes, error = set(), None
+    for process, receiver in workers:
+        try:
+            worker_outcomes, worker_error = receiver.recv()
+        except EOFError:
+            process.join()
+            stop.set()
+            worker_outcomes = set()
+            worker_error = (RuntimeError, _FAILED.format(process.exitcode))
+        outcomes |= worker_outcomes
+        error = error or worker_error
+        receiver.close()
+    for process, _ in workers:
+        process.join()
+
+    if error is not None:
+        error_type, message = error
+        try:
+            error = error_type(message)
+        except Exception:  # It takes other arguments.
+            error = RuntimeError(message)
+        raise error
+    return outcomes
@@ -1,8 +1,13 @@
+import builtins
+import pkgutil
+import sys
 from contextlib import ExitStack, contextmanager
+from functools import partial
+from types import ModuleType
+from typing import Any, NamedTuple
 from unittest.mock import patch
 
-from freezegun import freeze_time
-
+from generic_grader.utils.clock import fixed_clock
 from generic_grader.utils.exceptions import (
     ExitError,
     QuitError,
@@ -14,7 +19,11 @@ from generic_grader.utils.mocks import (
     make_mock_function_raise_error,
 )
 from generic_grader.utils.options import Options
-from generic_grader.utils.resource_limits import memory_limit, time_limit
+from generic_grader.utils.resource_limits import (
+    cpu_time_limit,
+    memory_limit,
+    time_limit,
+)
 
 
 def make_turtle_done_patches(modules):
@@ -73,22 +82,149 @@ def make_exit_quit_patches():
     ]
 
 
+_BUILTIN_NAMES = {name for name in dir(builtins) if not name.startswith("_")}
+"""Names that `mock.patch` always allows creating on modules."""
+
+_MISSING = object()
+
+_owners = {}
+"""Cache of patch target owners, keyed by their dotted path."""
+
+
+def _resolve_owner(path):
+    """Return the object at dotted `path` whose attributes get patched.
+
+    Modules are looked up directly in `sys.modules`.  Other owners (e.g.
+    classes) are resolved once and cached for as long as the module they
+    were found in stays in `sys.modules`.
+    """
+    module = sys.modules.get(path)
+    if module is not None:
+        return module
+
+    cached = _owners.get(path)
+    if cached is not None:
+        module_name, module, owner = cached
+        if sys.modules.get(module_name) is module:
+            return owner
+
+    # Like `mock.patch`, import the target's module if necessary.
+    owner = pkgutil.resolve_name(path)
+    module_name = path
+    while module_name not in sys.modules and "." in module_name:
+        module_name = module_name.rpartition(".")[0]
+    _owners[path] = (module_name, sys.modules.get(module_name), owner)
+    return owner
+
+
+def _restore_nonlocal(owner, attribute, original, create):
+    """Undo a patch of an attribute that was inherited or newly created."""
+    delattr(owner, attribute)
+    if not create and not hasattr(owner, attribute):
+        setattr(owner, attribute, original)
+
+
+class _Swap(NamedTuple):
+    """A patch that replaces `attribute` of the object at `path` with `new`."""
+
+    path: str
+    attribute: str
+    new: Any
+    create: bool
+
+    def apply(self):
+        """Patch the target and return a function that undoes the patch."""
+        owner = _resolve_owner(self.path)
+        attribute = self.attribute
+        try:
+            original, local = owner.__dict__[attribute], True
+        except (AttributeError, KeyError):
+            original, local = getattr(owner, attribute, _MISSING), False
+
+        create = self.create or (
+            attribute in _BUILTIN_NAMES and isinstance(owner, ModuleType)
+        )
+        if not create and original is _MISSING:
+            raise AttributeError(f"{owner} does not have the attribute {attribute!r}")
+
+        setattr(owner, attribute, self.new)
+        if local:
+            return partial(setattr, owner, attribute, original)
+        return partial(_restore_nonlocal, owner, attribute, original, create)
+
+
+class PatchSet:
+    """A list of patches compiled once for repeated use.
+
+    Patches have the same format as `Options.patches`.  Those that replace a
+    target with a new object (optionally with `create`) are applied with
+    plain `setattr` swaps, and their owners are resolved once and cached.
+    Any other patch falls back to `unittest.mock.patch`.
+
+    ```
+    patch_set = PatchSet(make_turtle_done_patches(["vowels"]))
+    for ...:
+        with patch_set.applied():
+            ...
+    ```
+    """
+
+    def __init__(self, patches=()):
+        self.patches = [self._compile(p) for p in patches]
+
+    @staticmethod
+    def _compile(p):
+        """Return a `_Swap` for simple patches, otherwise the arguments for
+        `mock.patch`.
+        """
+        args = tuple(p.get("args", ()))  # permit missing args
+        kwargs = p.get("kwargs", {})  # permit missing kwargs
+        if (
+            len(args) == 2
+            and isinstance(args[0], str)
+            and "." in args[0]
+            and set(kwargs) <= {"create"}
+        ):
+            path, attribute = args[0].rsplit(".", 1)
+            return _Swap(path, attribute, args[1], bool(kwargs.get("create")))
+        return args, kwargs
+
+    @contextmanager
+    def applied(self):
+        """Apply the patches in order, and undo them in reverse order."""
+        with ExitStack() as stack:
+            for p in self.patches:
+                if isinstance(p, _Swap):
+                    stack.callback(p.apply())
+                else:
+                    stack.enter_context(patch(*p[0], **p[1]))
+            yield
+
+
+_exit_quit_patch_set = PatchSet(make_exit_quit_patches())
+
+
 @contextmanager
-def custom_stack(o: Options):
-    """Create a custom stack with resource limits and patches."""
+def custom_stack(o: Options, time_budget=None, patch_set=None, rng=None):
+    """Create a custom stack with resource limits and patches.
+
+    An optional `TimeBudget` limits the total wall time of repeated calls.  An
+    optional precompiled `PatchSet` is applied instead of `o.patches`.  An
+    optional `SeededRandom` supplies the random numbers.
+    """
     with ExitStack() as stack:
         # Add custom resource limits
-        stack.enter_context(time_limit(o.time_limit))
+        stack.enter_context(time_limit(o.time_limit, time_budget))
+        stack.enter_context(cpu_time_limit(o.cpu_time_limit))
         stack.enter_context(memory_limit(o.memory_limit_GB))
         if o.fixed_time:
-            stack.enter_context(freeze_time(o.fixed_time))
-        patches = (o.patches or []) + make_exit_quit_patches()
-        for p in patches:
-            stack.enter_context(
-                patch(
-                    *p.get("args", ()),  # permit missing args
-                    **p.get("kwargs", {}),  # permit missing kwargs
-                )
-            )
+            modules = [o.sub_module, o.ref_module]
+            stack.enter_context(fixed_clock(o.fixed_time, modules))
+        if rng is not None:
+            stack.enter_context(rng.applied([o.sub_module, o.ref_module]))
+        if patch_set is None:
+            patch_set = PatchSet(o.patches or [])
+        stack.enter_context(patch_set.applied())
+        stack.enter_context(_exit_quit_patch_set.applied())
 
         yield
@@ -0,0 +1,165 @@
+"""Statically pre-screen a directory of submissions.
+
+The static tests (function and class definitions, loop depth, program
+length, comments and docstrings) normally run inside each submission's
+grading run.  This module runs equivalent checks across a whole course's
+submissions at once, without importing any submitted code, and writes one
+row per submission to a CSV or JSON lines file.  Definitions are detected
+statically, so objects created by assignment (e.g. `main = lambda: ...`) are
+not counted.
+
+Usage:
+
+    python -m generic_grader.utils.prescreen submissions/ --module hello_user \\
+        --reference tests/reference.py --function main --min-loop-depth 1 \\
+        --output prescreen.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from generic_grader.utils.static import FileAnalysis
+
+
+def find_submissions(directory, module):
+    """Return the sorted paths of all files for `module` under `directory`."""
+    file_name = module.replace(".", os.path.sep) + ".py"
+    return sorted(Path(directory).glob(f"**/{file_name}"))
+
+
+def reference_metrics(file_name):
+    """Return the reference program's metrics that submissions are compared
+    against.
+    """
+    summary = FileAnalysis(file_name).summary
+    return {
+        "n_tokens": summary.n_tokens,
+        "body_comment_chars": sum(len(c) for c in summary.body_comments),
+    }
+
+
+def screen_file(
+    path, reference=None, functions=(), classes=(), min_loop_depth=0, root=None
+):
+    """Return a dictionary of static metrics and checks for one submission.
+
+    `reference` is the result of `reference_metrics`.  The length and
+    comment checks use the same limits as the `program_length` and
+    `comments` tests.
+    """
+    path = Path(path)
+    row = {"submission": str(path.relative_to(root) if root else path), "error": ""}
+    try:
+        analysis = FileAnalysis(path)
+        summary = analysis.summary
+        tree_error = analysis.syntax_error
+    except (OSError, SyntaxError, UnicodeDecodeError, tokenize.TokenError) as e:
+        row["error"] = f"{e.__class__.__name__}: {e}"
+        return row
+    if tree_error:
+        row["error"] = f"{tree_error.__class__.__name__}: {tree_error}"
+
+    comment_chars = sum(len(c) for c in summary.body_comments)
+    row["n_tokens"] = summary.n_tokens
+    row["body_comment_chars"] = comment_chars
+    if reference:
+        expected = reference["n_tokens"]
+        row["length_ratio"] = round(summary.n_tokens / max(expected, 1), 3)
+        row["length_ok"] = summary.n_tokens <= int(1.5 * expected)
+        expected = reference["body_comment_chars"]
+        row["comments_ok"] = (
+            max(int(0.5 * expected), 10) <= comment_chars <= max(int(5 * expected), 100)
+        )
+
+    if tree_error:
+        return row
+
+    row["max_loop_depth"] = summary.max_loop_depth
+    if min_loop_depth:
+        row["loop_depth_ok"] = summary.max_loop_depth >= min_loop_depth
+    row["max_complexity"] = max(summary.complexity.values())
+    row["imports"] = " ".join(summary.imports)
+    for name in functions:
+        row[f"function:{name}"] = name in summary.functions
+    for name in classes:
+        row[f"class:{name}"] = name in summary.classes
+
+    author, assignment, date, description, contributors, _ = analysis.docstring_fields
+    row["has_docstring"] = analysis.docstring is not None
+    row["author"] = author or ""
+    row["assignment"] = assignment or ""
+    row["date"] = date or ""
+    row["description_chars"] = len("".join(description))
+    row["contributors_chars"] = len("".join(contributors))
+    return row
+
+
+def prescreen(paths, workers=None, chunksize=16, **kwargs):
+    """Screen `paths` with a pool of `workers` processes.
+
+    Keyword arguments are passed to `screen_file`.  Return the rows in the
+    order of `paths`.
+    """
+    screen = partial(screen_file, **kwargs)
+    if workers == 1:
+        return [screen(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(screen, paths, chunksize=chunksize))
+
+
+def write_rows(rows, output):
+    """Write rows to `output` as JSON lines if it ends in ".jsonl", and as CSV
+    otherwise.  CSV columns are the union of all rows' keys.
+    """
+    output = Path(output)
+    if output.suffix == ".jsonl":
+        with open(output, "w") as fo:
+            for row in rows:
+                fo.write(json.dumps(row) + "\n")
+        return
+
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    with open(output, "w", newline="") as fo:
+        writer = csv.DictWriter(fo, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", help="directory of submissions")
+    parser.add_argument("--module", required=True, help="submitted module name")
+    parser.add_argument("--reference", help="reference solution file")
+    parser.add_argument(
+        "--function", action="append", default=[], help="required function"
+    )
+    parser.add_argument("--class", action="append", default=[], dest="classes")
+    parser.add_argument("--min-loop-depth", type=int, default=0)
+    parser.add_argument("--workers", type=int, help="worker processes")
+    parser.add_argument("--output", default="prescreen.csv", help=".csv or .jsonl")
+    args = parser.parse_args(argv)
+
+    paths = find_submissions(args.directory, args.module)
+    rows = prescreen(
+        paths,
+        workers=args.workers,
+        reference=args.reference and reference_metrics(args.reference),
+        functions=args.function,
+        classes=args.classes,
+        min_loop_depth=args.min_loop_depth,
+        root=args.directory,
+    )
+    write_rows(rows, args.output)
+    print(f"Screened {len(rows)} submissions into {args.output}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""A lightweight sampling profiler for submitted code."""
+
+import linecache
+import sys
+import threading
+from collections import Counter
+
+
+class SamplingProfiler:
+    """Periodically sample the calling thread's stack from a background thread.
+
+    Each sample is attributed to the innermost frame executing code from
+    `filename` (i.e. the line of submitted code that is running, or that
+    called into library code).  Samples taken while no such frame is on the
+    stack are counted only in `samples`.  The sampler reads frames with
+    `sys._current_frames()`, so it needs no signals and does not interfere
+    with the `time_limit` alarm.
+
+    ```
+    with SamplingProfiler("hello_user.py") as profiler:
+        ...
+    print(profiler.format_table())
+    ```
+    """
+
+    def __init__(self, filename, interval=0.005):
+        self.filename = filename
+        self.interval = interval
+        self.samples = 0
+        self.line_counts = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+        self._target_id = None
+
+    def __enter__(self):
+        self._target_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+    def _sample(self):
+        """Sample the target thread until stopped."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target_id)
+            self.samples += 1
+            while frame is not None:
+                if frame.f_code.co_filename == self.filename:
+                    self.line_counts[frame.f_lineno] += 1
+                    break
+                frame = frame.f_back
+            del frame  # Don't keep the target's frames alive.
+
+    def hot_lines(self, n=5):
+        """Return up to `n` (line number, sample count) pairs, hottest first."""
+        return self.line_counts.most_common(n)
+
+    def format_table(self, n=5):
+        """Return a short table of the lines where the most time was spent."""
+        hot_lines = self.hot_lines(n)
+        if not hot_lines:
+            return ""
+
+        rows = []
+        for lineno, count in hot_lines:
+            share = 100 * count / self.samples
+            code = linecache.getline(self.filename, lineno).strip()
+            rows.append(f"{lineno:6d} |{share:6.1f}% | {code}")
+
+        return (
+            "\n\nTime spent by line (sampled):\n"
+            + "  line |  time  | code\n"
+            + f'{40*"-"}\n'
+            + "\n".join(rows)
+        )
@@ -3,85 +3,100 @@
 import functools
 import os
 
-from attrs import evolve
-
 from generic_grader.utils.docs import get_wrapper, make_call_str
 from generic_grader.utils.exceptions import RefFileNotFoundError
+from generic_grader.utils.instrumentation import stage
 from generic_grader.utils.math_utils import calc_log_limit
+from generic_grader.utils.run_plan import shared_run
 from generic_grader.utils.user import RefUser, SubUser
 
 text_wrapper = get_wrapper()
 
 
-def reference_test(func):
-    """Decorator for tests that make comparisons between files produced by a
-    reference program and student submitted program.
+def run_reference_and_student(self, options):
+    """Run the reference and submitted code, leaving the users in
+    `self.ref_user` and `self.student_user`, and their files renamed with
+    "ref_" and "sub_" prefixes.
     """
+    o = options
 
-    @functools.wraps(func)
-    def wrapper(self, options):
-        o = options
-
-        # Make sure the expected output files don't already exist.
-        for filename in o.filenames:
-            try:
-                os.remove(filename)
-            except FileNotFoundError:
-                pass
+    # Make sure the expected output files don't already exist.
+    for filename in o.filenames:
+        try:
+            os.remove(filename)
+        except FileNotFoundError:
+            pass
 
-        # Run an optional initialization function.
-        if o.init:
-            o.init(self, o)
+    # Run an optional initialization function.
+    if o.init:
+        o.init(self, o)
 
+    with stage("reference run"):
         # Create the reference user.
         self.ref_user = RefUser(self, options=o)
 
         # Run the reference code.
         self.ref_user.call_obj()
-        log_limit = calc_log_limit(self.ref_user.log)  # Get log_limit here
+    log_limit = calc_log_limit(self.ref_user.log)  # Get log_limit here
 
-        # Rename reference files
-        for filename in o.filenames:
-            # Silent overwrite if exists.
-            try:
-                os.replace(filename, f"ref_{filename}")
-            except FileNotFoundError:
-                raise RefFileNotFoundError(filename)
+    # Rename reference files
+    for filename in o.filenames:
+        # Silent overwrite if exists.
+        try:
+            os.replace(filename, f"ref_{filename}")
+        except FileNotFoundError:
+            raise RefFileNotFoundError(filename)
 
-        sub_o = evolve(o, log_limit=log_limit)
+    sub_o = o.derive(log_limit=log_limit)
 
-        # Run an optional initialization function.
-        if sub_o.init:
-            sub_o.init(self, sub_o)
+    # Run an optional initialization function.
+    if sub_o.init:
+        sub_o.init(self, sub_o)
 
+    with stage("student run"):
         # Create the student user.
         self.student_user = SubUser(self, options=sub_o)
+        if o.stop_on_divergence:
+            self.student_user.log.expect(self.ref_user.log.getvalue())
 
         # Run the submitted code.
         self.student_user.call_obj()
 
-        # Rename submission files.
-        for filename in o.filenames:
-            message = ""
-            try:
-                # Silent overwrite if exists.
-                os.replace(filename, f"sub_{filename}")
-            except FileNotFoundError:
-                call_str = make_call_str(o.obj_name, o.args, o.kwargs)
-                self.failureException = FileNotFoundError
-                message = (
-                    "\n\nHint:\n"
-                    + text_wrapper.fill(
-                        f"The file `{filename}` was not found.  Make sure your"
-                        f" `{o.obj_name}` function creates a file named"
-                        f" `{filename}` when called as `{call_str}`"
-                        + (o.entries and f" with entries={o.entries}." or ".")
-                    )
-                    + f"\n\n{self.student_user.format_log()}"
+    # Rename submission files.
+    for filename in o.filenames:
+        message = ""
+        try:
+            # Silent overwrite if exists.
+            os.replace(filename, f"sub_{filename}")
+        except FileNotFoundError:
+            call_str = make_call_str(o.obj_name, o.args, o.kwargs)
+            self.failureException = FileNotFoundError
+            message = (
+                "\n\nHint:\n"
+                + text_wrapper.fill(
+                    f"The file `{filename}` was not found.  Make sure your"
+                    f" `{o.obj_name}` function creates a file named"
+                    f" `{filename}` when called as `{call_str}`"
+                    + (o.entries and f" with entries={o.entries}." or ".")
                 )
-            if message:
-                self.fail(message)
+                + f"\n\n{self.student_user.format_log()}"
+            )
+        if message:
+            self.fail(message)
+
+
+def reference_test(func):
+    """Decorator for tests that make comparisons between files produced by a
+    reference program and student submitted program.  Identical runs are
+    shared between tests when their classes declare `run_params` and are
+    planned with `plan_runs` (see `generic_grader.utils.run_plan`).
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, options):
+        shared_run(self, options, run_reference_and_student)
 
-        func(self, o)
+        with stage("comparison"):
+            func(self, options)
 
     return wrapper
@@ -2,32 +2,113 @@ import os
 import resource
 import signal
 import sys
-from contextlib import contextmanager
+import time
+from contextlib import ExitStack, contextmanager
 
 from generic_grader.utils.exceptions import UserTimeoutError
 
 
-@contextmanager
-def time_limit(seconds):
-    """A context manager to limit the execution time of an enclosed block.
-    Adapted from https://stackoverflow.com/a/601168
-    """
+def _format_seconds(seconds):
+    """Return a duration in seconds as words (e.g. "1 second", "0.5 seconds")."""
+    return f"{seconds:g}" + (" second" if seconds == 1 else " seconds")
 
-    def handler(signum, frame):
-        raise UserTimeoutError(
-            f"The time limit for this test is {seconds}"
-            + ((seconds == 1 and " second.") or " seconds.")
+
+class TimeBudget:
+    """Track the wall time used by repeated calls against a total budget."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.used = 0.0
+
+    @property
+    def remaining(self):
+        """Return the unused part of the budget in seconds."""
+        return self.seconds - self.used
+
+    def exhausted_error(self):
+        """Return the error raised when the budget runs out."""
+        return UserTimeoutError(
+            "The total time limit for all calls in this test is "
+            + _format_seconds(self.seconds)
+            + "."
         )
 
-    signal.signal(signal.SIGALRM, handler)
+    @contextmanager
+    def track(self):
+        """Charge the wall time of the enclosed block to the budget."""
+        if self.remaining <= 0:
+            raise self.exhausted_error()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.used += time.perf_counter() - start
+
 
-    signal.alarm(seconds)  # Set an alarm to interrupt after seconds seconds.
+@contextmanager
+def _interval_timer(which, signum, seconds, make_error):
+    """Raise the error from `make_error()` once interval timer `which` has
+    counted down `seconds`.
+    """
 
+    def handler(signum, frame):
+        raise make_error()
+
+    old_handler = signal.signal(signum, handler)
+    signal.setitimer(which, seconds)
     try:
         yield
     finally:
-        # Cancel the alarm.
-        signal.alarm(0)
+        # Cancel the timer.
+        signal.setitimer(which, 0)
+        signal.signal(signum, old_handler)
+
+
+@contextmanager
+def time_limit(seconds, budget=None):
+    """A context manager to limit the wall time of an enclosed block.
+
+    The limit may be fractional.  If a `TimeBudget` is given, the block is
+    also limited to the budget's remaining time, and its wall time is charged
+    to the budget.  A limit of 0 disables the limit.
+    Adapted from https://stackoverflow.com/a/601168
+    """
+    if budget is not None and budget.remaining < (seconds or float("inf")):
+        seconds, make_error = budget.remaining, budget.exhausted_error
+    else:
+
+        def make_error():
+            return UserTimeoutError(
+                f"The time limit for this test is {_format_seconds(seconds)}."
+            )
+
+    with ExitStack() as stack:
+        if budget is not None:
+            stack.enter_context(budget.track())
+        if seconds:
+            stack.enter_context(
+                _interval_timer(signal.ITIMER_REAL, signal.SIGALRM, seconds, make_error)
+            )
+        yield
+
+
+@contextmanager
+def cpu_time_limit(seconds):
+    """A context manager to limit the CPU time (user and system) used while
+    running an enclosed block.  The limit may be fractional.  A limit of 0
+    disables the limit.
+    """
+    if not seconds:
+        yield
+        return
+
+    def make_error():
+        return UserTimeoutError(
+            f"The CPU time limit for this test is {_format_seconds(seconds)}."
+        )
+
+    with _interval_timer(signal.ITIMER_PROF, signal.SIGPROF, seconds, make_error):
+        yield
 
 
 def _get_current_vm_bytes():
@@ -43,31 +124,38 @@ def _get_current_vm_bytes():
     return 0  # pragma: no cover
 
 
+GiB = 2**30
+
+
+def _memory_error(max_gibibytes):
+    """Return the error raised when submitted code uses too much memory."""
+    return MemoryError(
+        "Your program used more than the maximum allowed memory"
+        f" of {max_gibibytes} GiB."
+    )
+
+
 @contextmanager
 def memory_limit(max_gibibytes):
     """A context manager to limit memory usage while running submitted code.
 
     Sets RLIMIT_AS relative to the current virtual memory usage so that
     the enclosed code gets exactly max_gibibytes of additional address
-    space, regardless of how much memory the Python runtime and its
-    libraries already consume.
+    space, regardless of how much memory the Python runtime, its libraries
+    and earlier calls (e.g. their returned values) already consume.  The
+    usage is read on every entry, which takes microseconds.
     """
-    GiB = 2**30
-    max_bytes = int(max_gibibytes * GiB)
-    current_vm = _get_current_vm_bytes()
-
     soft, hard = resource.getrlimit(resource.RLIMIT_AS)
-    resource.setrlimit(resource.RLIMIT_AS, (current_vm + max_bytes, hard))
+    resource.setrlimit(
+        resource.RLIMIT_AS,
+        (_get_current_vm_bytes() + int(max_gibibytes * GiB), hard),
+    )
     try:
         yield
     except MemoryError:
-        # Restore the previous limits
+        # Restore the previous limits before building the message.
         resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
-        message = (
-            "Your program used more than the maximum allowed memory"
-            f" of {max_gibibytes} GiB."
-        )
-        raise MemoryError(message).with_traceback(sys.exc_info()[2])
-    else:
+        raise _memory_error(max_gibibytes).with_traceback(sys.exc_info()[2])
+    finally:
         # Restore the previous limits
         resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
@@ -0,0 +1,226 @@
+"""Write Gradescope results as each test finishes.
+
+gradescope-utils' `JSONTestRunner` keeps every result (and, like any
+`unittest` result, every formatted failure) in memory and writes
+`results.json` once the whole suite is done.  A large failing suite holds
+all of its failure messages, each with its IO log, until the end, and a
+crash loses every result.
+
+`StreamingJSONTestRunner` writes each test's result to the results file as
+soon as the test finishes, and rewrites only the short summary after it, so
+the file is valid JSON with the results so far after every test.  Outputs
+longer than `max_output` characters are shortened, and failures are not
+kept in memory.
+
+```
+python -m generic_grader.utils.results tests/config.py --output results.json
+```
+"""
+
+import argparse
+import json
+import sys
+import time
+import unittest
+from unittest.signals import registerResult
+
+from gradescope_utils.autograder_utils.json_test_runner import JSONTestResult
+
+MAX_OUTPUT_CHARS = 10_000
+"""Characters of output kept for each test."""
+
+
+def truncate(text, limit=MAX_OUTPUT_CHARS):
+    """Return `text` shortened to about `limit` characters by dropping the
+    middle, which keeps both the failure message and the end of the log.
+    """
+    if len(text) <= limit:
+        return text
+    head = limit // 2
+    tail = limit - head
+    omitted = len(text) - head - tail
+    return (
+        text[:head]
+        + f"\n\n... ({omitted} characters omitted) ...\n\n"
+        + text[len(text) - tail :]
+    )
+
+
+class ResultsFile:
+    """A Gradescope results file that is valid JSON after every result."""
+
+    def __init__(self, fo, header=None):
+        self.fo = fo
+        self.n_tests = 0
+        self.score = 0.0
+        self.leaderboard = []
+        self.summary = {}
+        fo.write("{")
+        for key, value in (header or {}).items():
+            fo.write(f"{json.dumps(key)}: {json.dumps(value)}, ")
+        fo.write('"tests": [')
+        self._end = fo.tell()  # The end of the last result.
+        self._write_summary()
+
+    def _write_summary(self):
+        """Close the list of tests, write the summary, and flush."""
+        summary = {"leaderboard": self.leaderboard, "score": self.score}
+        summary.update(self.summary)
+        self.fo.write("\n], " + json.dumps(summary)[1:] + "\n")
+        self.fo.truncate()
+        self.fo.flush()
+
+    def add_test(self, result):
+        """Append a test's result."""
+        self.fo.seek(self._end)
+        self.fo.write(("," if self.n_tests else "") + "\n" + json.dumps(result))
+        self._end = self.fo.tell()
+        self.n_tests += 1
+        self.score += result.get("score", 0.0)
+        self._write_summary()
+
+    def add_leaderboard_entry(self, entry):
+        """Add an entry to the leaderboard."""
+        self.leaderboard.append(entry)
+        self.fo.seek(self._end)
+        self._write_summary()
+
+    def finish(self, **summary):
+        """Add the final summary items, e.g. `execution_time`."""
+        self.summary.update(summary)
+        self.fo.seek(self._end)
+        self._write_summary()
+
+
+class StreamingJSONTestResult(JSONTestResult):
+    """A test result that streams each result to a `ResultsFile`.
+
+    Failures and errors are counted, but their formatted messages are not
+    kept.
+    """
+
+    def __init__(
+        self,
+        results_file,
+        failure_prefix="Test Failed: ",
+        max_output=MAX_OUTPUT_CHARS,
+        include_metrics=False,
+    ):
+        super().__init__(None, True, 1, None, results_file.leaderboard, failure_prefix)
+        self.results_file = results_file
+        self.max_output = max_output
+        self.include_metrics = include_metrics
+
+    def buildResult(self, test, err=None):
+        result = super().buildResult(test, err)
+        if "output" in result:
+            result["output"] = truncate(result["output"], self.max_output)
+        if self.include_metrics:
+            method = getattr(test, test._testMethodName)
+            metrics = getattr(method, "__metrics__", None)
+            if metrics is not None:
+                result.setdefault("extra_data", {})["metrics"] = metrics
+        return result
+
+    def processResult(self, test, err=None):
+        if self.getLeaderboardData(test)[0]:
+            self.results_file.add_leaderboard_entry(self.buildLeaderboardEntry(test))
+        else:
+            self.results_file.add_test(self.buildResult(test, err))
+
+    def _add_problem(self, problems, test, err):
+        """Record a failure or error without keeping its message."""
+        problems.append((test, ""))
+        self._mirrorOutput = False  # Don't print the output on failure.
+        self.processResult(test, err)
+        if self.failfast:
+            self.stop()
+
+    def addError(self, test, err):
+        self._add_problem(self.errors, test, err)
+
+    def addFailure(self, test, err):
+        self._add_problem(self.failures, test, err)
+
+
+class StreamingJSONTestRunner:
+    """A test runner that streams Gradescope results to a file.
+
+    It takes the same options as gradescope-utils' `JSONTestRunner`, except
+    `post_processor`, which needs all of the results at once.  Metrics (see
+    `generic_grader.utils.instrumentation`) can be included in each result's
+    `extra_data`.
+    """
+
+    def __init__(
+        self,
+        filename="results.json",
+        failfast=False,
+        buffer=True,
+        visibility=None,
+        stdout_visibility=None,
+        failure_prefix="Test Failed: ",
+        max_output=MAX_OUTPUT_CHARS,
+        include_metrics=False,
+    ):
+        self.filename = filename
+        self.failfast = failfast
+        self.buffer = buffer
+        self.header = {}
+        if visibility:
+            self.header["visibility"] = visibility
+        if stdout_visibility:
+            self.header["stdout_visibility"] = stdout_visibility
+        self.failure_prefix = failure_prefix
+        self.max_output = max_output
+        self.include_metrics = include_metrics
+
+    def run(self, test):
+        """Run the given test case or test suite."""
+        with open(self.filename, "w") as fo:
+            results_file = ResultsFile(fo, self.header)
+            result = StreamingJSONTestResult(
+                results_file,
+                self.failure_prefix,
+                self.max_output,
+                self.include_metrics,
+            )
+            registerResult(result)
+            result.failfast = self.failfast
+            result.buffer = self.buffer
+            start = time.time()
+            result.startTestRun()
+            try:
+                test(result)
+            finally:
+                result.stopTestRun()
+                results_file.finish(execution_time=format(time.time() - start, "0.2f"))
+        return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tests", nargs="+", help="test files or directories")
+    parser.add_argument("--output", default="results.json", help="results file")
+    parser.add_argument("--max-output", type=int, default=MAX_OUTPUT_CHARS)
+    parser.add_argument("--metrics", action="store_true", help="include metrics")
+    args = parser.parse_args(argv)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    for path in args.tests:
+        if path.endswith(".py"):
+            module = path.removesuffix(".py").replace("/", ".")
+            suite.addTests(loader.loadTestsFromName(module))
+        else:
+            suite.addTests(loader.discover(path))
+
+    runner = StreamingJSONTestRunner(
+        args.output, max_output=args.max_output, include_metrics=args.metrics
+    )
+    runner.run(suite)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
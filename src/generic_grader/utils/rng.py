@@ -0,0 +1,282 @@
+"""Seed and record the random numbers drawn by submitted code.
+
+`SeededRandom` gives a user its own reproducible stream of random numbers.
+While it is applied, the functions of the `random` module (and the names
+that submitted code imported from it, e.g. `from random import randint`)
+draw from the user's generator, which counts its draws.  If numpy is
+imported, its legacy global generator (`numpy.random.randint` etc.) is also
+switched to the user's stream, and calls that consume it are counted.
+
+Sources that can't be seeded, like `secrets`, `os.urandom`,
+`random.SystemRandom` and generators created by the submitted code, are left
+alone.  So are the names imported from `random` by other modules (e.g. a
+helper module of the submission), but calls through them still change the
+`random` module's hidden generator, and are counted as `unseeded_draws`.
+
+```
+rng = SeededRandom(42)
+with rng.applied(["random_vowels"]):
+    ...
+print(rng.draws)
+```
+"""
+
+import random
+import sys
+from contextlib import contextmanager
+
+_real_inst = random._inst
+"""The hidden generator behind the `random` module's functions."""
+
+_ENTRY_POINTS = {
+    name: value
+    for name, value in vars(random).items()
+    if getattr(value, "__self__", None) is _real_inst
+}
+"""The `random` module's functions bound to the hidden generator."""
+
+
+class RecordingRandom(random.Random):
+    """A `random.Random` that counts the raw draws behind each random value."""
+
+    def __init__(self, seed=None):
+        self.draws = 0
+        super().__init__(seed)
+
+    def random(self):
+        self.draws += 1
+        return super().random()
+
+    def getrandbits(self, k):
+        self.draws += 1
+        return super().getrandbits(k)
+
+
+MAX_TRACED_DRAWS = 100
+"""Number of draws after which a traced call is considered untraceable."""
+
+
+class UntraceableDraw(BaseException):
+    """Raised to abandon a traced call when a draw can't be enumerated.
+
+    It derives from `BaseException` so that it passes through the error
+    handling of `call_obj`.
+    """
+
+
+class TracingRandom(RecordingRandom):
+    """A `random.Random` that makes the discrete draws of `randrange`,
+    `randint` and `choice` by index, and records how many values each of them
+    could have taken.
+
+    The first draws take the indices in `forced`, and later ones take the
+    first value.  Any other draw (e.g. `random()`, `uniform()` or `shuffle()`)
+    raises `UntraceableDraw`, as does reseeding it or restoring its state,
+    since later draws would no longer be free to take every value.
+    """
+
+    def __init__(self, forced=()):
+        self.forced = forced
+        self.sizes = []
+        self._tracing = False
+        super().__init__(0)
+        self._tracing = True
+
+    def _index(self, size):
+        """Record a draw from `size` values and return the index to use."""
+        n = len(self.sizes)
+        if n >= MAX_TRACED_DRAWS:
+            raise UntraceableDraw()
+        self.sizes.append(size)
+        return self.forced[n] if n < len(self.forced) else 0
+
+    def randrange(self, start, stop=None, step=1):
+        try:
+            values = range(start) if stop is None else range(start, stop, step)
+        except TypeError:
+            values = None
+        if not values or (stop is None and step != 1):
+            return super().randrange(start, stop, step)  # Raise the usual error.
+        return values[self._index(len(values))]
+
+    def choice(self, seq):
+        if not len(seq):
+            return super().choice(seq)  # Raise the usual error.
+        return seq[self._index(len(seq))]
+
+    def random(self):
+        raise UntraceableDraw()
+
+    def getrandbits(self, k):
+        raise UntraceableDraw()
+
+    def seed(self, *args, **kwargs):
+        if self._tracing:
+            raise UntraceableDraw()
+        super().seed(*args, **kwargs)
+
+    def setstate(self, state):
+        raise UntraceableDraw()
+
+
+class SeededRandom:
+    """A user's seeded stream of random numbers, reusable across calls.
+
+    An optional `generator` replaces the seeded `RecordingRandom`.
+    """
+
+    def __init__(self, seed, generator=None):
+        self.seed = seed
+        self.generator = RecordingRandom(seed) if generator is None else generator
+        self.numpy_draws = 0
+        self.unseeded_draws = 0  # Calls that drew from the hidden generator.
+        self._numpy_state = None  # Created on first use.
+
+    @property
+    def draws(self):
+        """The number of draws made from the seeded generators."""
+        return self.generator.draws + self.numpy_draws
+
+    def _swaps(self, modules):
+        """Return the (owner, attribute, seeded function) triples that route
+        the `random` functions to the user's generator.
+        """
+        fakes = {
+            id(real): getattr(self.generator, name)
+            for name, real in _ENTRY_POINTS.items()
+        }
+        swaps = [
+            (random, name, fakes[id(real)]) for name, real in _ENTRY_POINTS.items()
+        ]
+        for name in modules:
+            module = sys.modules.get(name)
+            if module is None:
+                continue
+            for attr, value in list(vars(module).items()):
+                fake = fakes.get(id(value))
+                if fake is not None:
+                    swaps.append((module, attr, fake))
+        return swaps
+
+    @contextmanager
+    def _numpy_applied(self):
+        """Switch numpy's global generator to the user's stream, if numpy is
+        imported.
+        """
+        np = sys.modules.get("numpy")
+        if np is None:
+            yield
+            return
+        if self._numpy_state is None:
+            self._numpy_state = np.random.RandomState(self.seed).get_state()
+        saved = np.random.get_state()
+        np.random.set_state(self._numpy_state)
+        try:
+            yield
+        finally:
+            state = np.random.get_state()
+            if state[2] != self._numpy_state[2] or not np.array_equal(
+                state[1], self._numpy_state[1]
+            ):
+                self.numpy_draws += 1
+            self._numpy_state = state
+            np.random.set_state(saved)
+
+    @contextmanager
+    def applied(self, modules=()):
+        """Draw from the user's stream in the `random` module, in the
+        namespaces of the named modules that are already imported, and in
+        numpy's global generator.
+        """
+        swaps = self._swaps(modules)
+        originals = [(owner, attr, getattr(owner, attr)) for owner, attr, _ in swaps]
+        for owner, attr, fake in swaps:
+            setattr(owner, attr, fake)
+        hidden_state = _real_inst.getstate()
+        try:
+            with self._numpy_applied():
+                yield self
+        finally:
+            if _real_inst.getstate() != hidden_state:
+                self.unseeded_draws += 1
+            for owner, attr, original in reversed(originals):
+                setattr(owner, attr, original)
+
+
+def trial_seeds(seed, n=2):
+    """Return the seeds of `n` runs whose random numbers should differ: `seed`
+    and the `n - 1` seeds after it, or all None (unseeded) if `seed` is None.
+    """
+    return [None if seed is None else seed + i for i in range(n)]
+
+
+def no_draws_hint(user):
+    """Return a hint if a seeded `user` never drew a random number, else "".
+
+    No hint is given if the `random` module's hidden generator changed, since
+    the draws may have been made through names that weren't seeded.
+    """
+    if user.rng is None or user.rng.draws or user.rng.unseeded_draws:
+        return ""
+    return "  Your program did not draw any numbers from the `random` module."
+
+
+CONFIRMING_CALLS = 3
+"""Ordinary calls that must return traced values before an enumeration is
+trusted.
+"""
+
+
+def _enumerate_outcomes(user, max_calls):
+    """Enumerate the outcomes of traced calls (see `trace_outcomes`)."""
+    outcomes, pending, calls = set(), [()], 0
+    while pending:
+        forced = pending.pop()
+        generator = TracingRandom(forced)
+        user.rng = SeededRandom(0, generator)
+        calls += 1
+        try:
+            outcomes.add(user.call_obj())
+        except UntraceableDraw:
+            return outcomes, False, calls
+        sizes = generator.sizes
+        if not sizes or user.rng.numpy_draws or user.rng.unseeded_draws:
+            return outcomes, False, calls
+
+        # Branch on every other value of the draws after the forced ones.
+        branches = sum(size - 1 for size in sizes[len(forced) :])
+        if calls + len(pending) + branches > max_calls:
+            return outcomes, False, calls
+        path = forced + (0,) * (len(sizes) - len(forced))
+        for n in range(len(forced), len(sizes)):
+            pending.extend(path[:n] + (i,) for i in range(1, sizes[n]))
+    return outcomes, True, calls
+
+
+def trace_outcomes(user, max_calls):
+    """Enumerate the values returned by `user.call_obj()` over every sequence
+    of traced draws (see `TracingRandom`), with one call per sequence.
+
+    Return the set of returned values, whether it is complete, and the
+    number of calls made.  It is incomplete if a draw can't be traced, a call
+    draws nothing traceable or draws from an untraced source, or
+    more than `max_calls` calls would be needed.  A complete set is then
+    confirmed by `CONFIRMING_CALLS` ordinary calls, since the returned value
+    may also depend on randomness that isn't traced (e.g. a generator created
+    by the submitted code); it is incomplete if any of them returns a value
+    outside of it.
+    """
+    rng = user.rng
+    try:
+        outcomes, complete, calls = _enumerate_outcomes(user, max_calls)
+    finally:
+        user.rng = rng
+    if complete:
+        for _ in range(min(CONFIRMING_CALLS, max_calls - calls)):
+            calls += 1
+            outcome = user.call_obj()
+            if outcome not in outcomes:
+                outcomes.add(outcome)
+                complete = False
+                break
+    return outcomes, complete, calls
@@ -0,0 +1,286 @@
+"""Share identical reference and student runs across reference tests.
+
+A typical test configuration builds several reference tests (e.g. output
+lines, output values, returned values and closed files) from the same
+`obj_name`, `args` and `entries`, and each of them runs the same reference
+and student code.  `plan_runs` collects the options of the built test classes
+and counts the tests that need each distinct execution.  An execution needed
+by more than one test then runs once, and every test that needs it is handed
+the captured users (IO log, interactions and returned values), the produced
+files, the warnings and the failure, if any, of that single run.
+
+```
+test_lines = output_lines_match_reference.build(the_options)
+test_returns = function_return_values_match_reference.build(the_options)
+plan_runs(test_lines, test_returns)
+```
+
+Built reference test classes declare the options of their tests in a
+`run_params` class attribute.  Executions are the same when all of their
+`EXECUTION_FIELDS` options are equal, which is only decided for plain values
+(e.g. numbers, strings, and tuples, lists, sets and dicts of them) and for
+functions, classes and modules, which match only themselves.  Tests with any
+other option value (e.g. a numpy array argument) or an `init` function, which
+may have side effects, always run on their own.  The comparison must not
+modify the returned values.
+"""
+
+import copy
+import datetime
+import os
+import types
+import warnings
+from collections import Counter
+
+EXECUTION_FIELDS = (
+    "init",
+    "ref_module",
+    "sub_module",
+    "patches",
+    "entries",
+    "log_limit",
+    "stop_on_divergence",
+    "fixed_time",
+    "seed",
+    "debug",
+    "time_limit",
+    "cpu_time_limit",
+    "time_budget",
+    "profile_timeouts",
+    "memory_limit_GB",
+    "obj_name",
+    "args",
+    "kwargs",
+    "filenames",
+    "n_workers",
+)
+"""Options that configure the execution."""
+
+COMPARISON_FIELDS = frozenset(
+    {
+        "weight",
+        "hint",
+        "required_files",
+        "ignored_files",
+        "interaction",
+        "start",
+        "n_lines",
+        "line_n",
+        "value_n",
+        "ratio",
+        "expected_set",
+        "expected_perms",
+        "validator",
+        "expected_minimum_depth",
+        "prop",
+        "prop_kwargs",
+        "expected_distribution",
+        "effect_size",
+        "relative_tolerance",
+        "absolute_tolerance",
+        "mode",
+        "ref_image",
+        "sub_image",
+        "region_inner",
+        "region_outer",
+        "threshold",
+        "delta",
+        "expected_words",
+        "random_func_calls",
+        "random_chance_tolerance",
+    }
+)
+"""Options that only configure the comparison, not the execution."""
+
+_PLAIN_TYPES = frozenset(
+    {
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+    }
+)
+"""Types whose values are compared by value."""
+
+_IDENTITY_TYPES = (
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.ModuleType,
+    type,
+)
+"""Types whose values match only themselves."""
+
+_plan = None
+"""The active run plan, if any."""
+
+
+def _key(value):
+    """Return a hashable key that is equal for equal values of the same
+    types, or raise TypeError if `value` can't be compared reliably.
+    """
+    kind = type(value)
+    if kind in _PLAIN_TYPES:
+        return kind, value
+    if kind in (tuple, list):
+        return kind, tuple(map(_key, value))
+    if kind in (set, frozenset):
+        return kind, frozenset(map(_key, value))
+    if kind is dict:
+        return kind, tuple((_key(k), _key(v)) for k, v in value.items())
+    if isinstance(value, _IDENTITY_TYPES):
+        return _IDENTITY_TYPES, value
+    raise TypeError(f"{kind.__name__} values aren't compared")
+
+
+def execution_signature(options):
+    """Return a hashable signature of the execution described by `options`,
+    or None if it can't be shared.
+    """
+    if options.init is not None:
+        return None  # It may have side effects that the tests rely on.
+    try:
+        return tuple(_key(getattr(options, name)) for name in EXECUTION_FIELDS)
+    except TypeError:
+        return None
+
+
+class CapturedRun:
+    """The outcome of one reference test's reference and student runs."""
+
+    def __init__(self, test, options, run):
+        """Call `run(test, options)` and capture its outcome.  Warnings are
+        recorded, and are re-issued along with any error by `release`.
+        """
+        self.error = None
+        with warnings.catch_warnings(record=True) as self.warning_list:
+            warnings.simplefilter("always")
+            try:
+                run(test, options)
+            except Exception as e:
+                self.error = e
+                self.failure_exception = getattr(test, "failureException", None)
+        self.ref_user = copy.copy(getattr(test, "ref_user", None))
+        self.student_user = copy.copy(getattr(test, "student_user", None))
+        self.files = {}
+        for filename in options.filenames:
+            for name in (f"ref_{filename}", f"sub_{filename}"):
+                try:
+                    with open(name, "rb") as fo:
+                        self.files[name] = fo.read()
+                except FileNotFoundError:
+                    pass
+
+    def release(self, test):
+        """Re-issue the captured warnings and raise the captured error."""
+        for w in self.warning_list:
+            warnings.warn_explicit(
+                w.message, w.category, w.filename, w.lineno, source=w.source
+            )
+        if self.error is not None:
+            test.failureException = self.failure_exception
+            raise self.error.with_traceback(None)
+
+    def replay(self, test, options):
+        """Give `test` the captured outcome as if it had run `options`."""
+        for filename in options.filenames:
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                pass
+        for name, data in self.files.items():
+            with open(name, "wb") as fo:
+                fo.write(data)
+
+        if self.ref_user is not None:
+            test.ref_user = copy.copy(self.ref_user)
+            test.ref_user.test = test
+            test.ref_user.options = options
+        if self.student_user is not None:
+            test.student_user = copy.copy(self.student_user)
+            test.student_user.test = test
+            test.student_user.options = options.derive(
+                log_limit=self.student_user.options.log_limit
+            )
+        self.release(test)
+
+
+class RunPlan:
+    """Counts of the reference tests that need each execution."""
+
+    def __init__(self, test_classes=()):
+        self.remaining = Counter()
+        self.runs = {}
+        for cls in test_classes:
+            self.add_class(cls)
+
+    def add(self, options):
+        """Plan one more test that runs `options`."""
+        signature = execution_signature(options)
+        if signature is not None:
+            self.remaining[signature] += 1
+
+    def add_class(self, cls):
+        """Plan the reference tests of the built test class `cls`, whose
+        options are declared in its `run_params`.
+        """
+        for param in getattr(cls, "run_params", ()):
+            self.add(param.args[0])
+
+    @property
+    def shared(self):
+        """The number of planned tests that reuse another test's run."""
+        return sum(n - 1 for n in self.remaining.values() if n > 1)
+
+    def run(self, test, options, run):
+        """Call `run(test, options)`, or replay the outcome of an identical
+        earlier call if the execution is shared.
+        """
+        signature = execution_signature(options)
+        if signature is None:
+            return run(test, options)
+        remaining = self.remaining.get(signature, 0)
+        captured = self.runs.get(signature)
+        if captured is None and remaining < 2:
+            # Unplanned, or the last (or only) test that needs this run.
+            self.remaining.pop(signature, None)
+            return run(test, options)
+
+        self.remaining[signature] = remaining - 1
+        if remaining <= 1:  # The last test that needs the captured run.
+            del self.remaining[signature]
+            self.runs.pop(signature, None)
+        if captured is None:
+            captured = self.runs[signature] = CapturedRun(test, options, run)
+            captured.release(test)
+        else:
+            captured.replay(test, options)
+
+
+def plan_runs(*test_classes):
+    """Share identical runs among the reference tests of the built test
+    classes, and return the active plan.
+    """
+    global _plan
+    _plan = RunPlan(test_classes)
+    return _plan
+
+
+def clear_plan():
+    """Stop sharing runs."""
+    global _plan
+    _plan = None
+
+
+def shared_run(test, options, run):
+    """Call `run(test, options)` through the active plan, if any."""
+    if _plan is None:
+        return run(test, options)
+    return _plan.run(test, options, run)
@@ -42,6 +42,12 @@ def safe_assert_equal(test_case, actual, expected, msg=""):
     values a direct ``!=`` check is used and the error message shows a
     truncated representation of both sides.
     """
+    try:
+        if (actual == expected) is True:
+            return  # Skip formatting the values of a passing comparison.
+    except Exception:
+        pass  # Let assertEqual (or !=) report the problem.
+
     fmt_actual = pprint.pformat(actual)
     fmt_expected = pprint.pformat(expected)
 
@@ -53,7 +59,7 @@ def safe_assert_equal(test_case, actual, expected, msg=""):
         # Too large — compare directly, truncate the repr.
         if actual != expected:
             detail = f"{_safe_repr.repr(actual)} != {_safe_repr.repr(expected)}"
-            raise AssertionError(detail + msg)
+            raise AssertionError(detail + str(msg))
 
 
 def make_diff(actual, expected):
@@ -0,0 +1,111 @@
+"""Threshold-aware fuzzy comparison of strings.
+
+Tests with `ratio < 1` pass when the normalized Levenshtein similarity of the
+actual and expected strings (`1 - distance / longest length`) reaches the
+ratio.  Computing the full distance of two long logs is O(n*m), but only
+whether it is small enough matters.  `similarity_at_least` gives rapidfuzz
+the largest distance that still passes, so it only fills a band of the edit
+matrix around its diagonal and gives up as soon as the ratio can no longer
+be reached.  `line_report` shows students which lines diverge.
+"""
+
+import reprlib
+from collections.abc import Sized
+from itertools import zip_longest
+
+MAX_REPORTED_LINES = 10
+"""Number of dissimilar lines shown by `line_report`."""
+
+_line_repr = reprlib.Repr()
+_line_repr.maxstring = 100
+_line_repr.maxother = 100
+
+
+def _similarity(distance, longest):
+    """Return the normalized similarity exactly as rapidfuzz computes it."""
+    return 1.0 - distance / longest if longest else 1.0
+
+
+def max_distance(longest, ratio):
+    """Return the largest edit distance between strings whose longest has
+    `longest` characters that still reaches a similarity of `ratio`, or -1 if
+    none does.
+    """
+    distance = min(max(int((1 - ratio) * longest), 0), longest)
+    # Correct for rounding so the result agrees with `_similarity`.
+    while distance < longest and _similarity(distance + 1, longest) >= ratio:
+        distance += 1
+    while distance >= 0 and _similarity(distance, longest) < ratio:
+        distance -= 1
+    return distance
+
+
+def _comparable(value):
+    """Return `value` as something rapidfuzz can compare: strings, other
+    sequences and None unchanged, and anything else as its `str()`.
+    """
+    if value is None or isinstance(value, Sized):
+        return value
+    return str(value)
+
+
+def similarity_at_least(actual, expected, ratio):
+    """Return the normalized similarity of two strings (or sequences) if it
+    is at least `ratio`, and None otherwise.  None is 0% similar to anything.
+    """
+    from rapidfuzz.distance import Levenshtein
+
+    if actual is None or expected is None:
+        return 0.0 if ratio <= 0 else None
+    longest = max(len(actual), len(expected))
+    cutoff = max_distance(longest, ratio)
+    # The difference in length is a lower bound on the distance.
+    if cutoff < abs(len(actual) - len(expected)):
+        return None
+    distance = Levenshtein.distance(actual, expected, score_cutoff=cutoff)
+    if distance > cutoff:
+        return None
+    return _similarity(distance, longest)
+
+
+def line_report(actual, expected, ratio, limit=MAX_REPORTED_LINES):
+    """Return a description of the first `limit` lines of the actual and
+    expected text whose similarity is below `ratio`, or "" if there are none.
+    """
+    from rapidfuzz.distance.Levenshtein import normalized_similarity
+
+    rows = []
+    pairs = zip_longest(actual.splitlines(), expected.splitlines())
+    for n, (actual_line, expected_line) in enumerate(pairs, start=1):
+        similarity = normalized_similarity(actual_line or "", expected_line or "")
+        if actual_line is None or expected_line is None or similarity < ratio:
+            actual_line = (
+                "(missing)" if actual_line is None else _line_repr.repr(actual_line)
+            )
+            expected_line = (
+                "(no line)" if expected_line is None else _line_repr.repr(expected_line)
+            )
+            rows.append(
+                f"  line {n} ({similarity:.0%} similar):\n"
+                f"    yours:    {actual_line}\n"
+                f"    expected: {expected_line}"
+            )
+            if len(rows) >= limit:
+                break
+    if not rows:
+        return ""
+    return "\n\nLines that are not similar enough:\n" + "\n".join(rows)
+
+
+def assert_similar(test, actual, expected, ratio, msg=""):
+    """Fail `test` unless the similarity of `actual` and `expected` is at
+    least `ratio`.  The full similarity is computed only on failure, to show
+    how far off the actual string is.  Values without a length (e.g.
+    numbers) are compared as strings.
+    """
+    actual, expected = _comparable(actual), _comparable(expected)
+    if similarity_at_least(actual, expected, ratio) is None:
+        from rapidfuzz.distance.Levenshtein import normalized_similarity
+
+        similarity = normalized_similarity(actual, expected)
+        test.assertGreaterEqual(similarity, ratio, msg=msg)
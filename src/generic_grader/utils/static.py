@@ -1,27 +1,284 @@
 import ast
+import io
+import os
 import tokenize
+from functools import cached_property
 from token import COMMENT, ENCODING, NEWLINE, NL
+from types import MappingProxyType
 
+from attrs import define, field
 
-def get_tokens(test, file_name):
-    """Return a list of the tokens in program `file_name`."""
 
-    with tokenize.open(file_name) as fo:
-        fail_msg = None
+def parse_docstring(docstring):
+    """Parse the doc string to find required components."""
+
+    author, assignment, date = None, None, None
+    description, contributors, integrity = [], [], []
+
+    part = None
+    for line in docstring.split("\n"):
+        line = line.strip()
+
+        if line.startswith("Author:"):
+            author = line.replace("Author:", "").strip()
+            part = None
+        elif line.startswith("Assignment:"):
+            assignment = line.replace("Assignment:", "").strip()
+            part = None
+        elif line.startswith("Date:"):
+            date = line.replace("Date:", "").strip()
+            part = None
+        elif line.startswith("Description"):
+            part = "Description"
+        elif line.startswith("Contributors"):
+            part = "Contributors"
+        elif line.startswith("Academic Integrity Statement"):
+            part = "Integrity"
+        elif part == "Description":
+            description.append(line)
+        elif part == "Contributors":
+            contributors.append(line)
+        elif part == "Integrity":
+            integrity.append(line)
+
+    return author, assignment, date, description, contributors, integrity
+
+
+@define(kw_only=True, frozen=True)
+class StaticSummary:
+    """Static metrics of a program (see `summarize`).
+
+    The token metrics are always available.  The syntax tree metrics are None
+    if the program could not be parsed.
+    """
+
+    # From the tokens
+    n_tokens: int
+    header_comments: tuple[str, ...]
+    body_comments: tuple[str, ...]
+    comment_lines: tuple[int, ...]
+
+    # From the syntax tree
+    max_loop_depth: int | None = None
+    functions: tuple[str, ...] | None = None
+    classes: tuple[str, ...] | None = None
+    imports: tuple[str, ...] | None = None
+    complexity: MappingProxyType | None = field(
+        default=None, converter=lambda c: None if c is None else MappingProxyType(c)
+    )
+
+
+class _SummaryVisitor(ast.NodeVisitor):
+    """Collect the syntax tree metrics of a `StaticSummary` in one traversal.
+
+    Loop depth is measured like `LoopDepthTracker`.  Functions and classes are
+    recorded by qualified name (e.g. "Point.distance").  Cyclomatic complexity
+    is 1 plus the number of decision points (branches, loops, exception
+    handlers, comprehension clauses, boolean operators and match cases) in
+    each function, with code outside of functions counted as "<module>".
+    """
+
+    def __init__(self):
+        self.loop_depth = 0
+        self.max_loop_depth = 0
+        self.scope = []
+        self.functions, self.classes, self.imports = [], [], []
+        self.current = "<module>"
+        self.complexity = {self.current: 1}
+        super().__init__()
+
+    def decision(self, node, n=1):
+        """Count `n` decision points and keep traversing."""
+        self.complexity[self.current] += n
+        self.generic_visit(node)
+
+    def loop(self, node):
+        """Count a decision point and track the loop depth."""
+        self.loop_depth += 1
+        self.max_loop_depth = max(self.max_loop_depth, self.loop_depth)
+        self.decision(node)
+        self.loop_depth -= 1
+
+    visit_For = visit_AsyncFor = visit_While = loop
+    visit_If = visit_IfExp = visit_ExceptHandler = visit_match_case = decision
+
+    def visit_comprehension(self, node):
+        self.decision(node, 1 + len(node.ifs))
+
+    def visit_BoolOp(self, node):
+        self.decision(node, len(node.values) - 1)
+
+    def visit_FunctionDef(self, node):
+        name = ".".join([*self.scope, node.name])
+        self.functions.append(name)
+        outer, self.current = self.current, name
+        self.complexity[name] = 1
+        self.scope.append(node.name)
+        self.generic_visit(node)
+        self.scope.pop()
+        self.current = outer
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node):
+        self.classes.append(".".join([*self.scope, node.name]))
+        self.scope.append(node.name)
+        self.generic_visit(node)
+        self.scope.pop()
+
+    def visit_Import(self, node):
+        self.imports.extend(alias.name for alias in node.names)
+
+    def visit_ImportFrom(self, node):
+        self.imports.append("." * node.level + (node.module or ""))
+
+
+def summarize(tokens, tree=None):
+    """Return a `StaticSummary` from one pass over the tokens and one
+    traversal of the syntax tree (if any).
+    """
+    n_tokens = 0
+    header_comments, body_comments, comment_lines = [], [], []
+    comments, once = header_comments, True
+    for t in tokens:
+        n_tokens += 1
+        if t.type == COMMENT:
+            comments.append(t.string)
+            comment_lines.append(t.start[0])
+        elif once and t.type not in (ENCODING, NEWLINE, NL):
+            once = False  # Only run this block once
+            comments = body_comments  # Switch to which list we append
+
+    summary = {
+        "n_tokens": n_tokens,
+        "header_comments": tuple(header_comments),
+        "body_comments": tuple(body_comments),
+        "comment_lines": tuple(comment_lines),
+    }
+    if tree is not None:
+        visitor = _SummaryVisitor()
+        visitor.visit(tree)
+        summary.update(
+            max_loop_depth=visitor.max_loop_depth,
+            functions=tuple(visitor.functions),
+            classes=tuple(visitor.classes),
+            imports=tuple(visitor.imports),
+            complexity=visitor.complexity,
+        )
+    return StaticSummary(**summary)
+
+
+class FileAnalysis:
+    """The source, tokens, syntax tree and docstring of a program.
+
+    Each analysis is computed once, on first use, and shared by every test
+    that asks for it (see `analyze`).  Parsing errors are cached too, and
+    raised again on each use.  The cached values must not be modified.
+    """
+
+    def __init__(self, file_name, key=None):
+        self.file_name = file_name
+        self.key = key
+        with tokenize.open(file_name) as fo:
+            self.source = fo.read()
+
+    @cached_property
+    def _tokens(self):
         try:
-            tokens = list(tokenize.generate_tokens(fo.readline))
+            readline = io.StringIO(self.source).readline
+            return list(tokenize.generate_tokens(readline)), None
         except tokenize.TokenError as e:
-            fail_msg = (
-                f"Error while parsing `{file_name}`. "
-                + f'The error was "{e.__class__.__name__}: {e}".'
-            )
-        # Fail outside of the except block
-        # so that AssertionError(s) will be handled properly.
-        if fail_msg:
-            test.fail(fail_msg)
+            return None, e
+
+    @property
+    def tokens(self):
+        """Return a list of the program's tokens, or raise a TokenError."""
+        tokens, error = self._tokens
+        if error:
+            raise error
+        return tokens
+
+    @cached_property
+    def _tree(self):
+        try:
+            return ast.parse(self.source), None
+        except SyntaxError as e:
+            return None, e
+
+    @property
+    def tree(self):
+        """Return the program's abstract syntax tree, or raise a SyntaxError."""
+        tree, error = self._tree
+        if error:
+            raise error
+        return tree
+
+    @property
+    def syntax_error(self):
+        """Return the SyntaxError raised when parsing the program, or None."""
+        return self._tree[1]
+
+    @cached_property
+    def summary(self):
+        """Return the program's `StaticSummary`, or raise a TokenError."""
+        tree, _ = self._tree
+        return summarize(self.tokens, tree)
+
+    @cached_property
+    def docstring(self):
+        """Return the module level docstring, or None."""
+        return ast.get_docstring(self.tree)
+
+    @cached_property
+    def docstring_fields(self):
+        """Return the parsed docstring (see `parse_docstring`)."""
+        return parse_docstring(self.docstring or "")
+
+
+_analyses = {}
+"""Cached analyses by absolute file path."""
+
+
+def analyze(file_name):
+    """Return the shared `FileAnalysis` of program `file_name`.
+
+    The analysis is cached by path and is computed again when the file's
+    modification time, size or inode changes.
+    """
+    path = os.path.abspath(file_name)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    analysis = _analyses.get(path)
+    if analysis is None or analysis.key != key:
+        analysis = _analyses[path] = FileAnalysis(path, key)
+    return analysis
+
+
+def get_tokens(test, file_name):
+    """Return a list of the tokens in program `file_name`."""
+
+    fail_msg = None
+    try:
+        tokens = analyze(file_name).tokens
+    except tokenize.TokenError as e:
+        fail_msg = (
+            f"Error while parsing `{file_name}`. "
+            + f'The error was "{e.__class__.__name__}: {e}".'
+        )
+    # Fail outside of the except block
+    # so that AssertionError(s) will be handled properly.
+    if fail_msg:
+        test.fail(fail_msg)
     return tokens
 
 
+def get_summary(test, file_name):
+    """Return the `StaticSummary` of program `file_name`."""
+
+    get_tokens(test, file_name)  # Fail if the program can't be tokenized.
+    return analyze(file_name).summary
+
+
 def get_comments(test, file_name):
     """Return the comments in program `file_name`.
 
@@ -29,16 +286,8 @@ def get_comments(test, file_name):
     body comments.
     """
 
-    header_comments, body_comments, once = [], [], True
-    comments = header_comments
-    for t in get_tokens(test, file_name):
-        if t.type == COMMENT:
-            comments.append(t.string)
-        elif once and t.type not in (ENCODING, NEWLINE, NL):
-            once = False  # Only run this block once
-            comments = body_comments  # Switch to which list we append
-
-    return header_comments, body_comments
+    summary = get_summary(test, file_name)
+    return list(summary.header_comments), list(summary.body_comments)
 
 
 class LoopDepthTracker(ast.NodeVisitor):
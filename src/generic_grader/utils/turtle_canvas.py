@@ -2,9 +2,6 @@ import turtle
 from io import BytesIO
 from os.path import isfile
 
-from attrs import evolve
-from PIL import Image, ImageChops
-
 from generic_grader.utils.user import RefUser, SubUser
 
 
@@ -42,7 +39,7 @@ def save_sub_canvas(self, options):
         return
 
     # Create the reference and student user.
-    ref_options = evolve(o, obj_name="start", entries=())
+    ref_options = o.derive(obj_name="start", entries=())
     self.ref_start_user = RefUser(self, ref_options)
     self.student_main_user = SubUser(self, o)
 
@@ -66,6 +63,8 @@ def save_sub_canvas(self, options):
 
 def save_canvas(canvas=None, filename=None, invert=True, bw=True):
     """Save a screenshot of the canvas as filename."""
+    from PIL import Image, ImageChops
+
     if not canvas:
         canvas = turtle.getcanvas()
 
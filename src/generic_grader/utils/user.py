@@ -1,23 +1,94 @@
 """Provide a mock user for code under test."""
 
 import re
+import sys
+from contextlib import nullcontext
 from copy import deepcopy
 from io import StringIO
 
-from attrs import evolve
-
-from generic_grader.utils.docs import get_wrapper, make_call_str, ordinalize
+from generic_grader.utils.docs import (
+    LazyMessage,
+    get_wrapper,
+    make_call_str,
+    ordinalize,
+)
 from generic_grader.utils.exceptions import (
     EndOfInputError,
     ExtraEntriesError,
     LogLimitExceededError,
+    OutputDivergenceError,
     UserInitializationError,
+    UserTimeoutError,
     handle_error,
     safe_exception_type,
 )
 from generic_grader.utils.importer import Importer
+from generic_grader.utils.instrumentation import stage
 from generic_grader.utils.options import Options
-from generic_grader.utils.patches import custom_stack
+from generic_grader.utils.patches import PatchSet, custom_stack
+from generic_grader.utils.profiler import SamplingProfiler
+from generic_grader.utils.resource_limits import TimeBudget
+from generic_grader.utils.rng import SeededRandom
+
+VALUE_PATTERN = re.compile(
+    r"""(?x:                 # Start a verbose pattern
+          -?                   # 0 or 1 leading minus signs
+          [0-9]{1,3}           # 1 to 3 digits
+          (?:                  # Start a non-capturing group
+            (?:                #   Start a non-capturing group
+              ,[0-9]{3}        #     literal comma 3 digits
+            )+                 #     1 or more times
+            |                  #   OR
+            (?:[0-9]*)         #   Any number of digits
+          )                    #
+          (?:                  # Start a non-capturing group
+            \.                 #   A literal period
+            [0-9]*             #   0 or more digits
+          )?                   # 0 or 1 times
+          (?:                  # Start a non-capturing group
+            e[+-]              #   literal e followed by + or -
+            [0-9]+             #   1 or more digits
+          )?                   # 0 or 1 times
+      )""",
+    re.VERBOSE,
+)
+"""Numbers in output, with optional thousands separators and exponents."""
+
+MAX_LOG_LINES = 60
+"""Lines of the IO log shown in a failure message."""
+
+MAX_LOG_LINE_CHARS = 300
+"""Characters of each IO log line shown in a failure message."""
+
+
+def log_window(n_lines, focus=None, budget=MAX_LOG_LINES):
+    """Return the (start, stop) index ranges of the lines to show from a log
+    of `n_lines` lines.
+
+    Logs of up to `budget` lines are shown in full.  Longer logs show their
+    first lines and a window around line `focus` (counting from 1), or their
+    last lines if there is no focus.
+    """
+    if n_lines <= budget:
+        return [(0, n_lines)]
+    head = budget // 4
+    window = budget - head
+    if focus is None:
+        start = n_lines - window
+    else:
+        start = min(max(head, focus - 1 - window // 2), n_lines - window)
+    if start == head:
+        return [(0, budget)]
+    return [(0, head), (start, start + window)]
+
+
+def clip_line(line, limit=MAX_LOG_LINE_CHARS):
+    """Return `line` cut to `limit` characters, keeping its newline."""
+    end = "\n" if line.endswith("\n") else ""
+    text = line[: len(line) - len(end)]
+    if len(text) <= limit:
+        return line
+    return text[:limit] + f" ... ({len(text) - limit} characters omitted)" + end
 
 
 class __User__:
@@ -26,25 +97,62 @@ class __User__:
     wrapper = get_wrapper()
 
     class LogIO(StringIO):
-        """A string io object with a character limit."""
+        """A string io object with a character limit, and optionally, the
+        output it is expected to match.
+        """
 
         def __init__(self, log_limit=0):
             """Initialize with an unlimited default limit (0 characters)."""
             super().__init__()
             self.log_limit = log_limit
+            self.expected = None
 
         def __len__(self):
             """Return the number of characters in the log."""
             return len(self.getvalue())
 
+        def expect(self, expected):
+            """Compare the output to `expected` as it is written, and raise an
+            `OutputDivergenceError` at the first line that differs.
+            """
+            self.expected = expected
+            self._checked = 0  # Characters compared so far.
+            self._checked_lines = 0  # Complete lines compared so far.
+
+        def _check_divergence(self, s):
+            """Compare `s`, which may end in a partial line, to the expected
+            output that follows what was already compared.
+            """
+            start = self._checked
+            if not self.expected.startswith(s, start):
+                # Find the first character that differs.
+                expected = self.expected[start : start + len(s)]
+                n = next(
+                    (i for i, (a, b) in enumerate(zip(s, expected)) if a != b),
+                    min(len(s), len(expected)),
+                )
+                line_n = self._checked_lines + s.count("\n", 0, n) + 1
+                line_start = self.expected.rfind("\n", 0, start + n) + 1
+                if line_start < len(self.expected):
+                    line = self.expected[line_start:].partition("\n")[0]
+                else:
+                    line = None  # The output continued past the expected end.
+                raise OutputDivergenceError(line_n, line)
+            self._checked += len(s)
+            self._checked_lines += s.count("\n")
+
         def write(self, s):
-            """Wrap inherited `write()` with a length limit check."""
+            """Wrap inherited `write()` with a length limit check and, if
+            expected output was given, a divergence check.
+            """
             super().write(s)
 
             # Check if limit is exceeded after write so the offending string
             # will be in the log for debugging.
             if self.log_limit and len(self) > self.log_limit:
                 raise LogLimitExceededError()
+            if self.expected is not None:
+                self._check_divergence(s)
 
     def __init__(self, test, options: Options):
         """Initialize a user."""
@@ -64,28 +172,45 @@ class __User__:
         self.obj = Importer.import_obj(test, self.module, self.options)
         self.returned_values = None
 
+        # Share one time budget across all of this user's calls.
+        self.time_budget = (
+            TimeBudget(options.time_budget) if options.time_budget else None
+        )
+
+        # Continue one seeded stream of random numbers across calls.
+        self.rng = SeededRandom(options.seed) if options.seed is not None else None
+
         self.patches = [
             {"args": ["sys.stdout", self.log]},
             {"args": ["builtins.input", self.responder]},
         ]
         if options.patches:
             self.patches.extend(options.patches)
+        self.patch_set = PatchSet(self.patches)
+
+    @stage("message formatting")
+    def format_log(self, focus=None):
+        """Return a formatted string of the IO log.
 
-    def format_log(self):
-        """Return a formatted string of the IO log."""
+        Long logs are shortened to the lines chosen by `log_window`, which
+        keeps a window around line `focus`, and long lines are clipped.
+        """
         old_options = self.options
-        self.options = evolve(old_options, n_lines=None, start=1)
+        self.options = old_options.derive(n_lines=None, start=1)
         lines = self.read_log_lines()
-        if lines:
-            string = (
-                "\n\nline |Input/Output Log:\n"
-                + f'{70*"-"}\n'
-                + "".join([f"{n+1:4d} |{line}" for n, line in enumerate(lines)])
-            )
-        else:
-            string = ""
         self.options = old_options
-        return string
+        if not lines:
+            return ""
+
+        rows, shown = [], 0
+        for start, stop in log_window(len(lines), focus):
+            if start > shown:
+                rows.append(f"     |... ({start - shown} lines omitted) ...\n")
+            rows.extend(f"{n+1:4d} |{clip_line(lines[n])}" for n in range(start, stop))
+            shown = stop
+        if shown < len(lines):
+            rows.append(f"     |... ({len(lines) - shown} lines omitted) ...\n")
+        return "\n\nline |Input/Output Log:\n" + f'{70*"-"}\n' + "".join(rows)
 
     def get_value(self):
         """Return the value_n th float in line `line_n`, indexed from the
@@ -110,7 +235,7 @@ class __User__:
                     + f"but only found {len(values)} value(s) "
                     + f"in line {line_n}."
                 )
-                + self.format_log()
+                + self.format_log(line_n)
             )
 
         if msg:
@@ -118,32 +243,20 @@ class __User__:
 
         return value
 
+    def get_value_table(self):
+        """Return a list of the values in each of up to `n_lines` lines
+        starting at line `start`, indexed from the prompt for user interaction
+        `interaction`.
+        """
+        return [self.get_values(line) for line in self.read_log_lines()]
+
     def get_values(self, line_string: str | None = None):
         """Return all the values matching a number like pattern in line
         `line_n`, indexed from the prompt for user interaction `interaction`.
         """
-        pattern = r"""(?x:                 # Start a verbose pattern
-                      -?                   # 0 or 1 leading minus signs
-                      [0-9]{1,3}           # 1 to 3 digits
-                      (?:                  # Start a non-capturing group
-                        (?:                #   Start a non-capturing group
-                          ,[0-9]{3}        #     literal comma 3 digits
-                        )+                 #     1 or more times
-                        |                  #   OR
-                        (?:[0-9]*)         #   Any number of digits
-                      )                    #
-                      (?:                  # Start a non-capturing group
-                        \.                 #   A literal period
-                        [0-9]*             #   0 or more digits
-                      )?                   # 0 or 1 times
-                      (?:                  # Start a non-capturing group
-                        e[+-]              #   literal e followed by + or -
-                        [0-9]+             #   1 or more digits
-                      )?                   # 0 or 1 times
-                  )"""
         if line_string is None:
             line_string = self.read_log_line()
-        match_strings = re.findall(pattern, line_string)
+        match_strings = VALUE_PATTERN.findall(line_string)
         value_strings = [match.replace(",", "") for match in match_strings]
 
         try:
@@ -228,6 +341,13 @@ class __User__:
 
         return entry
 
+    def make_profiler(self):
+        """Return a sampling profiler for the module under test, or None if
+        the module has no source file.
+        """
+        filename = getattr(sys.modules.get(self.module), "__file__", None)
+        return SamplingProfiler(filename) if filename else None
+
     def call_obj(self):
         """Have a simulated user call the object."""
 
@@ -240,21 +360,31 @@ class __User__:
             self.log.log_limit = o.log_limit
 
         msg = False
-        call_str = make_call_str(o.obj_name, o.args, o.kwargs)
-        error_msg = "\n" + self.wrapper.fill(
-            f"Your `{o.obj_name}` malfunctioned"
-            + f" when called as `{call_str}`"
-            + ((o.entries) and f" with entries {o.entries}." or ".")
+        # Only build the error message if the call fails.
+        error_msg = LazyMessage(
+            lambda: "\n"
+            + self.wrapper.fill(
+                f"Your `{o.obj_name}` malfunctioned"
+                + f" when called as `{make_call_str(o.obj_name, o.args, o.kwargs)}`"
+                + ((o.entries) and f" with entries {o.entries}." or ".")
+            )
         )
+        profiler = self.make_profiler() if o.profile_timeouts else None
         try:
-            stack_o = evolve(o, patches=self.patches)
-            with custom_stack(stack_o):
+            with (
+                stage("call"),
+                profiler or nullcontext(),
+                custom_stack(o, self.time_budget, self.patch_set, self.rng),
+            ):
                 # Call the attached object with copies of r args and kwargs.
                 self.returned_values = self.obj(*deepcopy(o.args), **deepcopy(o.kwargs))
         except Exception as e:
             # TODO This function is going to be refactored
             self.test.failureException = safe_exception_type(type(e))
-            msg = handle_error(e, error_msg)
+            msg = handle_error(e, str(error_msg))
+            if profiler and isinstance(e, UserTimeoutError):
+                # Show where the submitted code spent its time.
+                msg += profiler.format_table()
         else:
             try:  # Check for left over entries.
                 next(self.entries)
@@ -263,7 +393,7 @@ class __User__:
             else:
                 self.test.failureException = ExtraEntriesError
                 msg = (
-                    error_msg
+                    str(error_msg)
                     + "\n\nHint:\n"
                     + self.wrapper.fill(
                         "Your program ended before the user finished entering input."
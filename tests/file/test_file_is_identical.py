@@ -3,6 +3,7 @@ import unittest
 import pytest
 
 from generic_grader.file.file_is_identical import build
+from generic_grader.utils import file_compare
 from generic_grader.utils.options import Options
 
 
@@ -225,3 +226,22 @@ def test_failing_cases(case, fix_syspath):
 
     assert case["error_message"] in str(exc_info.value)
     assert test_method.__score__ == 0
+
+
+def test_large_files_report_first_differences(fix_syspath, monkeypatch):
+    """Large files are streamed, and only their first differences are shown."""
+    monkeypatch.setattr(file_compare, "SMALL_FILE_BYTES", 0)
+    writer = (
+        "def main():\n    with open('file.txt', 'w') as f:\n        f.write({!r})\n"
+    )
+    fix_syspath.joinpath("ref.py").write_text(writer.format("a\nb\nc\n"))
+    fix_syspath.joinpath("sub.py").write_text(writer.format("a\nB\nc\n"))
+    o = Options(ref_module="ref", sub_module="sub", weight=1, filenames=("file.txt",))
+    test_method = build(o)(methodName="test_file_is_identical_0")
+
+    with pytest.raises(AssertionError) as exc_info:
+        test_method.test_file_is_identical_0()
+
+    message = str(exc_info.value)
+    assert "line 2:\n    yours:    b'B'\n    expected: b'b'" in message
+    assert "The data in `file.txt` does not match the expected data." in message
@@ -3,6 +3,7 @@ import unittest
 import pytest
 
 from generic_grader.file.file_lines_match_reference import build
+from generic_grader.utils import file_compare
 from generic_grader.utils.options import Options
 
 
@@ -184,3 +185,70 @@ def test_failing_cases(case, fix_syspath):
         test_method()
     assert case["error"] == str(exc_info.value)
     assert test_method.__score__ == 0
+
+
+@pytest.mark.parametrize(
+    "sub_text, error",
+    [
+        ("a\r\nb\r\nc\r\n", None),
+        ("a\nB\nc", "line 2:\n    yours:    'B'\n    expected: 'b'"),
+        ("a\nb\n", "line 3:\n    yours:    (missing)\n    expected: 'c'"),
+    ],
+)
+def test_large_files_are_streamed(sub_text, error, fix_syspath, monkeypatch):
+    """Large files are compared line by line and report their first
+    differences."""
+    monkeypatch.setattr(file_compare, "SMALL_FILE_BYTES", 0)
+    writer = (
+        "def main():\n    with open('file.txt', 'w', newline='') as f:\n"
+        "        f.write({!r})\n"
+    )
+    fix_syspath.joinpath("ref.py").write_text(writer.format("a\nb\nc\n"))
+    fix_syspath.joinpath("sub.py").write_text(writer.format(sub_text))
+    o = Options(ref_module="ref", sub_module="sub", weight=1, filenames=("file.txt",))
+    test = build(o)(methodName="test_file_lines_match_reference_0")
+    test_method = test.test_file_lines_match_reference_0
+
+    if error is None:
+        test_method()
+        assert test_method.__score__ == 1
+    else:
+        with pytest.raises(AssertionError) as exc_info:
+            test_method()
+        assert error in str(exc_info.value)
+        assert "The lines written to your output file" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("small", [True, False])
+@pytest.mark.parametrize(
+    "sub_text, passes",
+    [
+        ("a\x0cb\nc\n", True),
+        ("a\u2028b\u2029c", True),
+        ("a\x1cb\x85c\n", True),
+        ("a\x0cB\nc\n", False),
+    ],
+)
+def test_line_separators_match_across_sizes(
+    sub_text, passes, small, fix_syspath, monkeypatch
+):
+    """Files are split into lines the same way whether they are compared in
+    memory or streamed."""
+    if not small:
+        monkeypatch.setattr(file_compare, "SMALL_FILE_BYTES", 0)
+    writer = (
+        "def main():\n    with open('file.txt', 'w', encoding='utf-8') as f:\n"
+        "        f.write({!r})\n"
+    )
+    fix_syspath.joinpath("ref.py").write_text(writer.format("a\nb\nc\n"))
+    fix_syspath.joinpath("sub.py").write_text(writer.format(sub_text))
+    o = Options(ref_module="ref", sub_module="sub", weight=1, filenames=("file.txt",))
+    test = build(o)(methodName="test_file_lines_match_reference_0")
+    test_method = test.test_file_lines_match_reference_0
+
+    if passes:
+        test_method()
+        assert test_method.__score__ == 1
+    else:
+        with pytest.raises(AssertionError):
+            test_method()
@@ -0,0 +1,144 @@
+import unittest
+
+import numpy  # noqa: F401 Import before fix_syspath snapshots sys.modules.
+import pytest
+import scipy.stats  # noqa: F401 Import before fix_syspath snapshots sys.modules.
+
+from generic_grader.function.random_func_return_distribution import build
+from generic_grader.utils.options import Options
+
+
+@pytest.fixture()
+def built_class():
+    """Provide the class built by the build function."""
+    return build(Options())
+
+
+@pytest.fixture()
+def built_instance(built_class):
+    """Provide an instance of the built class."""
+    return built_class()
+
+
+def test_random_func_return_distribution_build_class(built_class):
+    """Test that the build function returns a class."""
+    assert issubclass(built_class, unittest.TestCase)
+
+
+def test_random_func_return_distribution_build_class_name(built_class):
+    """Test that the built_class has the correct name."""
+    assert built_class.__name__ == "TestRandomFuncReturnDistribution"
+
+
+def test_random_func_return_distribution_built_instance_type(built_instance):
+    """Test that the built_class returns instances of unittest.TestCase."""
+    assert isinstance(built_instance, unittest.TestCase)
+
+
+def test_random_func_return_distribution_has_test_method(built_instance):
+    """Test that instances of the built_class have test method."""
+    assert hasattr(built_instance, "test_random_func_return_distribution_0")
+
+
+two_dice = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 7: 6, 8: 5, 9: 4, 10: 3, 11: 2, 12: 1}
+
+# Cases Tested:
+# 1. Uniform values
+# 2. Weighted values
+# 3. Uniform values when a weighted distribution is expected
+# 4. Biased values
+# 5. Unexpected value
+
+cases = [
+    {  # Uniform values
+        "submission": "import random as r\ndef test_function():\n    return r.randint(1, 6)",
+        "result": "pass",
+        "options": Options(
+            obj_name="test_function",
+            sub_module="submission",
+            weight=1,
+            expected_distribution={i: 1 / 6 for i in range(1, 7)},
+        ),
+    },
+    {  # Weighted values
+        "submission": "import random as r\ndef test_function():\n    return r.randint(1, 6) + r.randint(1, 6)",
+        "result": "pass",
+        "options": Options(
+            obj_name="test_function",
+            sub_module="submission",
+            weight=1,
+            expected_distribution=two_dice,
+        ),
+    },
+    {  # Uniform values when a weighted distribution is expected
+        "submission": "import random as r\ndef test_function():\n    return r.randint(2, 12)",
+        "result": AssertionError,
+        "options": Options(
+            obj_name="test_function",
+            sub_module="submission",
+            weight=1,
+            expected_distribution=two_dice,
+        ),
+        "message": "did not match the expected distribution",
+    },
+    {  # Biased values
+        "submission": "import random as r\ndef test_function():\n    return r.choice([1, 2, 3, 4, 5, 6, 6])",
+        "result": AssertionError,
+        "options": Options(
+            obj_name="test_function",
+            sub_module="submission",
+            weight=1,
+            expected_distribution={i: 1 for i in range(1, 7)},
+        ),
+        "message": "Frequencies of the values in",
+    },
+    {  # Unexpected value
+        "submission": "import random as r\ndef test_function():\n    return r.randint(1, 7)",
+        "result": AssertionError,
+        "options": Options(
+            obj_name="test_function",
+            sub_module="submission",
+            weight=1,
+            expected_distribution={i: 1 for i in range(1, 7)},
+        ),
+        "message": "returned 7 when called as `test_function()`, which is not one of the expected values.",
+    },
+]
+
+
+@pytest.fixture(params=cases)
+def case_test_method(request, fix_syspath):
+    """Arrange submission directory, and parameterized test function."""
+    case = request.param
+    file_path = fix_syspath / f"{case['options'].sub_module}.py"
+    file_path.write_text(case["submission"])
+
+    built_class = build(case["options"])
+    built_instance = built_class(methodName="test_random_func_return_distribution_0")
+    test_method = built_instance.test_random_func_return_distribution_0
+
+    return case, test_method
+
+
+def test_random_func_return_distribution(case_test_method):
+    """Test response of test_random_func_return_distribution function."""
+    case, test_method = case_test_method
+    doc = (
+        "Check the distribution of value(s) returned from your"
+        " `submission.test_function` function when called as"
+        " `test_function()` matches the expected distribution."
+    )
+
+    if case["result"] == "pass":
+        test_method()  # should not raise an error
+        assert test_method.__score__ == case["options"].weight
+        assert test_method.__doc__ == doc
+
+    else:
+        error = case["result"]
+        with pytest.raises(error) as exc_info:
+            test_method()
+        message = " ".join(str(exc_info.value).split())
+        assert case["message"] in message
+        assert test_method.__doc__ == doc
+        assert test_method.__score__ == 0
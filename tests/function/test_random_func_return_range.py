@@ -43,6 +43,8 @@ def test_random_func_return_range_has_test_method(built_instance):
 # 2. Passing case with init options specified
 # 3. Expected set is larger than the returned set
 # 4. Returned set is larger than the expected set
+# 5. Values from untraceable draws are sampled
+# 6. Values from several traced draws
 
 
 cases = [
@@ -116,6 +118,60 @@ cases = [
 ]
 
 
+cases += [
+    {  # Values from untraceable draws are sampled
+        "submission": "import random as r\ndef test_function():\n    return int(r.random() * 10) + 1",
+        "result": "pass",
+        "options": Options(
+            obj_name="test_function",
+            sub_module="submission",
+            weight=1,
+            expected_set={1, 2, 3, 4, 5, 6, 7, 8, 9, 10},
+        ),
+        "doc_func_test_string": (
+            """Check the range of value(s) returned from your"""
+            """ `submission.test_function` function"""
+            """ when called as `test_function()`"""
+            """ matches the expected range."""
+        ),
+    },
+    {  # Values from several traced draws
+        "submission": "from random import choice, randrange\ndef test_function():\n    return choice('ab') + str(randrange(3))",
+        "result": AssertionError,
+        "options": Options(
+            obj_name="test_function",
+            sub_module="submission",
+            weight=1,
+            expected_set={"a0", "a1", "b0", "b1", "b2", "b3"},
+        ),
+        "message": "Items in the first set but not the second: 'a2'",
+        "doc_func_test_string": (
+            """Check the range of value(s) returned from your"""
+            """ `submission.test_function` function"""
+            """ when called as `test_function()`"""
+            """ matches the expected range."""
+        ),
+    },
+    {  # Reseeding limits the values to those of one seed
+        "submission": "import random\ndef test_function():\n    random.seed(1)\n    return random.randint(1, 6)",
+        "result": AssertionError,
+        "options": Options(
+            obj_name="test_function",
+            sub_module="submission",
+            weight=1,
+            expected_set={1, 2, 3, 4, 5, 6},
+        ),
+        "message": "Items in the second set but not the first: 1 3 4 5 6",
+        "doc_func_test_string": (
+            """Check the range of value(s) returned from your"""
+            """ `submission.test_function` function"""
+            """ when called as `test_function()`"""
+            """ matches the expected range."""
+        ),
+    },
+]
+
+
 @pytest.fixture(params=cases)
 def case_test_method(request, fix_syspath):
     """Arrange submission directory, and parameterized test function."""
@@ -147,3 +203,27 @@ def test_random_func_return_range(case_test_method):
         assert case["message"] in message
         assert test_method.__doc__ == case["doc_func_test_string"]
         assert test_method.__score__ == 0
+
+
+@pytest.mark.parametrize("tolerance, calls", [(1, 6), (3, 18), (9, 52)])
+def test_random_func_return_range_tolerance(fix_syspath, tolerance, calls):
+    """Test that sampling honors random_chance_tolerance and reports the calls."""
+    fix_syspath.joinpath("submission.py").write_text(
+        "import random\n"
+        "def test_function():\n"
+        "    with open('calls.txt', 'a') as fo:\n"
+        "        fo.write('x')\n"
+        "    return int(random.random() * 0) + 1\n"
+    )
+    options = Options(
+        obj_name="test_function",
+        sub_module="submission",
+        expected_set={1, 2},
+        random_chance_tolerance=tolerance,
+    )
+    built_instance = build(options)(methodName="test_random_func_return_range_0")
+    with pytest.raises(AssertionError) as exc_info:
+        built_instance.test_random_func_return_range_0()
+    n_calls = len(fix_syspath.joinpath("calls.txt").read_text())
+    assert n_calls == calls
+    assert f"It was called {calls} times." in " ".join(str(exc_info.value).split())
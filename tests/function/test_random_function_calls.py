@@ -125,14 +125,15 @@ passing_cases = [
 ]
 
 
+@pytest.mark.parametrize("n_workers", [1, 3])
 @pytest.mark.parametrize("case", passing_cases)
-def test_passing_random_function_calls(fix_syspath, case):
+def test_passing_random_function_calls(fix_syspath, case, n_workers):
     """Test that the function calls are random test works."""
     # Setup
     sub_file = fix_syspath / "sub.py"
     sub_file.write_text(case["file_text"])
     # Create the test method
-    built_class = build(case["options"])
+    built_class = build(case["options"].derive(n_workers=n_workers))
     built_instance = built_class(methodName="test_random_function_calls_0")
     test_method = built_instance.test_random_function_calls_0
     # Run the test method
@@ -230,13 +231,14 @@ failing_cases = [
 ]
 
 
+@pytest.mark.parametrize("n_workers", [1, 3])
 @pytest.mark.parametrize("case", failing_cases)
-def test_failing_random_function_calls(fix_syspath, case):
+def test_failing_random_function_calls(fix_syspath, case, n_workers):
     """Test that the function calls are random test fails."""
     sub_file = fix_syspath / "sub.py"
     sub_file.write_text(case["file_text"])
     # Create the test method
-    built_class = build(case["options"])
+    built_class = build(case["options"].derive(n_workers=n_workers))
     built_instance = built_class(methodName="test_random_function_calls_0")
     test_method = built_instance.test_random_function_calls_0
     # Run the test method
@@ -273,3 +275,19 @@ def test_random_function_calls_init(fix_syspath, capsys):
     test_method()
     # Make sure the init function was called
     assert capsys.readouterr().out == "init\n"
+
+
+def test_random_function_calls_worker_error(fix_syspath):
+    """Make sure an error in a worker fails the test."""
+    sub_file = fix_syspath / "sub.py"
+    sub_file.write_text("def func1():\n    pass\n\ndef main():\n    1 / 0\n")
+    options = Options(
+        sub_module="sub",
+        random_func_calls=["sub.func1"],
+        expected_perms={("sub.func1",)},
+        n_workers=2,
+    )
+    built_instance = build(options)(methodName="test_random_function_calls_0")
+    with pytest.raises(ZeroDivisionError, match="division by zero"):
+        built_instance.test_random_function_calls_0()
+    assert built_instance.failureException is ZeroDivisionError
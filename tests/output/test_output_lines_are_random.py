@@ -43,6 +43,9 @@ def test_output_lines_are_random_has_test_method(built_instance):
 # 1. Printing random output
 # 2. Passing with init defined
 # 3. Not random output
+# 4. Seeded random output
+# 5. Seeded output without random draws
+# 6. Infinite random output
 
 
 cases = [
@@ -96,6 +99,41 @@ cases = [
         ),
         "message": "Your output does not appear to be random.",
     },
+    {  # Seeded random output
+        "submission": "from random import randint\ndef main():\n    for i in range(5):\n        print(randint(1, 10))",
+        "reference": "import random as r\ndef main():\n    for i in range(5):\n        print(r.randint(1, 10))",
+        "result": "pass",
+        "options": Options(
+            sub_module="submission",
+            ref_module="reference",
+            weight=1,
+            seed=0,
+        ),
+        "doc_func_test_string": (
+            "Check that the lines of output"
+            + " from your `submission.main` function"
+            + " when called as `main()`"
+            + " are random."
+        ),
+    },
+    {  # Seeded output without random draws
+        "submission": "def main():\n    for i in range(5):\n        print('1')",
+        "reference": "import random as r\ndef main():\n    for i in range(5):\n        print(r.randint(2, 10))",
+        "result": AssertionError,
+        "options": Options(
+            sub_module="submission",
+            ref_module="reference",
+            weight=1,
+            seed=0,
+        ),
+        "doc_func_test_string": (
+            "Check that the lines of output"
+            + " from your `submission.main` function"
+            + " when called as `main()`"
+            + " are random."
+        ),
+        "message": "did not draw any numbers from the `random` module.",
+    },
     {  # Infinite random output
         "submission": "import random as r\ndef main():\n    while True:\n        print(r.randint(1, 10))",
         "reference": "import random as r\ndef main():\n    for i in range(5):\n        print(r.randint(2, 10))",
@@ -2,7 +2,7 @@ import unittest
 
 import pytest
 
-from generic_grader.output.output_lines_match_reference import build
+from generic_grader.output.output_lines_match_reference import build, first_difference
 from generic_grader.utils.options import Options
 
 
@@ -306,3 +306,18 @@ def test_output_lines_match_reference(case_test_method):
             assert diff_line in message
         assert test_method.__doc__ == case["doc_func_test_string"]
         assert test_method.__score__ == case["score"]
+
+
+@pytest.mark.parametrize(
+    "actual, expected, start, line",
+    [
+        ("a\nb\nc\n", "a\nx\nc\n", 1, 2),
+        ("a\nb\nc\n", "a\nb\nx\n", 3, 5),
+        ("a\nb\n", "a\nb\nc\n", 1, 3),
+        ("a\nb\nc\n", "a\n", 2, 3),
+        ("a\nb", "a\nb\n", 1, 2),
+    ],
+)
+def test_first_difference(actual, expected, start, line):
+    """Test that the first differing line is numbered from `start`."""
+    assert first_difference(actual, expected, start) == line
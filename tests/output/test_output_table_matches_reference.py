@@ -0,0 +1,120 @@
+import unittest
+
+import numpy  # noqa: F401 Import before fix_syspath snapshots sys.modules.
+import pytest
+
+from generic_grader.output.output_table_matches_reference import (
+    build,
+    compare_tables,
+)
+from generic_grader.utils.options import Options
+
+
+@pytest.fixture()
+def built_class():
+    """Provide the class built by the build function."""
+    return build(Options())
+
+
+@pytest.fixture()
+def built_instance(built_class):
+    """Provide an instance of the built class."""
+    return built_class()
+
+
+def test_output_table_matches_reference_build_class(built_class):
+    """Test that the build function returns a class."""
+    assert issubclass(built_class, unittest.TestCase)
+
+
+def test_output_table_matches_reference_build_class_name(built_class):
+    """Test that the built_class has the correct name."""
+    assert built_class.__name__ == "TestOutputTableMatchesReference"
+
+
+def test_output_table_matches_reference_has_test_method(built_instance):
+    """Test that instances of the built_class have test method."""
+    assert hasattr(built_instance, "test_output_table_matches_reference_0")
+
+
+def test_doc_func(built_instance):
+    """Test that the docstring describes the line range."""
+    assert built_instance.test_output_table_matches_reference_0.__doc__ == (
+        "Check that the values on output lines 1 through the end from your"
+        " `main` function when called as `main()` match the reference values."
+    )
+
+
+def table_program(rows):
+    return "def main():\n" + "".join(f"    print({row!r})\n" for row in rows)
+
+
+reference_rows = ["x  y", "1  1.000", "2  4.000", "3  9.000"]
+
+cases = [
+    {  # All values match
+        "rows": reference_rows,
+        "options": {},
+        "error": None,
+    },
+    {  # Values within the tolerance match
+        "rows": ["x  y", "1  1.001", "2  4.001", "3  8.999"],
+        "options": {"absolute_tolerance": 0.01},
+        "error": None,
+    },
+    {  # Only the selected lines are compared
+        "rows": ["x  y", "1  1.000", "2  4.000", "3  10.0"],
+        "options": {"start": 2, "n_lines": 2},
+        "error": None,
+    },
+    {  # One value is wrong
+        "rows": ["x  y", "1  1.000", "2  5.000", "3  9.000"],
+        "options": {},
+        "error": "1 of 6 values differ:\n  line 3, value 2: found 5.0, but expected 4.0",
+    },
+    {  # A line is missing a value
+        "rows": ["x  y", "1  1.000", "2", "3  9.000"],
+        "options": {},
+        "error": "  line 3: found 1 values, but expected 2",
+    },
+    {  # A line is missing
+        "rows": reference_rows[:-1],
+        "options": {},
+        "error": "Found 3 output lines, but expected 4 output lines.",
+    },
+]
+
+
+@pytest.mark.parametrize("case", cases)
+def test_output_table_matches_reference(case, fix_syspath):
+    """Test the table comparison from a single run of each program."""
+    fix_syspath.joinpath("reference.py").write_text(table_program(reference_rows))
+    fix_syspath.joinpath("submission.py").write_text(table_program(case["rows"]))
+    o = Options(
+        sub_module="submission", ref_module="reference", weight=1, **case["options"]
+    )
+    test = build(o)(methodName="test_output_table_matches_reference_0")
+    test_method = test.test_output_table_matches_reference_0
+
+    if case["error"] is None:
+        test_method()
+        assert test_method.__score__ == 1
+    else:
+        with pytest.raises(AssertionError) as exc_info:
+            test_method()
+        message = str(exc_info.value)
+        assert case["error"] in message
+        assert "Your output values did not match the expected values." in message
+        assert test_method.__score__ == 0
+
+
+def test_compare_tables_limits_report():
+    """Only the first mismatching values are listed, with their positions."""
+    expected = [[0.0] * 5, [], [1.0, 2.0]] + [[float(i)] for i in range(20)]
+    actual = [[0.0] * 5, [], [1.0, 3.0]] + [[i + 0.5] for i in range(20)]
+    details = compare_tables(actual, expected, start=3)
+    assert details.startswith("\n21 of 27 values differ:\n")
+    assert "  line 5, value 2: found 3.0, but expected 2.0" in details
+    assert "  line 6, value 1: found 0.5, but expected 0.0" in details
+    assert details.count("\n  line") == 10
+    assert compare_tables(actual, actual) == ""
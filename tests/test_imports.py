@@ -0,0 +1,38 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import generic_grader
+
+HEAVY_MODULES = [
+    "freezegun",
+    "matplotlib",
+    "numpy",
+    "PIL",
+    "pytesseract",
+    "rapidfuzz",
+    "scipy",
+]
+
+# Modules whose purpose is to work with a heavy dependency.
+EXCLUDED = ["generic_grader.utils.array_diff", "generic_grader.utils.plot"]
+
+package_dir = Path(generic_grader.__file__).parent
+modules = sorted(
+    ".".join(path.relative_to(package_dir.parent).with_suffix("").parts)
+    for path in package_dir.rglob("*.py")
+    if path.name != "__init__.py"
+)
+
+
+def test_heavy_dependencies_imported_lazily():
+    """Importing the test modules does not import heavy dependencies."""
+    imports = "\n".join(f"import {m}" for m in modules if m not in EXCLUDED)
+    code = (
+        f"import sys\n{imports}\n"
+        f"print(*(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
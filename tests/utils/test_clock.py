@@ -0,0 +1,132 @@
+import datetime
+import importlib
+import time
+
+import pytest
+from freezegun import freeze_time
+
+from generic_grader.utils import clock
+from generic_grader.utils.clock import FakeDatetime, fixed_clock
+
+FROZEN = datetime.datetime(2021, 1, 1, 12, 30, 5, 123)
+
+
+def read_clocks():
+    """Return the values of the standard clock entry points."""
+    return [
+        datetime.datetime.now(),
+        datetime.datetime.utcnow(),
+        datetime.datetime.today(),
+        datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=2))),
+        datetime.date.today(),
+        time.time(),
+        time.time_ns(),
+        time.localtime(),
+        time.gmtime(),
+        time.strftime("%Y-%m-%d %H:%M:%S"),
+        datetime.datetime.fromtimestamp(time.time()),
+        datetime.datetime.now().timestamp(),
+    ]
+
+
+@pytest.fixture(params=["UTC", "EST+05EDT,M3.2.0,M11.1.0", "IST-05:30"])
+def timezone(request, monkeypatch):
+    """Run the test with the local time zone set by `TZ`."""
+    monkeypatch.setenv("TZ", request.param)
+    time.tzset()
+    yield request.param
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.filterwarnings("ignore:datetime.datetime.utcnow:DeprecationWarning")
+@pytest.mark.parametrize(
+    "fixed_time",
+    [FROZEN, "2021-01-01T12:30:05.000123", "2021-01-01T14:30:05.000123+02:00"],
+)
+def test_fixed_clock_matches_freezegun(fixed_time, timezone):
+    """The standard entry points report the same times as with freezegun."""
+    with freeze_time(fixed_time):
+        expected = read_clocks()
+    with fixed_clock(fixed_time):
+        actual = read_clocks()
+    assert actual == expected
+
+
+def test_fixed_clock_restores():
+    """The real clock entry points are restored afterwards."""
+    real = datetime.datetime, datetime.date, time.time, time.localtime
+    with fixed_clock(FROZEN):
+        assert datetime.datetime is FakeDatetime
+    assert (datetime.datetime, datetime.date, time.time, time.localtime) == real
+    assert datetime.datetime.now().year > 2021
+
+
+def test_fixed_clock_patches_module_namespace(fix_syspath):
+    """Names imported into the given modules see the frozen time."""
+    fix_syspath.joinpath("clock_user.py").write_text(
+        "from datetime import datetime\n"
+        "from time import time\n"
+        "def main():\n"
+        "    return datetime.now(), time()\n"
+    )
+    clock_user = importlib.import_module("clock_user")
+
+    with fixed_clock(FROZEN, ["clock_user", "not_loaded"]):
+        now, timestamp = clock_user.main()
+    assert now == FROZEN
+    assert timestamp == FROZEN.replace(tzinfo=datetime.timezone.utc).timestamp()
+    assert clock_user.datetime is datetime.datetime
+
+
+def test_fakes_outside_fixed_clock(fix_syspath):
+    """Fakes bound while frozen use the real time afterwards."""
+    fix_syspath.joinpath("clock_import.py").write_text(
+        "from datetime import date, datetime\nfrom time import time\n"
+    )
+    with fixed_clock(FROZEN):
+        clock_import = importlib.import_module("clock_import")
+        assert clock_import.datetime is FakeDatetime
+
+    assert clock_import.datetime.now().year > 2021
+    assert clock_import.date.today().year > 2021
+    assert clock_import.time() > FROZEN.timestamp()
+
+
+def test_fake_isinstance():
+    """Real instances pass isinstance checks against the fakes."""
+    real_now = datetime.datetime.now()
+    with fixed_clock(FROZEN):
+        assert isinstance(real_now, datetime.datetime)
+        assert isinstance(real_now, datetime.date)
+        assert isinstance(datetime.datetime.now(), datetime.datetime)
+        assert datetime.datetime(2000, 1, 1) < datetime.datetime.now()
+
+
+def test_fixed_clock_monotonic_keeps_running():
+    """Monotonic clocks are not frozen, so elapsed-time loops end."""
+    with fixed_clock(FROZEN):
+        start = time.perf_counter()
+        time.sleep(0.01)
+        assert time.perf_counter() > start
+
+
+def test_fixed_clock_nested():
+    """Nested clocks apply the innermost time and unwind in order."""
+    later = datetime.datetime(2022, 2, 2)
+    with fixed_clock(FROZEN):
+        with fixed_clock(later):
+            assert datetime.datetime.now() == later
+        assert datetime.datetime.now() == FROZEN
+    assert datetime.datetime is clock._real_datetime
+
+
+def test_fixed_clock_reused():
+    """Repeated calls with the same time share one clock."""
+    assert clock._get_clock(FROZEN) is clock._get_clock(FROZEN)
+
+
+def test_fixed_clock_falls_back_to_freezegun():
+    """Strings that are not ISO 8601 are interpreted by freezegun."""
+    with fixed_clock("Jan 1 2021"):
+        assert datetime.datetime.now() == datetime.datetime(2021, 1, 1)
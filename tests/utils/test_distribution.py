@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from generic_grader.utils.distribution import MAX_LOOKS, SequentialChiSquare
+
+
+def test_looks_double():
+    """Samples double from a first sample with enough of each value."""
+    check = SequentialChiSquare({"rare": 1, "common": 99})
+    assert check.looks[0] == 500
+    assert all(b == 2 * a for a, b in zip(check.looks, check.looks[1:]))
+    assert len(check.looks) <= MAX_LOOKS
+
+
+def test_weights_are_normalized():
+    check = SequentialChiSquare({1: 2, 2: 6, 3: 0})
+    assert check.values == [1, 2]
+    assert check.probabilities.tolist() == [0.25, 0.75]
+
+
+def test_smaller_effects_need_larger_samples():
+    expected = {i: 1 for i in range(6)}
+    assert (
+        SequentialChiSquare(expected, effect_size=0.1).looks[-1]
+        > SequentialChiSquare(expected, effect_size=0.3).looks[-1]
+    )
+
+
+@pytest.mark.parametrize(
+    "expected, effect_size",
+    [({0: 0}, 0.2), ({1: 1}, 0.2), ({1: 1, 2: 1}, 0.0)],
+)
+def test_invalid_distributions(expected, effect_size):
+    with pytest.raises(ValueError):
+        SequentialChiSquare(expected, effect_size=effect_size)
+
+
+def test_decisions():
+    """Far off counts fail early, and others pass at the last look."""
+    check = SequentialChiSquare({1: 1, 2: 1})
+    n = check.looks[1]
+    assert check.decide([n, 0]) is False
+    assert check.decide([n // 2, n // 2]) is None
+    n = check.looks[-1]
+    assert check.decide([n // 2, n // 2]) is True
+    assert check.decide([n // 2 + n // 8, n // 2 - n // 8]) is False
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sequential_samples(seed):
+    """Fair dice pass and loaded dice fail."""
+    generator = np.random.default_rng(seed)
+    expected = {i: 1 for i in range(6)}
+    for probabilities, result in [
+        ([1 / 6] * 6, True),
+        ([1 / 7] * 5 + [2 / 7], False),
+    ]:
+        check = SequentialChiSquare(expected)
+        counts = np.zeros(6, int)
+        for look in check.looks:
+            counts += generator.multinomial(look - counts.sum(), probabilities)
+            decision = check.decide(counts)
+            if decision is not None:
+                break
+        assert decision is result
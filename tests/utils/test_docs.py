@@ -1,8 +1,10 @@
 import textwrap
+import unittest
 
 import pytest
 
 from generic_grader.utils.docs import (
+    LazyMessage,
     get_wrapper,
     make_call_str,
     make_line_range,
@@ -37,6 +39,26 @@ def test_make_call_str(case):
     )
 
 
+def test_make_call_str_truncates_long_arguments():
+    """Long arguments are abbreviated, and dictionaries keep their order."""
+    call_str = make_call_str("f", (list(range(1000)), "x" * 1000), {"b": 1, "a": 2})
+    assert call_str.startswith("f([0, 1, 2,")
+    assert "19, ...]" in call_str
+    assert "999" not in call_str
+    assert "x...x" in call_str
+    assert call_str.endswith(", b=1, a=2)")
+    assert len(call_str) < 400
+
+
+def test_make_call_str_is_cached_by_identity():
+    """The same argument objects are rendered once."""
+    args, kwargs = ([1, 2],), {"x": 3}
+    call_str = make_call_str("f", args, kwargs)
+    assert make_call_str("f", args, kwargs) is call_str
+    assert make_call_str("f", ([1, 2],), kwargs) == call_str
+    assert make_call_str("g", args, kwargs) == "g([1, 2], x=3)"
+
+
 ord_cases = [
     {"n": 0, "expected": "0th"},
     {"n": 1, "expected": "1st"},
@@ -109,3 +131,22 @@ def test_get_wrapper():
 
     assert wrapper.initial_indent == "  "
     assert wrapper.subsequent_indent == "  "
+
+
+def test_lazy_message_is_built_on_failure_only():
+    """unittest only renders a LazyMessage when the assertion fails."""
+    calls = []
+
+    def build():
+        calls.append(1)
+        return "details"
+
+    test = unittest.TestCase()
+    message = LazyMessage(build)
+    test.assertEqual(1, 1, msg=message)
+    assert calls == []
+
+    with pytest.raises(AssertionError, match="1 != 2 : details"):
+        test.assertEqual(1, 2, msg=message)
+    assert "prefix " + message == "prefix details"
+    assert calls == [1]
@@ -6,6 +6,7 @@ from generic_grader.utils.exceptions import (
     ExitError,
     ExtraEntriesError,
     LogLimitExceededError,
+    OutputDivergenceError,
     QuitError,
     RefFileNotFoundError,
     TurtleDoneError,
@@ -84,6 +85,14 @@ custom_errors = [
         "error": LogLimitExceededError("this is a hint"),
         "expected": "  Your program produced much more output than was expected.\n\nHint:\n  this is a hint  Make sure your program isn't stuck in an infinite\n  loop.",
     },
+    {
+        "error": OutputDivergenceError(3, "Done."),
+        "expected": "  Your program's output stopped matching the expected output at line\n  3, so it was stopped early.  Line 3 should have been 'Done.'.",
+    },
+    {
+        "error": OutputDivergenceError(2),
+        "expected": "  Your program's output stopped matching the expected output at line\n  2, so it was stopped early.  No more output was expected.",
+    },
     {
         "error": UserTimeoutError(),
         "expected": "  Your program ran for longer than expected.\n\nHint:\n  Make sure your program isn't stuck in an infinite loop.",
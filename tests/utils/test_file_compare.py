@@ -0,0 +1,84 @@
+import pytest
+
+from generic_grader.utils import file_compare
+from generic_grader.utils.file_compare import (
+    count_lines,
+    files_identical,
+    format_mismatches,
+    line_mismatches,
+)
+
+
+@pytest.fixture
+def write(tmp_path):
+    """Write bytes to a file in a temporary directory and return its path."""
+
+    def write(name, data):
+        path = tmp_path / name
+        path.write_bytes(data)
+        return path
+
+    return write
+
+
+def test_files_identical(write):
+    """Files are compared chunk by chunk."""
+    data = bytes(range(256)) * 100
+    a = write("a", data)
+    assert files_identical(a, write("b", data), chunk_size=1000)
+    assert not files_identical(a, write("c", data[:-1] + b"x"), chunk_size=1000)
+    assert not files_identical(a, write("d", data + b"x"), chunk_size=1000)
+    assert files_identical(write("e", b""), write("f", b""))
+
+
+def test_line_mismatches(write):
+    """Differing and missing lines are reported with their line numbers."""
+    actual = write("actual", b"a\r\nb\nX\nd\n")
+    expected = write("expected", b"a\nb\nc\nd\ne\n")
+    assert line_mismatches(actual, expected) == [(3, "X", "c"), (5, None, "e")]
+    assert line_mismatches(actual, expected, binary=True) == [
+        (1, b"a\r", b"a"),
+        (3, b"X", b"c"),
+        (5, None, b"e"),
+    ]
+
+
+def test_line_mismatches_stops_at_limit(write):
+    """Only the first `limit` mismatches are collected."""
+    actual = write("actual", b"x\n" * 1000)
+    expected = write("expected", b"y\n" * 1000)
+    mismatches = line_mismatches(actual, expected, limit=3)
+    assert [n for n, _, _ in mismatches] == [1, 2, 3]
+
+
+def test_format_mismatches():
+    """The description shows both lines, or which one is missing."""
+    text = format_mismatches("out.txt", [(3, "X", "c"), (5, None, "e")])
+    assert text == (
+        "\nLines of `out.txt` that differ:\n"
+        "  line 3:\n    yours:    'X'\n    expected: 'c'\n"
+        "  line 5:\n    yours:    (missing)\n    expected: 'e'"
+    )
+    mismatches = [(n, "x", "y") for n in range(file_compare.MAX_MISMATCHES)]
+    assert "(first differences only)" in format_mismatches("out.txt", mismatches)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"a",
+        b"a\n",
+        b"a\r\nb\n\nc",
+        b"a\n\n",
+        b"a\rb\r",
+        b"a\x0cb\n\x0c",
+        b"a\x1c\x1d\x1e\n",
+        "a\x85b\u2028c\u2029\n".encode(),
+    ],
+)
+def test_count_lines_matches_splitlines(write, data):
+    """Lines are counted like `str.splitlines`."""
+    with open(write("f", data)) as fo:
+        expected = len(fo.read().splitlines())
+    assert count_lines(write("f", data)) == expected
@@ -0,0 +1,124 @@
+import json
+import unittest
+
+import pytest
+from parameterized import param, parameterized
+
+from generic_grader.utils import instrumentation
+from generic_grader.utils.decorators import weighted
+from generic_grader.utils.instrumentation import (
+    add_metrics_to_results,
+    measure_test,
+    stage,
+    write_metrics,
+)
+from generic_grader.utils.options import Options
+from generic_grader.utils.reference_test import reference_test
+
+
+@pytest.fixture(autouse=True)
+def empty_metrics_log(monkeypatch):
+    """Start each test with an empty metrics log."""
+    monkeypatch.setattr(instrumentation, "metrics_log", [])
+
+
+class FakeTest(unittest.TestCase):
+    def test_nothing(self):
+        """Do nothing."""
+
+
+def test_stage_without_running_test_is_noop():
+    """Stages outside of a measured test are not recorded."""
+    with stage("import"):
+        pass
+    assert instrumentation.metrics_log == []
+
+
+def test_measure_test_records_metrics():
+    """Measured tests record wall time, cpu time, peak rss and stages."""
+    test = FakeTest("test_nothing")
+    with measure_test(test) as metrics:
+        with stage("import"):
+            pass
+        with stage("import"):
+            pass
+        with stage("call"):
+            sum(range(10000))
+
+    assert metrics["test"].endswith("FakeTest.test_nothing")
+    assert metrics["name"] == "Do nothing."
+    assert set(metrics["stages"]) == {"import", "call"}
+    assert metrics["wall_time"] >= metrics["stages"]["call"]
+    assert metrics["cpu_time"] >= 0
+    assert metrics["peak_rss_kib"] > 0
+    assert instrumentation.metrics_log == [metrics]
+
+
+def test_measure_test_records_on_failure():
+    """Metrics are recorded even when the test fails."""
+    test = FakeTest("test_nothing")
+    with pytest.raises(AssertionError):
+        with measure_test(test):
+            with stage("comparison"):
+                raise AssertionError
+    assert "comparison" in instrumentation.metrics_log[0]["stages"]
+
+
+def test_weighted_sets_metrics():
+    """The weighted decorator attaches metrics to the test method."""
+
+    class TestClass(unittest.TestCase):
+        @parameterized.expand([param(Options(weight=1))])
+        @weighted
+        def test_func(self, options):
+            with stage("comparison"):
+                self.set_score(self, options.weight)
+
+    unittest.TestLoader().loadTestsFromTestCase(TestClass).run(unittest.TestResult())
+
+    metrics = TestClass.test_func_0.__metrics__
+    assert "comparison" in metrics["stages"]
+    assert metrics["wall_time"] > 0
+
+
+def test_reference_test_stages(fix_syspath):
+    """A reference test records import, run and comparison stages."""
+    fix_syspath.joinpath("submission.py").write_text("def main():\n    print(1)")
+
+    class TestClass(unittest.TestCase):
+        @parameterized.expand(
+            [param(Options(sub_module="submission", ref_module="submission"))]
+        )
+        @weighted
+        @reference_test
+        def test_func(self, options):
+            pass
+
+    result = unittest.TestResult()
+    unittest.TestLoader().loadTestsFromTestCase(TestClass).run(result)
+    assert result.wasSuccessful()
+
+    stages = TestClass.test_func_0.__metrics__["stages"]
+    for name in ["import", "call", "reference run", "student run", "comparison"]:
+        assert name in stages
+
+
+def test_write_metrics(tmp_path):
+    """Metrics are written to a JSON sidecar."""
+    with measure_test(FakeTest("test_nothing")):
+        pass
+    filename = tmp_path / "metrics.json"
+    write_metrics(filename)
+    data = json.loads(filename.read_text())
+    assert data["tests"][0]["name"] == "Do nothing."
+
+
+def test_add_metrics_to_results():
+    """Metrics are merged into gradescope results by name in run order."""
+    with measure_test(FakeTest("test_nothing")):
+        pass
+    json_data = {"tests": [{"name": "Something else"}, {"name": "Do nothing."}]}
+    add_metrics_to_results(json_data)
+    assert "extra_data" not in json_data["tests"][0]
+    metrics = json_data["tests"][1]["extra_data"]["metrics"]
+    assert metrics["name"] == "Do nothing."
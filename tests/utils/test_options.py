@@ -1,4 +1,7 @@
+import inspect
+
 import pytest
+from attrs import evolve
 from parameterized import param
 
 from generic_grader.utils.options import Options, options_to_params
@@ -124,3 +127,48 @@ def test_duplicate_file_names(case):
     with pytest.raises(ValueError) as exc_info:
         Options(**case["options"])
     assert str(exc_info.value) == case["error"]
+
+
+def test_derive_matches_evolve():
+    """Derived options equal evolved options."""
+    o = Options(sub_module="hello_user", entries=("1",), init=lambda test, o: None)
+    changes = {"n_lines": None, "start": 3, "entries": ("2",)}
+    assert o.derive(**changes) == evolve(o, **changes)
+    assert o.derive() == o
+
+
+@pytest.mark.parametrize("case", typecheck_options)
+def test_derive_validates_changes(case):
+    """Derived options type check the changed attributes."""
+    with pytest.raises(ValueError) as exc_info:
+        Options().derive(**case["options"])
+    assert str(exc_info.value) == case["error"]
+
+
+@pytest.mark.parametrize("case", invalid_init_cases + duplicate_file_names)
+def test_derive_validates_other_changes(case):
+    """Derived options check init signatures and duplicate file names."""
+    options = case.get("options", {"init": case.get("init")})
+    with pytest.raises(ValueError) as exc_info:
+        Options().derive(**options)
+    assert str(exc_info.value) == case["error"]
+
+
+def test_derive_unknown_attribute():
+    """Unknown attributes are rejected."""
+    with pytest.raises(TypeError, match="no_such_option"):
+        Options().derive(no_such_option=1)
+
+
+def test_init_signature_checked_once(monkeypatch):
+    """The init signature is inspected once per function."""
+    calls = []
+    signature = inspect.signature
+    monkeypatch.setattr(inspect, "signature", lambda f: calls.append(f) or signature(f))
+
+    def init(test, options):
+        pass
+
+    for _ in range(3):
+        Options(init=init)
+    assert calls == [init]
@@ -0,0 +1,77 @@
+import os
+import random
+
+import pytest
+
+from generic_grader.utils.parallel import collect_outcomes
+
+
+@pytest.mark.parametrize("n_workers", [1, 2, 4])
+def test_collect_outcomes(n_workers):
+    """The outcomes of every worker are merged."""
+    outcomes = collect_outcomes(lambda: random.randint(1, 3), 200, n_workers)
+    assert outcomes == {1, 2, 3}
+
+
+def test_workers_draw_independently():
+    """Each worker reseeds the random module."""
+    random.seed(0)
+    outcomes = collect_outcomes(lambda: random.random(), 4, n_workers=4)
+    assert len(outcomes) == 4
+
+
+def test_workers_run_in_other_processes():
+    outcomes = collect_outcomes(os.getpid, 2, n_workers=2)
+    assert len(outcomes) == 2 and os.getpid() not in outcomes
+
+
+def test_collect_outcomes_stops_early(tmp_path):
+    """Every worker stops once any worker's outcomes end the trials."""
+    calls = tmp_path / "calls.txt"
+
+    def trial():
+        with open(calls, "a") as fo:
+            fo.write("x")
+        return random.random()
+
+    outcomes = collect_outcomes(
+        trial, 10_000, n_workers=2, keep_going=lambda outcomes: len(outcomes) < 5
+    )
+    assert 5 <= len(outcomes) < 100
+    assert len(calls.read_text()) < 100
+
+
+def test_collect_outcomes_setup():
+    """Each worker is set up with its index."""
+    index = []
+    outcomes = collect_outcomes(
+        lambda: index[0], 3, n_workers=3, setup=lambda worker: index.append(worker)
+    )
+    assert outcomes == {1, 2, 3}
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_collect_outcomes_error(n_workers):
+    """Errors in trials are raised again with their type and message."""
+
+    def trial():
+        raise ValueError("bad trial")
+
+    with pytest.raises(ValueError, match="bad trial"):
+        collect_outcomes(trial, 4, n_workers)
+
+
+def test_collect_outcomes_unpicklable_error():
+    def trial():
+        class Unpicklable(Exception):
+            pass
+
+        raise Unpicklable("bad trial")
+
+    with pytest.raises(RuntimeError, match="Unpicklable: bad trial"):
+        collect_outcomes(trial, 4, n_workers=2)
+
+
+def test_collect_outcomes_dead_worker():
+    with pytest.raises(RuntimeError, match="exited with code 3"):
+        collect_outcomes(lambda: os._exit(3), 2, n_workers=2)
@@ -1,4 +1,7 @@
 import datetime
+import fractions
+import pkgutil
+import sys
 import time
 
 import pytest
@@ -7,6 +10,7 @@ from generic_grader.utils.exceptions import ExitError, QuitError, UserTimeoutErr
 from generic_grader.utils.mocks import make_mock_function_raise_error
 from generic_grader.utils.options import Options
 from generic_grader.utils.patches import (
+    PatchSet,
     custom_stack,
     make_exit_quit_patches,
     make_pyplot_noop_patches,
@@ -168,3 +172,83 @@ def test_stack_extra_patches():
     with custom_stack(o):
         with pytest.raises(ValueError):
             print("Hello, world!")
+
+
+def test_patch_set_applies_and_restores():
+    """A patch set swaps attributes and restores them afterwards."""
+    original = time.sleep
+    patch_set = PatchSet(
+        [{"args": make_mock_function_raise_error("time.sleep", ValueError)}]
+    )
+    for _ in range(2):
+        with patch_set.applied():
+            with pytest.raises(ValueError):
+                time.sleep(0)
+        assert time.sleep is original
+
+
+def test_patch_set_create():
+    """Missing attributes are created only when requested and removed after."""
+    with pytest.raises(AttributeError):
+        with PatchSet([{"args": ["time.not_an_attribute", None]}]).applied():
+            pass
+
+    with PatchSet(
+        [{"args": ["time.not_an_attribute", None], "kwargs": {"create": True}}]
+    ).applied():
+        assert time.not_an_attribute is None
+    assert not hasattr(time, "not_an_attribute")
+
+
+def test_patch_set_restores_in_reverse_order():
+    """Patching the same target twice restores the original."""
+    original = time.sleep
+    with PatchSet([{"args": ["time.sleep", 1]}, {"args": ["time.sleep", 2]}]).applied():
+        assert time.sleep == 2
+    assert time.sleep is original
+
+
+def test_patch_set_restores_inherited_attribute():
+    """Attributes inherited from a class are deleted, not copied, on restore."""
+
+    class Base:
+        value = 1
+
+    class Child(Base):
+        pass
+
+    sys.modules[__name__].Child = Child
+    try:
+        with PatchSet([{"args": [f"{__name__}.Child.value", 2]}]).applied():
+            assert Child.value == 2
+        assert "value" not in vars(Child)
+        assert Child.value == 1
+    finally:
+        del sys.modules[__name__].Child
+
+
+def test_patch_set_caches_owners(monkeypatch):
+    """Non-module owners are resolved once while their module is loaded."""
+    calls = []
+    resolve_name = pkgutil.resolve_name
+
+    def counting_resolve_name(name):
+        calls.append(name)
+        return resolve_name(name)
+
+    monkeypatch.setattr(pkgutil, "resolve_name", counting_resolve_name)
+    patch_set = PatchSet(
+        [{"args": ["fractions.Fraction.fake", 1], "kwargs": {"create": True}}]
+    )
+    for _ in range(3):
+        with patch_set.applied():
+            assert fractions.Fraction.fake == 1
+    assert calls == ["fractions.Fraction"]
+
+
+def test_patch_set_falls_back_to_mock_patch():
+    """Patches with other mock.patch arguments still work."""
+    with PatchSet(
+        [{"args": ["time.sleep"], "kwargs": {"return_value": "mocked"}}]
+    ).applied():
+        assert time.sleep(10) == "mocked"
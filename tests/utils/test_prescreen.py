@@ -0,0 +1,116 @@
+import csv
+import json
+
+import pytest
+
+from generic_grader.utils.prescreen import (
+    find_submissions,
+    main,
+    prescreen,
+    reference_metrics,
+    screen_file,
+)
+
+reference = '''\
+"""
+Author: Ref, ref@purdue.edu
+Assignment: 01.1 - Hello
+
+Description:
+    Say hello.
+"""
+
+
+def main():
+    # Say hello a few times.
+    for i in range(3):
+        print("Hello")
+'''
+
+submissions = {
+    "alice": reference,
+    "bob": "def main(:\n    pass\n",
+    "carol": "class Greeter:\n    pass\n\nmain = print\n",
+}
+
+
+@pytest.fixture
+def submissions_dir(tmp_path):
+    """Make a directory with one folder per submission."""
+    for name, source in submissions.items():
+        folder = tmp_path / "submissions" / name
+        folder.mkdir(parents=True)
+        folder.joinpath("hello.py").write_text(source)
+    tmp_path.joinpath("reference.py").write_text(reference)
+    return tmp_path
+
+
+def test_find_submissions(submissions_dir):
+    """Submitted files are found in every submission folder."""
+    paths = find_submissions(submissions_dir / "submissions", "hello")
+    assert [p.parent.name for p in paths] == ["alice", "bob", "carol"]
+
+
+def test_screen_file(submissions_dir):
+    """A well formed submission gets all of the metrics."""
+    row = screen_file(
+        submissions_dir / "submissions" / "alice" / "hello.py",
+        reference=reference_metrics(submissions_dir / "reference.py"),
+        functions=["main"],
+        classes=["Greeter"],
+        min_loop_depth=1,
+        root=submissions_dir / "submissions",
+    )
+    assert row["submission"] == "alice/hello.py"
+    assert row["error"] == ""
+    assert row["length_ratio"] == 1.0
+    assert row["length_ok"] and row["comments_ok"] and row["loop_depth_ok"]
+    assert row["function:main"] is True
+    assert row["class:Greeter"] is False
+    assert row["author"] == "Ref, ref@purdue.edu"
+    assert row["description_chars"] > 0
+
+
+def test_screen_file_with_errors(submissions_dir):
+    """Submissions that can't be parsed report the error."""
+    row = screen_file(submissions_dir / "submissions" / "bob" / "hello.py")
+    assert row["error"].startswith(("SyntaxError", "TokenError"))
+    assert "max_loop_depth" not in row
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_prescreen(submissions_dir, workers):
+    """Rows are returned in the order of the paths."""
+    paths = find_submissions(submissions_dir / "submissions", "hello")
+    rows = prescreen(paths, workers=workers, functions=["main"], classes=["Greeter"])
+    assert [row.get("function:main") for row in rows] == [True, None, False]
+    assert [row.get("class:Greeter") for row in rows] == [False, None, True]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+def test_main(submissions_dir, suffix, capsys):
+    """The command line writes one row per submission."""
+    output = submissions_dir / f"prescreen{suffix}"
+    argv = [
+        str(submissions_dir / "submissions"),
+        "--module=hello",
+        f"--reference={submissions_dir / 'reference.py'}",
+        "--function=main",
+        "--min-loop-depth=1",
+        "--workers=2",
+        f"--output={output}",
+    ]
+    assert main(argv) == 0
+    assert "Screened 3 submissions" in capsys.readouterr().out
+
+    with open(output) as fo:
+        if suffix == ".csv":
+            rows = list(csv.DictReader(fo))
+        else:
+            rows = [json.loads(line) for line in fo]
+    assert [row["submission"] for row in rows] == [
+        "alice/hello.py",
+        "bob/hello.py",
+        "carol/hello.py",
+    ]
+    assert str(rows[0]["loop_depth_ok"]) == "True"
@@ -0,0 +1,74 @@
+import importlib
+import unittest
+
+import pytest
+
+from generic_grader.utils.exceptions import UserTimeoutError
+from generic_grader.utils.options import Options
+from generic_grader.utils.profiler import SamplingProfiler
+from generic_grader.utils.user import SubUser
+
+busy_loop = """\
+def main():
+    total = 0
+    for i in range(10**9):
+        total += i
+        if total < 0:
+            break
+"""
+
+
+class FakeTest(unittest.TestCase):
+    pass
+
+
+def test_profiler_samples_lines(fix_syspath):
+    """The profiler attributes samples to lines of the profiled file."""
+    fix_syspath.joinpath("busy.py").write_text(busy_loop.replace("10**9", "10**6"))
+    busy = importlib.import_module("busy")
+
+    with SamplingProfiler(busy.__file__, interval=0.001) as profiler:
+        busy.main()
+
+    assert profiler.samples > 0
+    assert set(profiler.line_counts) <= {2, 3, 4, 5, 6}
+    lineno, count = profiler.hot_lines(1)[0]
+    assert count > 0
+    table = profiler.format_table()
+    assert "Time spent by line" in table
+    assert f"{lineno:6d} |" in table
+
+
+def test_profiler_ignores_other_files(fix_syspath):
+    """Samples outside of the profiled file are not attributed to lines."""
+    with SamplingProfiler("not_a_file.py", interval=0.001) as profiler:
+        sum(range(10**6))
+    assert profiler.line_counts == {}
+    assert profiler.format_table() == ""
+
+
+def test_timeout_message_includes_profile(fix_syspath):
+    """A timeout with profiling enabled reports the hottest lines."""
+    fix_syspath.joinpath("busy.py").write_text(busy_loop)
+    user = SubUser(FakeTest(), Options(sub_module="busy", profile_timeouts=True))
+
+    with pytest.raises(UserTimeoutError) as exc_info:
+        user.call_obj()
+
+    message = str(exc_info.value)
+    assert "Time spent by line (sampled):" in message
+    # Samples land where the interpreter switches threads, which is
+    # somewhere in the loop.
+    loop_lines = ["for i in range", "total += i", "if total < 0"]
+    assert any(line in message for line in loop_lines)
+
+
+def test_timeout_message_without_profile(fix_syspath):
+    """Profiling is opt-in."""
+    fix_syspath.joinpath("busy.py").write_text(busy_loop)
+    user = SubUser(FakeTest(), Options(sub_module="busy"))
+
+    with pytest.raises(UserTimeoutError) as exc_info:
+        user.call_obj()
+
+    assert "Time spent by line" not in str(exc_info.value)
@@ -3,7 +3,7 @@ import unittest
 
 import pytest
 
-from generic_grader.utils.exceptions import RefFileNotFoundError
+from generic_grader.utils.exceptions import OutputDivergenceError, RefFileNotFoundError
 from generic_grader.utils.options import Options
 from generic_grader.utils.reference_test import reference_test
 
@@ -127,3 +127,32 @@ def test_init(fix_syspath, capsys):
     ft.test(o)
     captured = capsys.readouterr()
     assert captured.out == "init\ninit\n"
+
+
+def test_stop_on_divergence(fix_syspath):
+    """Test that a student run stops at the first line of output that differs
+    from the reference output.
+    """
+    ref_file = fix_syspath / "ref_test.py"
+    ref_file.write_text("def main():\n    print('Hello')\n    print('World!')")
+    sub_file = fix_syspath / "sub_test.py"
+    sub_file.write_text(
+        "def main():\n    print('Hello')\n    while True:\n        print('Hi')"
+    )
+    o = Options(
+        sub_module="sub_test",
+        ref_module="ref_test",
+        stop_on_divergence=True,
+        time_limit=10,
+    )
+
+    class FakeTest(unittest.TestCase):
+        @reference_test
+        def test(self, options):
+            """This can do nothing because we are testing the decorator."""
+
+    ft = FakeTest()
+    with pytest.raises(OutputDivergenceError, match=r"at line\s+2,"):
+        ft.test(o)
+    # The run stops as soon as the partial line "Hi" differs.
+    assert ft.student_user.log.getvalue() == "Hello\nHi"
@@ -1,10 +1,13 @@
+import signal
 import time
 
 import pytest
 
 from generic_grader.utils.exceptions import UserTimeoutError
 from generic_grader.utils.resource_limits import (
+    TimeBudget,
     _get_current_vm_bytes,
+    cpu_time_limit,
     memory_limit,
     time_limit,
 )
@@ -89,3 +92,78 @@ def test_memory_limit_restores_on_error():
     soft_after, hard_after = resource.getrlimit(resource.RLIMIT_AS)
     assert soft_before == soft_after
     assert hard_before == hard_after
+
+
+def test_time_limit_fractional():
+    """Fractional time limits interrupt the block well before a second."""
+    start = time.perf_counter()
+    with pytest.raises(UserTimeoutError, match="0.1 seconds"):
+        with time_limit(0.1):
+            time.sleep(1)
+    assert time.perf_counter() - start < 0.5
+
+
+def test_time_limit_message_singular():
+    """A one second limit is reported in the singular."""
+    with pytest.raises(UserTimeoutError, match="is 1 second\\."):
+        with time_limit(1):
+            time.sleep(2)
+
+
+def test_time_limit_zero_disables():
+    """A limit of 0 means no limit."""
+    with time_limit(0):
+        time.sleep(0.05)
+
+
+def test_time_limit_restores_handler():
+    """The previous SIGALRM handler is restored."""
+    before = signal.getsignal(signal.SIGALRM)
+    with time_limit(0.5):
+        pass
+    assert signal.getsignal(signal.SIGALRM) is before
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+
+def test_cpu_time_limit():
+    """CPU bound code is interrupted by the CPU time limit."""
+    with pytest.raises(UserTimeoutError, match="CPU time limit"):
+        with cpu_time_limit(0.1):
+            while True:
+                pass
+
+
+def test_cpu_time_limit_ignores_sleep():
+    """Sleeping does not use CPU time."""
+    with cpu_time_limit(0.05):
+        time.sleep(0.2)
+
+
+def test_time_budget_limits_repeated_calls():
+    """The budget is shared across repeated blocks."""
+    budget = TimeBudget(0.25)
+    with time_limit(1, budget):
+        time.sleep(0.1)
+    assert 0.1 <= budget.used < 0.25
+
+    with pytest.raises(UserTimeoutError, match="total time limit"):
+        with time_limit(1, budget):
+            time.sleep(1)
+    assert budget.remaining <= 0.01
+
+    # Once exhausted, the next block fails immediately.
+    with pytest.raises(UserTimeoutError, match="total time limit"):
+        with time_limit(1, budget):
+            pass  # pragma: no cover
+
+
+def test_memory_limit_counts_retained_memory():
+    """Memory kept from earlier calls doesn't reduce the next call's limit."""
+    kept = []
+    with memory_limit(1):
+        kept.append(bytearray(int(0.6 * 2**30)))
+    with memory_limit(1):
+        bytearray(int(0.6 * 2**30))
+    with pytest.raises(MemoryError, match="maximum allowed memory of 1 GiB"):
+        with memory_limit(1):
+            bytearray(int(1.2 * 2**30))
@@ -0,0 +1,151 @@
+import json
+import unittest
+
+from parameterized import parameterized
+
+from generic_grader.utils.decorators import weighted
+from generic_grader.utils.options import Options
+from generic_grader.utils.results import (
+    ResultsFile,
+    StreamingJSONTestRunner,
+    main,
+    truncate,
+)
+
+NAMES = {
+    "test_1_pass": "Passing test",
+    "test_2_partial": "Partial credit test",
+    "test_3_fail": "Failing test",
+}
+
+
+def doc_func(func, num, param):
+    return NAMES[func.__name__]
+
+
+def make_suite(results_path=None):
+    """Return a suite with a passing, a partial credit and a failing test."""
+    snapshots = []
+
+    class FakeTest(unittest.TestCase):
+        @parameterized.expand([Options(weight=2)], doc_func=doc_func)
+        @weighted
+        def test_1_pass(self, options):
+            if results_path is not None:
+                snapshots.append(json.loads(results_path.read_text()))
+            self.set_score(self, 2)
+
+        @parameterized.expand([Options(weight=4)], doc_func=doc_func)
+        @weighted
+        def test_2_partial(self, options):
+            print("some output")
+            self.set_score(self, 1)
+
+        @parameterized.expand([Options(weight=3)], doc_func=doc_func)
+        @weighted
+        def test_3_fail(self, options):
+            if results_path is not None:
+                snapshots.append(json.loads(results_path.read_text()))
+            self.fail("x" * 50_000)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(FakeTest)
+    return suite, snapshots
+
+
+def test_truncate():
+    assert truncate("short", 10) == "short"
+    text = truncate("a" * 50 + "b" * 50, 20)
+    assert text.startswith("a" * 10) and text.endswith("b" * 10)
+    assert "(80 characters omitted)" in text
+
+
+def test_results_file_is_valid_after_every_result(tmp_path):
+    path = tmp_path / "results.json"
+    with open(path, "w") as fo:
+        results_file = ResultsFile(fo, {"visibility": "visible"})
+        assert json.loads(path.read_text()) == {
+            "visibility": "visible",
+            "tests": [],
+            "leaderboard": [],
+            "score": 0.0,
+        }
+        results_file.add_test({"name": "a", "score": 1.5})
+        results_file.add_test({"name": "b", "score": 2})
+        results_file.add_leaderboard_entry({"name": "speed", "value": 3})
+        assert json.loads(path.read_text())["score"] == 3.5
+        results_file.finish(execution_time="0.10")
+    assert json.loads(path.read_text()) == {
+        "visibility": "visible",
+        "tests": [{"name": "a", "score": 1.5}, {"name": "b", "score": 2}],
+        "leaderboard": [{"name": "speed", "value": 3}],
+        "score": 3.5,
+        "execution_time": "0.10",
+    }
+
+
+def test_streaming_runner(tmp_path):
+    """Results are streamed, shortened, and match gradescope-utils' format."""
+    path = tmp_path / "results.json"
+    suite, snapshots = make_suite(path)
+    result = StreamingJSONTestRunner(path, max_output=1000).run(suite)
+
+    data = json.loads(path.read_text())
+    assert [t["name"] for t in data["tests"]] == [
+        "Passing test",
+        "Partial credit test",
+        "Failing test",
+    ]
+    assert [(t["score"], t["max_score"], t["status"]) for t in data["tests"]] == [
+        (2, 2, "passed"),
+        (1, 4, "failed"),
+        (0, 3, "failed"),
+    ]
+    assert data["score"] == 3
+    assert data["tests"][1]["output"] == "some output\n"
+    output = data["tests"][2]["output"]
+    assert output.startswith("Test Failed: xxx") and len(output) < 1100
+    assert "characters omitted" in output
+    assert "execution_time" in data
+
+    # Earlier results were in the file while later tests ran.
+    assert snapshots[0]["tests"] == []
+    assert len(snapshots[1]["tests"]) == 2
+
+    # Failure messages aren't kept in memory.
+    assert len(result.failures) == 1 and result.failures[0][1] == ""
+    assert not result.wasSuccessful()
+
+
+def test_streaming_runner_metrics(tmp_path):
+    path = tmp_path / "results.json"
+    suite, _ = make_suite()
+    StreamingJSONTestRunner(path, include_metrics=True).run(suite)
+    data = json.loads(path.read_text())
+    metrics = data["tests"][0]["extra_data"]["metrics"]
+    assert metrics["name"] == "Passing test"
+    assert "wall_time" in metrics
+
+
+def test_streaming_runner_failfast(tmp_path):
+    path = tmp_path / "results.json"
+    suite, _ = make_suite()
+    suite = unittest.TestSuite(reversed(list(suite)))  # Fail first.
+    result = StreamingJSONTestRunner(path, failfast=True).run(suite)
+    assert result.testsRun == 1
+    assert len(json.loads(path.read_text())["tests"]) == 1
+
+
+def test_results_main(tmp_path, monkeypatch):
+    tmp_path.joinpath("config_tests.py").write_text(
+        "import unittest\n\n"
+        "class Test(unittest.TestCase):\n"
+        "    def test(self):\n"
+        "        pass\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(tmp_path)
+    assert main(["config_tests.py", "--output", "out.json"]) == 0
+    data = json.loads(tmp_path.joinpath("out.json").read_text())
+    assert data["tests"] == [
+        {"name": "test (config_tests.Test.test)", "status": "passed"}
+    ]
@@ -0,0 +1,224 @@
+import random
+
+import numpy
+import pytest
+
+from generic_grader.utils.options import Options
+from generic_grader.utils.rng import (
+    CONFIRMING_CALLS,
+    MAX_TRACED_DRAWS,
+    RecordingRandom,
+    SeededRandom,
+    TracingRandom,
+    UntraceableDraw,
+    no_draws_hint,
+    trace_outcomes,
+    trial_seeds,
+)
+from generic_grader.utils.user import SubUser
+
+draws = """\
+import random
+from random import choice, randint
+
+def main():
+    return [randint(1, 100), random.random(), choice("abc")]
+"""
+
+
+def test_recording_random_counts_draws():
+    """Each random value counts the raw draws behind it."""
+    rng = RecordingRandom(1)
+    rng.random()
+    assert rng.draws == 1
+    rng.randint(1, 6)  # Rejection sampling may draw more than once.
+    assert rng.draws >= 2
+    assert RecordingRandom(1).random() == random.Random(1).random()
+
+
+def test_seeded_draws_are_reproducible(fix_syspath):
+    """The module functions and imported names draw from the seeded stream."""
+    fix_syspath.joinpath("draws.py").write_text(draws)
+    import draws as module
+
+    results = []
+    for _ in range(2):
+        rng = SeededRandom(7)
+        with rng.applied(["draws"]):
+            results.append(module.main())
+        assert rng.draws >= 3
+    assert results[0] == results[1]
+
+    # The functions are restored.
+    assert module.randint is random.randint
+    assert random.random.__self__ is random._inst
+
+
+def test_seeded_stream_continues_across_calls():
+    """Repeated applications continue one stream instead of restarting it."""
+    rng = SeededRandom(3)
+    with rng.applied():
+        first = random.random()
+    with rng.applied():
+        second = random.random()
+    expected = random.Random(3)
+    assert [first, second] == [expected.random(), expected.random()]
+
+
+def test_seeding_leaves_global_stream_alone():
+    """Draws inside an application don't consume the global stream."""
+    random.seed(5)
+    expected = random.Random(5).random()
+    with SeededRandom(1).applied():
+        random.random()
+    assert random.random() == expected
+
+
+def test_seeded_numpy_draws():
+    """numpy's global generator is seeded and its use is counted."""
+    numpy.random.seed(5)
+    expected = numpy.random.RandomState(5).randint(100)
+    results = []
+    for _ in range(2):
+        rng = SeededRandom(11)
+        with rng.applied():
+            results.append(numpy.random.randint(100, size=3).tolist())
+        assert rng.draws == 1
+    assert results[0] == results[1]
+    assert numpy.random.randint(100) == expected
+
+
+@pytest.mark.parametrize(
+    "seed, expected", [(None, [None, None]), (4, [4, 5]), (0, [0, 1])]
+)
+def test_trial_seeds(seed, expected):
+    assert trial_seeds(seed) == expected
+
+
+def test_seeded_user_draws(fix_syspath):
+    """Users with a seed draw reproducible values and record the draws."""
+    fix_syspath.joinpath("draws.py").write_text(draws)
+    o = Options(sub_module="draws", seed=2)
+    users = [SubUser(None, o), SubUser(None, o)]
+    assert users[0].call_obj() == users[1].call_obj()
+    assert users[0].rng.draws == users[1].rng.draws >= 3
+    assert no_draws_hint(users[0]) == ""
+    assert "did not draw" in no_draws_hint(SubUser(None, o))
+    assert no_draws_hint(SubUser(None, o.derive(seed=None))) == ""
+
+
+def test_helper_module_draws(fix_syspath):
+    """Draws through names a helper module imported from `random` aren't
+    seeded, but they suppress the no draws hint and make tracing incomplete.
+    """
+    fix_syspath.joinpath("helper.py").write_text(
+        "from random import randint\n\ndef roll():\n    return randint(1, 6)\n"
+    )
+    fix_syspath.joinpath("uses_helper.py").write_text(
+        "import helper\n\ndef main():\n    return helper.roll()\n"
+    )
+    import helper  # noqa: F401 (bind `randint` before any patching)
+
+    user = SubUser(None, Options(sub_module="uses_helper", seed=3))
+    user.call_obj()
+    assert user.rng.draws == 0
+    assert user.rng.unseeded_draws == 1
+    assert no_draws_hint(user) == ""
+
+    user = SubUser(None, Options(sub_module="uses_helper"))
+    _, complete, calls = trace_outcomes(user, max_calls=100)
+    assert (complete, calls) == (False, 1)
+
+
+def test_tracing_random_forces_draws():
+    """Traced draws take the forced indices, then the first value."""
+    generator = TracingRandom(forced=(2, 1))
+    assert generator.randint(5, 8) == 7
+    assert generator.choice("xyz") == "y"
+    assert generator.randrange(10, 20, 5) == 10
+    assert generator.sizes == [4, 3, 2]
+
+
+@pytest.mark.parametrize(
+    "draw",
+    [
+        lambda g: g.random(),
+        lambda g: g.uniform(1, 2),
+        lambda g: g.shuffle([1, 2]),
+        lambda g: [g.randint(1, 2) for _ in range(MAX_TRACED_DRAWS + 1)],
+    ],
+)
+def test_tracing_random_untraceable_draws(draw):
+    with pytest.raises(UntraceableDraw):
+        draw(TracingRandom())
+
+
+@pytest.mark.parametrize(
+    "draw, error",
+    [(lambda g: g.randint(2, 1), ValueError), (lambda g: g.choice([]), IndexError)],
+)
+def test_tracing_random_usual_errors(draw, error):
+    with pytest.raises(error):
+        draw(TracingRandom())
+
+
+trace_cases = [
+    {
+        "body": "return randint(1, 3) * 10 + randint(1, 2)",
+        "outcomes": {11, 12, 21, 22, 31, 32},
+        "complete": True,
+        "calls": 6 + CONFIRMING_CALLS,
+    },
+    {  # The second draw depends on the first.
+        "body": "n = randint(0, 2)\n    return n if n == 0 else (n, choice('ab'))",
+        "outcomes": {0, (1, "a"), (1, "b"), (2, "a"), (2, "b")},
+        "complete": True,
+        "calls": 5 + CONFIRMING_CALLS,
+    },
+    {"body": "return 4", "outcomes": {4}, "complete": False, "calls": 1},
+    {
+        "body": "return random.random()",
+        "outcomes": set(),
+        "complete": False,
+        "calls": 1,
+    },
+    {  # Reseeding makes the traced draws meaningless.
+        "body": "random.seed(1)\n    return randint(1, 6)",
+        "outcomes": set(),
+        "complete": False,
+        "calls": 1,
+    },
+    {
+        "body": "random.setstate(random.Random(1).getstate())\n"
+        "    return randint(1, 6)",
+        "outcomes": set(),
+        "complete": False,
+        "calls": 1,
+    },
+    {  # An untraced generator is caught by the confirming calls.
+        "body": "return randint(1, 2) + random.Random().random()",
+        "complete": False,
+        "calls": 3,
+    },
+    {  # Too many outcomes to enumerate.
+        "body": "return randint(1, 1000)",
+        "outcomes": {1},
+        "complete": False,
+        "calls": 1,
+    },
+]
+
+
+@pytest.mark.parametrize("case", trace_cases)
+def test_trace_outcomes(case, fix_syspath):
+    """Traced calls enumerate the reachable outcomes when they can."""
+    fix_syspath.joinpath("traced.py").write_text(
+        "import random\nfrom random import choice, randint\n\n"
+        f"def main():\n    {case['body']}\n"
+    )
+    user = SubUser(None, Options(sub_module="traced"))
+    outcomes, complete, calls = trace_outcomes(user, max_calls=100)
+    assert (complete, calls) == (case["complete"], case["calls"])
+    if "outcomes" in case:
+        assert outcomes == case["outcomes"]
+    assert user.rng is None
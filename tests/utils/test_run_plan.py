@@ -0,0 +1,199 @@
+import unittest
+
+import numpy  # noqa: F401 (imported here so fix_syspath doesn't unload it)
+import pytest
+from attrs import fields
+
+from generic_grader.file import file_closed, file_is_identical
+from generic_grader.function import function_return_values_match_reference
+from generic_grader.output import output_lines_match_reference
+from generic_grader.utils.options import Options
+from generic_grader.utils.run_plan import (
+    COMPARISON_FIELDS,
+    EXECUTION_FIELDS,
+    RunPlan,
+    clear_plan,
+    execution_signature,
+    plan_runs,
+)
+
+counting_main = """\
+def main():
+    with open("{name}_calls.txt", "a") as fo:
+        fo.write("x")
+    name = input("Name? ")
+    print(f"Hello, {{name}}!")
+    return name
+"""
+
+
+@pytest.fixture
+def counting_modules(fix_syspath):
+    """Write reference and student modules that count their calls."""
+    for name in ("ref", "sub"):
+        fix_syspath.joinpath(f"{name}.py").write_text(counting_main.format(name=name))
+    yield fix_syspath
+    clear_plan()
+
+
+def n_calls(path, name):
+    calls = path / f"{name}_calls.txt"
+    return len(calls.read_text()) if calls.exists() else 0
+
+
+def run_classes(*classes):
+    """Run the tests of `classes` in order and return the result."""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite(loader.loadTestsFromTestCase(cls) for cls in classes)
+    result = unittest.TestResult()
+    suite.run(result)
+    return result
+
+
+def test_signature_ignores_comparison_options():
+    """Options that only configure the comparison don't change the run."""
+    o = Options(sub_module="sub", entries=("Ann",))
+    assert execution_signature(o) == execution_signature(
+        o.derive(weight=3, line_n=2, ratio=0.5, hint="Look closer.")
+    )
+    assert execution_signature(o) != execution_signature(o.derive(entries=("Bob",)))
+    assert execution_signature(o) != execution_signature(o.derive(args=(1,)))
+
+
+def test_fields_are_declared():
+    """Every option configures either the execution or the comparison."""
+    names = {f.name for f in fields(Options)}
+    assert names == set(EXECUTION_FIELDS) | COMPARISON_FIELDS
+    assert not set(EXECUTION_FIELDS) & COMPARISON_FIELDS
+
+
+def test_signature_compares_values():
+    """Values that print alike but differ don't share a run."""
+    o = Options(sub_module="sub", args=(1,))
+    assert execution_signature(o) != execution_signature(o.derive(args=(1.0,)))
+    assert execution_signature(o) != execution_signature(o.derive(args=(True,)))
+    long_a, long_b = list(range(2000)), list(range(2000))
+    long_b[1000] = -1
+    assert execution_signature(o.derive(args=(long_a,))) != execution_signature(
+        o.derive(args=(long_b,))
+    )
+    assert execution_signature(o.derive(args=(len, {"a": {1, 2}}))) == (
+        execution_signature(o.derive(args=(len, {"a": {2, 1}})))
+    )
+
+
+class Point:
+    def __init__(self, x):
+        self.x = x
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"args": (numpy.arange(2000),)},
+        {"args": (Point(1),)},
+        {"kwargs": {"p": Point(1)}},
+        {"init": lambda test, options: None},
+    ],
+)
+def test_unshareable_signatures(changes):
+    """Runs with values that can't be compared, or an `init`, aren't shared."""
+    o = Options(sub_module="sub").derive(**changes)
+    assert execution_signature(o) is None
+    plan = RunPlan([output_lines_match_reference.build([o, o])])
+    assert plan.remaining == {} and plan.shared == 0
+
+
+def test_plan_counts_built_classes():
+    """The plan counts the reference tests of each built class."""
+    o = Options(sub_module="sub", entries=("Ann",))
+    plan = RunPlan(
+        [
+            output_lines_match_reference.build([o, o.derive(entries=("Bob",))]),
+            function_return_values_match_reference.build(o.derive(weight=2)),
+        ]
+    )
+    assert plan.remaining[execution_signature(o)] == 2
+    assert plan.shared == 1
+
+
+def test_shared_runs_execute_once(counting_modules):
+    """Identical executions across test classes run once."""
+    o = Options(ref_module="ref", sub_module="sub", entries=("Ann",), weight=1)
+    classes = [
+        output_lines_match_reference.build(o),
+        output_lines_match_reference.build(o.derive(n_lines=1)),
+        function_return_values_match_reference.build(o),
+    ]
+    plan = plan_runs(*classes)
+    result = run_classes(*classes)
+
+    assert result.wasSuccessful(), result.failures + result.errors
+    assert result.testsRun == 3
+    assert n_calls(counting_modules, "ref") == 1
+    assert n_calls(counting_modules, "sub") == 1
+    assert plan.remaining == {} and plan.runs == {}
+
+
+def test_unplanned_runs_are_not_shared(counting_modules):
+    """Without a plan, every test runs the code."""
+    o = Options(ref_module="ref", sub_module="sub", entries=("Ann",))
+    classes = [
+        output_lines_match_reference.build(o),
+        function_return_values_match_reference.build(o),
+    ]
+    assert run_classes(*classes).wasSuccessful()
+    assert n_calls(counting_modules, "sub") == 2
+
+
+def test_shared_failure_is_replayed(counting_modules):
+    """Every test that shares a failing run fails the same way."""
+    counting_modules.joinpath("sub.py").write_text("def main():\n    1 / 0\n")
+    o = Options(ref_module="ref", sub_module="sub", entries=("Ann",))
+    classes = [
+        output_lines_match_reference.build(o),
+        function_return_values_match_reference.build(o),
+    ]
+    plan_runs(*classes)
+    result = run_classes(*classes)
+
+    assert result.testsRun == 2
+    messages = [message for _, message in result.failures]
+    assert len(messages) == 2
+    assert all("ZeroDivisionError" in message for message in messages)
+
+
+def test_shared_files_and_warnings(counting_modules):
+    """Shared runs restore the produced files and re-issue their warnings."""
+    writer = "def main():\n    f = open('out.txt', 'w')\n    f.write('Hi')\n"
+    counting_modules.joinpath("ref.py").write_text(writer + "    f.close()\n")
+    counting_modules.joinpath("sub.py").write_text(writer)
+    o = Options(ref_module="ref", sub_module="sub", filenames=("out.txt",))
+    classes = [file_is_identical.build(o), file_closed.build(o)]
+    plan = plan_runs(*classes)
+    assert plan.shared == 1
+    result = run_classes(*classes)
+
+    assert result.testsRun == 2
+    assert result.errors == []
+    assert len(result.failures) == 1
+    assert "failed to close the file `out.txt`" in result.failures[0][1]
+    assert counting_modules.joinpath("sub_out.txt").read_text() == "Hi"
+
+
+def test_init_runs_are_not_shared(counting_modules):
+    """Tests with an `init` function run it, and the code, themselves."""
+    calls = []
+
+    def init(test, options):
+        calls.append(test)
+
+    o = Options(ref_module="ref", sub_module="sub", entries=("Ann",), init=init)
+    classes = [
+        output_lines_match_reference.build(o),
+        function_return_values_match_reference.build(o),
+    ]
+    plan_runs(*classes)
+    assert run_classes(*classes).wasSuccessful()
+    assert n_calls(counting_modules, "sub") == 2
+    assert len(calls) == 4  # Before each reference and student run.
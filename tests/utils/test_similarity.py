@@ -0,0 +1,81 @@
+import random
+import unittest
+
+import pytest
+from rapidfuzz.distance.Levenshtein import normalized_similarity
+
+from generic_grader.utils.similarity import (
+    assert_similar,
+    line_report,
+    max_distance,
+    similarity_at_least,
+)
+
+
+def test_similarity_at_least_agrees_with_rapidfuzz():
+    """The bounded similarity passes exactly when the full one does."""
+    rng = random.Random(0)
+    ratios = [0, 0.1, 1 / 3, 0.5, 0.6, 2 / 3, 0.75, 0.8, 0.9, 11 / 12, 1]
+    for _ in range(5000):
+        a = "".join(rng.choice("ab") for _ in range(rng.randint(0, 12)))
+        b = "".join(rng.choice("ab") for _ in range(rng.randint(0, 12)))
+        ratio = rng.choice(ratios)
+        similarity = normalized_similarity(a, b)
+        expected = similarity if similarity >= ratio else None
+        assert similarity_at_least(a, b, ratio) == expected, (a, b, ratio)
+
+
+@pytest.mark.parametrize(
+    "longest, ratio, expected",
+    [(0, 0.9, 0), (10, 1.0, 0), (10, 0.9, 1), (10, 0.0, 10), (3, 2 / 3, 1)],
+)
+def test_max_distance(longest, ratio, expected):
+    """The largest passing distance is found despite rounding."""
+    assert max_distance(longest, ratio) == expected
+
+
+def test_similarity_at_least_rejects_length_mismatch():
+    """Strings that differ too much in length fail without a distance."""
+    assert similarity_at_least("a" * 10, "a" * 100_000, 0.5) is None
+    assert similarity_at_least("", "", 0.9) == 1.0
+
+
+def test_line_report():
+    """Lines below the ratio are reported with their similarity."""
+    actual = "Hello, AJ!\nTotal: 10\n"
+    expected = "Hello, AJ!\nSum: 12\nBye\n"
+    assert line_report(actual, expected, 0.9) == (
+        "\n\nLines that are not similar enough:\n"
+        "  line 2 (33% similar):\n"
+        "    yours:    'Total: 10'\n"
+        "    expected: 'Sum: 12'\n"
+        "  line 3 (0% similar):\n"
+        "    yours:    (missing)\n"
+        "    expected: 'Bye'"
+    )
+    assert line_report(actual, actual, 0.9) == ""
+    assert line_report("x\n" * 50, "y\n" * 50, 0.9, limit=2).count("line ") == 2
+
+
+def test_assert_similar():
+    """Dissimilar strings fail with the given message."""
+    test = unittest.TestCase()
+    assert_similar(test, "Hello, world!", "Hello, world?", 0.9)
+    with pytest.raises(
+        AssertionError, match=r"^0\.1538\d* not greater than or equal to 0\.9 : Hint"
+    ):
+        assert_similar(test, "Hello, world!", "Goodbye!", 0.9, msg="Hint")
+
+
+@pytest.mark.parametrize(
+    "actual, expected, passes",
+    [(12345, "12345", True), (1.5, "1.25", False), (None, "abc", False)],
+)
+def test_assert_similar_non_str(actual, expected, passes):
+    """Values that aren't strings fail cleanly instead of raising TypeError."""
+    test = unittest.TestCase()
+    if passes:
+        assert_similar(test, actual, expected, 0.9)
+    else:
+        with pytest.raises(AssertionError, match="not greater than or equal to 0.9"):
+            assert_similar(test, actual, expected, 0.9)
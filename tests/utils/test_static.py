@@ -1,8 +1,21 @@
+import ast
+import io
+import os
+import tokenize
 import unittest
 
+import attrs
 import pytest
 
-from generic_grader.utils.static import get_comments, get_tokens
+from generic_grader.utils.static import (
+    LoopDepthTracker,
+    analyze,
+    get_comments,
+    get_summary,
+    get_tokens,
+    parse_docstring,
+    summarize,
+)
 
 
 class SomeTest(unittest.TestCase):
@@ -100,3 +113,144 @@ def test_get_comments(lines, expected_comments, tmp_path):
 
     # Assert
     assert comments == expected_comments
+
+
+def test_analyze_is_cached(tmp_path):
+    """Repeated analyses of an unchanged file share one parse."""
+    file_path = tmp_path / "program.py"
+    file_path.write_text('"""Doc."""\npass\n')
+
+    analysis = analyze(file_path)
+    assert analyze(str(file_path)) is analysis
+    assert analysis.tree is analyze(file_path).tree
+    assert analysis.docstring == "Doc."
+
+
+def test_analyze_detects_changes(tmp_path):
+    """A modified file is analyzed again."""
+    file_path = tmp_path / "program.py"
+    file_path.write_text('"""Old."""\n')
+    assert analyze(file_path).docstring == "Old."
+
+    file_path.write_text('"""New doc."""\n')
+    os.utime(file_path, ns=(0, 0))
+    assert analyze(file_path).docstring == "New doc."
+
+
+def test_analyze_caches_errors(tmp_path):
+    """Parsing errors are raised on every use."""
+    file_path = tmp_path / "program.py"
+    file_path.write_text("def (:\n")
+
+    for _ in range(2):
+        with pytest.raises(SyntaxError):
+            analyze(file_path).tree
+
+
+def test_syntax_error_hides_path(tmp_path):
+    """Syntax errors don't show the grading server's path to students."""
+    file_path = tmp_path / "program.py"
+    file_path.write_text("print(\n")
+
+    error = analyze(file_path).syntax_error
+    assert str(error) == "'(' was never closed (<unknown>, line 1)"
+
+
+def test_parse_docstring():
+    """Docstring fields are split into their parts."""
+    author, assignment, date, description, contributors, integrity = parse_docstring(
+        "Author: A B, ab@purdue.edu\nAssignment: 01.1 - Hi\nDate: 01/01/22\n"
+        "\nDescription:\n    Says hi.\n\nContributors:\n    None\n"
+    )
+    assert author == "A B, ab@purdue.edu"
+    assert assignment == "01.1 - Hi"
+    assert date == "01/01/22"
+    assert description == ["Says hi.", ""]
+    assert contributors == ["None", ""]
+    assert integrity == []
+
+
+summary_program = '''\
+# Header comment
+"""A program."""
+
+import math
+from os import path
+from . import sibling
+
+
+class Point:
+    def distance(self, other):
+        # Body comment
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+
+def main(n):
+    for i in range(n):
+        while i > 0 and n > 0:
+            i -= 1
+    if n:
+        print([x for x in range(n) if x % 2])
+
+    def helper():
+        try:
+            pass
+        except ValueError:
+            pass
+'''
+
+
+def test_summarize(tmp_path):
+    """One pass computes all of the static metrics."""
+    file_path = tmp_path / "program.py"
+    file_path.write_text(summary_program)
+
+    summary = get_summary(SomeTest(), file_path)
+
+    assert summary.n_tokens == len(get_tokens(SomeTest(), file_path))
+    assert summary.header_comments == ("# Header comment",)
+    assert summary.body_comments == ("# Body comment",)
+    assert summary.comment_lines == (1, 11)
+    assert summary.max_loop_depth == 2
+    assert summary.functions == ("Point.distance", "main", "main.helper")
+    assert summary.classes == ("Point",)
+    assert summary.imports == ("math", "os", ".")
+    assert dict(summary.complexity) == {
+        "<module>": 1,
+        "Point.distance": 1,
+        "main": 7,  # for, while, and, if, comprehension for and if
+        "main.helper": 2,
+    }
+
+
+def test_summary_matches_loop_depth_tracker(tmp_path):
+    """The loop depth matches LoopDepthTracker."""
+    source = "for i in x:\n    for j in y:\n        while False:\n            pass\n"
+    tree = ast.parse(source)
+    tracker = LoopDepthTracker()
+    tracker.visit(tree)
+    tokens = list(tokenize.generate_tokens(io.StringIO(source).readline))
+
+    assert summarize(tokens, tree).max_loop_depth == tracker.max_depth == 3
+
+
+def test_summary_is_immutable(tmp_path):
+    """Summaries are shared, so they can't be modified."""
+    file_path = tmp_path / "program.py"
+    file_path.write_text(summary_program)
+    summary = get_summary(SomeTest(), file_path)
+
+    with pytest.raises(attrs.exceptions.FrozenInstanceError):
+        summary.n_tokens = 0
+    with pytest.raises(TypeError):
+        summary.complexity["main"] = 1
+
+
+def test_summary_without_syntax_tree(tmp_path):
+    """Programs with syntax errors still get token metrics."""
+    file_path = tmp_path / "program.py"
+    file_path.write_text("print(1 +)  # comment\n")
+
+    summary = get_summary(SomeTest(), file_path)
+    assert summary.body_comments == ("# comment",)
+    assert summary.max_loop_depth is None
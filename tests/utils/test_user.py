@@ -9,11 +9,20 @@ from generic_grader.utils.exceptions import (
     ExitError,
     ExtraEntriesError,
     LogLimitExceededError,
+    OutputDivergenceError,
     QuitError,
     UserInitializationError,
+    UserTimeoutError,
 )
 from generic_grader.utils.options import Options
-from generic_grader.utils.user import RefUser, SubUser, __User__
+from generic_grader.utils.user import (
+    MAX_LOG_LINE_CHARS,
+    RefUser,
+    SubUser,
+    __User__,
+    clip_line,
+    log_window,
+)
 
 user_log_cases = [
     {"log": "a" * 10, "limit": 10, "result": None},
@@ -36,6 +45,40 @@ def test_user_log(case):
         assert log.getvalue() == case["log"]
 
 
+log_divergence_cases = [
+    {"writes": ["a\n", "b\n"], "line_n": None},
+    {"writes": ["a", "\nb", "\n"], "line_n": None},
+    {"writes": ["a\nb"], "line_n": None},  # The last line is incomplete.
+    {"writes": ["a\nc\n"], "line_n": 2},
+    {"writes": ["a\n", "b", "x\n"], "line_n": 2},
+    {"writes": ["a\nb\n", "c\n"], "line_n": 3},
+    {"writes": ["x\n"], "line_n": 1},
+    # Partial lines are compared as they are written.
+    {"writes": ["a\nb", "x"], "line_n": 2},
+    {"writes": ["x"], "line_n": 1},
+    {"writes": ["a\nb\n", "c"], "line_n": 3},
+]
+
+
+@pytest.mark.parametrize("case", log_divergence_cases)
+def test_user_log_divergence(case):
+    """Test that the log stops at the first line that differs from the
+    expected output.
+    """
+    log = __User__.LogIO()
+    log.expect("a\nb\n")
+    if case["line_n"] is None:
+        for s in case["writes"]:
+            log.write(s)
+        assert log.getvalue() == "".join(case["writes"])
+    else:
+        with pytest.raises(
+            OutputDivergenceError, match=rf"at line\s+{case['line_n']},"
+        ):
+            for s in case["writes"]:
+                log.write(s)
+
+
 class FakeTest(unittest.TestCase):
     """Fake test class for testing User class."""
 
@@ -517,6 +560,56 @@ def test_full_user_log(fix_syspath):
     assert user.format_log() == expected_log
 
 
+@pytest.mark.parametrize(
+    "n_lines, focus, expected",
+    [
+        (10, None, [(0, 10)]),
+        (100, None, [(0, 5), (85, 100)]),
+        (100, 50, [(0, 5), (42, 57)]),
+        (100, 1, [(0, 20)]),
+        (100, 10, [(0, 20)]),
+        (100, 99, [(0, 5), (85, 100)]),
+        (100, 500, [(0, 5), (85, 100)]),
+    ],
+)
+def test_log_window(n_lines, focus, expected):
+    """Test that long logs show their head and a window around the focus."""
+    assert log_window(n_lines, focus, budget=20) == expected
+
+
+def test_clip_line():
+    """Test that long lines are clipped, keeping their newline."""
+    assert clip_line("short\n") == "short\n"
+    line = "a" * (MAX_LOG_LINE_CHARS + 5)
+    assert clip_line(line + "\n") == (
+        "a" * MAX_LOG_LINE_CHARS + " ... (5 characters omitted)\n"
+    )
+    assert clip_line(line) == "a" * MAX_LOG_LINE_CHARS + " ... (5 characters omitted)"
+
+
+def test_format_long_log(fix_syspath):
+    """Test that a long log is shortened around the focus line."""
+    test = FakeTest()
+    fake_file = fix_syspath / "submission.py"
+    fake_file.write_text(
+        "def main():\n    for i in range(1, 1001):\n        print(f'line {i}')\n"
+    )
+    user = SubUser(test, Options(sub_module="submission", start=2, n_lines=1))
+    user.call_obj()
+
+    log = user.format_log(500)
+    assert len(log.splitlines()) == 4 + 60 + 2
+    assert "  15 |line 15\n     |... (462 lines omitted) ...\n 478 |line 478\n" in log
+    assert " 500 |line 500\n" in log
+    assert log.endswith(" 522 |line 522\n     |... (478 lines omitted) ...\n")
+
+    # Without a focus, the end of the log is shown.
+    assert user.format_log().endswith("1000 |line 1000\n")
+
+    # The user's options are restored.
+    assert user.options.start == 2 and user.options.n_lines == 1
+
+
 def test_end_of_input_error_message_formatting(fix_syspath):
     """Test that EndOfInputError message is not double-formatted.
 
@@ -549,3 +642,32 @@ def test_end_of_input_error_message_formatting(fix_syspath):
     # The traceback header must be on its own line, not run together with the
     # preceding text (the original bug: newlines were stripped by re-formatting).
     assert "Traceback (most recent call last):\n" in error_str
+
+
+def test_time_budget_across_calls(fix_syspath):
+    """A user's calls share one time budget."""
+    fix_syspath.joinpath("sleepy.py").write_text(
+        "import time\n\ndef main():\n    time.sleep(0.15)"
+    )
+    user = SubUser(FakeTest(), Options(sub_module="sleepy", time_budget=0.4))
+    user.call_obj()
+    user.call_obj()
+    with pytest.raises(UserTimeoutError, match="total time limit"):
+        user.call_obj()
+
+
+def test_memory_error_reports_call(fix_syspath):
+    """A call that runs out of memory is reported."""
+    fix_syspath.joinpath("hog.py").write_text(
+        "def main(n):\n    return ' ' * int(n * 2**30)\n"
+    )
+    user = SubUser(
+        unittest.TestCase(),
+        Options(sub_module="hog", args=(2,), memory_limit_GB=1.0),
+    )
+    with pytest.raises(MemoryError) as exc_info:
+        user.call_obj()
+
+    message = str(exc_info.value)
+    assert "when called as `main(2)`" in message
+    assert "maximum allowed memory of 1.0 GiB" in message